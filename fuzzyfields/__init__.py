@@ -10,12 +10,14 @@ except ImportError:  # pragma: no cover
 
 from .fuzzyfield import FuzzyField  # noqa: F401
 from .dictreader import DictReader  # noqa: F401
+from .errorreport import ErrorReport  # noqa: F401
 from .errors import (ValidationError, MalformedFieldError,  # noqa: F401
                      FieldTypeError, DuplicateError, DomainError,  # noqa: F401
-                     MissingFieldError)  # noqa: F401
+                     MissingFieldError, ErrorBudgetError)  # noqa: F401
 
 from .boolean import Boolean  # noqa: F401
 from .datetime import Timestamp  # noqa: F401
 from .domain import Domain  # noqa: F401
 from .numbers import Float, Decimal, Integer, Percentage  # noqa: F401
 from .strings import String, RegEx, ISOCodeAlpha  # noqa: F401
+from .uniqueness import FingerprintSet, SpillingSet  # noqa: F401
@@ -1,6 +1,10 @@
+import re
+from typing import Any, Callable, Tuple
+from .buffers import BoolBuffer, ObjectBuffer
 from .fuzzyfield import FuzzyField
 from .numbers import Integer
-from .errors import FieldTypeError, MalformedFieldError
+from .errors import FieldTypeError, MalformedFieldError, make_error
+from .tools import map_str
 
 
 _BOOL_MAP = {
@@ -18,6 +22,11 @@ _num_parser = Integer()
 """Preprocessor for string representations of 0 or 1
 """
 
+_maybe_number = re.compile(r'[\dN]').search
+"""Find upper case strings that :func:`decimal.Decimal` may parse; anything
+without digits can only be inf or nan.
+"""
+
 
 class Boolean(FuzzyField):
     """A boolean, any string representation of false/true or no/yes, or 0/1.
@@ -35,33 +44,85 @@ class Boolean(FuzzyField):
         :raise Exception:
             see :meth:`String.validate()`
         """
-        orig_value = value
+        ok, res = self._try_validate_func(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Non-raising implementation of :meth:`Boolean.validate`.
+        See :meth:`FuzzyField._compile_try_validate`.
+        """
+        bool_map = _BOOL_MAP
+        num_parser = _num_parser._try_validate_func
+        missing = object()
+
+        def try_validate(value):
+            orig_value = value
+            if isinstance(value, str):
+                value = value.upper()
+
+            try:
+                res = bool_map.get(value, missing)
+            except TypeError:
+                # Unhashable type
+                return False, (FieldTypeError, orig_value, 'boolean')
+            if res is not missing:
+                return True, res
+
+            # Process string representation of 0/1 e.g. "1", "+1.000"
+            # and any other weird use case. Don't waste time parsing strings
+            # that can't be numbers.
+            if not isinstance(value, str) or _maybe_number(value):
+                ok, num = num_parser(value)
+                if ok:
+                    if num in {0, 1}:
+                        return True, bool(num)
+                    value = num
+
+            # Not in _BOOL_MAP and not a string representation of 0/1
+            if isinstance(value, (int, str)):
+                return False, (MalformedFieldError, orig_value, 'boolean')
+            return False, (FieldTypeError, orig_value, 'boolean')
+
+        return try_validate
+
+    def _validate_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Boolean.validate`.
+        See :meth:`FuzzyField._validate_many`.
+        """
+        import numpy
+        import pandas
 
-        if isinstance(value, str):
-            value = value.upper()
+        kind = values.dtype.kind
+        if kind == 'b':
+            return values, numpy.ones(values.shape, dtype=bool)
+        if kind in 'iuf':
+            return values == 1, (values == 0) | (values == 1)
 
+        index = pandas.Index(list(_BOOL_MAP), dtype=object)
         try:
-            return _BOOL_MAP[value]
-        except KeyError:
-            # Deal with weird string representations of 1/0, e.g. "+1.0"
-            pass
+            pos = index.get_indexer(map_str(str.upper, values))
         except TypeError:
-            # Unhashable type
-            raise FieldTypeError(self.name, orig_value, 'boolean')
+            # Unhashable
+            return (numpy.empty(values.shape, dtype=bool),
+                    numpy.zeros(values.shape, dtype=bool))
+        res = numpy.array(list(_BOOL_MAP.values()), dtype=bool)[pos]
+        ok = pos != -1
 
         # Process string representation of 0/1 e.g. "1", "+1.000"
-        # and any other weird use case
-        try:
-            value = _num_parser.validate(value)
-            if value in {0, 1}:
-                return bool(value)
-        except (MalformedFieldError, FieldTypeError):
-            pass
-
-        # Not in _BOOL_MAP and not a string representation of 0/1
-        if isinstance(value, (int, str)):
-            raise MalformedFieldError(self.name, orig_value, 'boolean')
-        raise FieldTypeError(self.name, orig_value, 'boolean')
+        if not ok.all():
+            retry = numpy.flatnonzero(~ok)
+            num, num_ok = _num_parser._validate_many(values[retry])
+            num_ok &= (num == 0) | (num == 1)
+            retry = retry[num_ok]
+            res[retry] = num[num_ok] == 1
+            ok[retry] = True
+
+        return res, ok
+
+    def _new_buffer(self) -> ObjectBuffer:
+        return BoolBuffer()
 
     @property
     def sphinxdoc(self) -> str:
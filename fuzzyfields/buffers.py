@@ -0,0 +1,286 @@
+"""Typed column buffers for :meth:`DictReader.to_arrays` and
+:meth:`DictReader.to_dataframe`.
+
+Each buffer accumulates the values of a column into a
+:class:`numpy.ndarray` of the most specific dtype that can hold them.
+Values are first appended to a short Python list, which the caller
+periodically moves into the array with :meth:`ObjectBuffer.flush`. The array
+grows geometrically. When a value doesn't fit the dtype, e.g. an integer
+overflows int64 or an optional Integer field defaults to None, the buffer
+is promoted to a more generic one, in the same way :class:`pandas.DataFrame`
+would choose the dtype of a list of values.
+"""
+import datetime
+import math
+from typing import Any, List
+
+
+#: Bounds of datetime64[ns]
+_DATETIME64_NS_MIN = datetime.datetime(1677, 9, 21, 0, 12, 44)
+_DATETIME64_NS_MAX = datetime.datetime(2262, 4, 11, 23, 47, 16)
+
+
+class ObjectBuffer:
+    """Buffer for a column of arbitrary Python objects, and base class of all
+    typed buffers.
+
+    :param data:
+        initial content of the buffer, already converted to the buffer dtype
+    """
+    dtype: Any = object
+
+    def __init__(self, data: Any = None):
+        import numpy
+
+        if data is None:
+            data = numpy.empty(0, dtype=self.dtype)
+        #: Array holding the flushed values, followed by unused capacity
+        self.data = data
+        #: Number of flushed values
+        self.size = len(data)
+        #: Values appended since the last :meth:`flush`
+        self.chunk: List[Any] = []
+        #: Bound :meth:`list.append` of the chunk
+        self.append = self.chunk.append
+
+    def flush(self) -> 'ObjectBuffer':
+        """Move the appended values into the array.
+
+        :returns:
+            self, or a new buffer with a more generic dtype if the values
+            don't fit this one. In the latter case, the caller must replace
+            all its references to this buffer and to its append method.
+        """
+        if not self.chunk:
+            return self
+        try:
+            values = self._convert(self.chunk)
+        except (TypeError, ValueError, OverflowError) as exc:
+            new = self._promote(exc)
+            new.chunk += self.chunk
+            return new.flush()
+
+        new_size = self.size + len(values)
+        if new_size > len(self.data):
+            import numpy
+
+            # Grow geometrically
+            data = numpy.empty(max(new_size, len(self.data) * 2),
+                               dtype=self.data.dtype)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.data[self.size:new_size] = values
+        self.size = new_size
+        self.chunk.clear()
+        return self
+
+    def _convert(self, values: List[Any]) -> Any:
+        """Convert a list of values to a :class:`numpy.ndarray` of the dtype
+        of the buffer.
+
+        :raises TypeError, ValueError, OverflowError:
+            if the values don't fit the dtype
+        """
+        import numpy
+
+        # Unlike numpy.array, don't create 2-dimensional arrays out of lists
+        return numpy.fromiter(values, dtype=object, count=len(values))
+
+    def _promote(self, exc: Exception) -> 'ObjectBuffer':
+        """Return a buffer with a more generic dtype, holding the values
+        flushed so far.
+
+        :param exc:
+            exception raised by :meth:`_convert`
+        """
+        raise NotImplementedError()  # pragma: nocover
+
+    def _flushed_as_object(self) -> Any:
+        """Return the flushed values as an array of Python objects
+        """
+        return self.data[:self.size].astype(object)
+
+    def to_numpy(self) -> Any:
+        """Flush the buffer and return its content as a
+        :class:`numpy.ndarray`. The unused capacity is released.
+        The buffer must not be used afterwards.
+        """
+        buf = self.flush()
+        if len(buf.data) > buf.size:
+            buf.data.resize(buf.size, refcheck=False)
+        return buf.data
+
+    def to_pandas(self) -> Any:
+        """Flush the buffer and return its content as the column of a
+        :class:`pandas.DataFrame`.
+        The buffer must not be used afterwards.
+        """
+        return self.to_numpy()
+
+
+class FloatBuffer(ObjectBuffer):
+    """Buffer for a column of floats. None is stored as NaN.
+    """
+    dtype = 'float64'
+
+    def _convert(self, values: List[Any]) -> Any:
+        import numpy
+
+        if not all(type(v) is float for v in values):
+            values = [
+                math.nan if v is None else _check_type(v, (float, int))
+                for v in values
+            ]
+        return numpy.array(values, dtype=self.dtype)
+
+    def _promote(self, exc: Exception) -> ObjectBuffer:
+        return ObjectBuffer(self._flushed_as_object())
+
+
+class IntBuffer(ObjectBuffer):
+    """Buffer for a column of integers. Integers that overflow int64 promote
+    it to :class:`ObjectBuffer`; None promotes it to :class:`FloatBuffer`.
+    """
+    dtype = 'int64'
+
+    def _convert(self, values: List[Any]) -> Any:
+        import numpy
+
+        if not all(type(v) is int for v in values):
+            for v in values:
+                _check_type(v, int)
+        return numpy.array(values, dtype=self.dtype)
+
+    def _promote(self, exc: Exception) -> ObjectBuffer:
+        if isinstance(exc, OverflowError):
+            return ObjectBuffer(self._flushed_as_object())
+        return FloatBuffer(self.data[:self.size].astype('float64'))
+
+
+class BoolBuffer(ObjectBuffer):
+    """Buffer for a column of bools. Any other value, including None,
+    promotes it to :class:`ObjectBuffer`.
+    """
+    dtype = bool
+
+    def _convert(self, values: List[Any]) -> Any:
+        import numpy
+
+        for v in values:
+            if type(v) is not bool:
+                raise TypeError(v)
+        return numpy.array(values, dtype=self.dtype)
+
+    def _promote(self, exc: Exception) -> ObjectBuffer:
+        return ObjectBuffer(self._flushed_as_object())
+
+
+class DatetimeBuffer(ObjectBuffer):
+    """Buffer for a column of :class:`datetime.datetime`,
+    :class:`pandas.Timestamp`, or :class:`numpy.datetime64`. None is stored as
+    NaT. Timezone-aware and out of bounds datetimes promote it to
+    :class:`ObjectBuffer`.
+    """
+    dtype = 'datetime64[ns]'
+
+    def _convert(self, values: List[Any]) -> Any:
+        import numpy
+
+        out = []
+        for v in values:
+            if v is None:
+                out.append(None)
+            elif isinstance(v, numpy.datetime64):
+                if v.dtype != 'datetime64[ns]' and not numpy.isnat(v):
+                    # numpy would silently overflow
+                    _check_bounds(v.astype('datetime64[us]').item())
+                out.append(v)
+            elif not isinstance(v, datetime.datetime) or v.tzinfo:
+                raise TypeError(v)
+            elif hasattr(v, 'to_datetime64'):
+                # pandas.Timestamp; preserve nanoseconds
+                out.append(v.to_datetime64())
+            else:
+                out.append(numpy.datetime64(_check_bounds(v), 'us'))
+        return numpy.array(out, dtype=self.dtype)
+
+    def _flushed_as_object(self) -> Any:
+        # astype(object) would return integers
+        import numpy
+
+        data = self.data[:self.size]
+        out = numpy.empty(self.size, dtype=object)
+        out[:] = data.astype('datetime64[us]').astype(object)
+        out[numpy.isnat(data)] = None
+        return out
+
+    def _promote(self, exc: Exception) -> ObjectBuffer:
+        return ObjectBuffer(self._flushed_as_object())
+
+
+class CategoricalBuffer(ObjectBuffer):
+    """Buffer for a column with few distinct values, stored as int32 codes
+    into a list of categories. None is stored as -1.
+    :meth:`to_pandas` returns a :class:`pandas.Categorical`.
+    Unhashable values promote it to :class:`ObjectBuffer`.
+    """
+    dtype = 'int32'
+
+    def __init__(self, data: Any = None):
+        super().__init__(data)
+        #: ``{value: code}``
+        self.categories = {}
+
+    def _convert(self, values: List[Any]) -> Any:
+        import numpy
+
+        categories = self.categories
+        codes = [
+            -1 if v is None else categories.setdefault(v, len(categories))
+            for v in values
+        ]
+        return numpy.array(codes, dtype=self.dtype)
+
+    def _flushed_as_object(self) -> Any:
+        import numpy
+
+        categories = numpy.empty(len(self.categories) + 1, dtype=object)
+        categories[:-1] = list(self.categories)
+        # code -1 -> None
+        return categories[self.data[:self.size]]
+
+    def _promote(self, exc: Exception) -> ObjectBuffer:
+        return ObjectBuffer(self._flushed_as_object())
+
+    def to_numpy(self) -> Any:
+        buf = self.flush()
+        if buf is not self:
+            return buf.to_numpy()
+        return self._flushed_as_object()
+
+    def to_pandas(self) -> Any:
+        import pandas
+
+        buf = self.flush()
+        if buf is not self:
+            return buf.to_pandas()
+        return pandas.Categorical.from_codes(
+            self.data[:self.size], categories=list(self.categories))
+
+
+def _check_bounds(value: datetime.datetime) -> datetime.datetime:
+    """Return value if it can be represented as datetime64[ns], or raise
+    OverflowError
+    """
+    if _DATETIME64_NS_MIN <= value <= _DATETIME64_NS_MAX:
+        return value
+    raise OverflowError(value)
+
+
+def _check_type(value: Any, types: Any) -> Any:
+    """Return value if it is an instance of types (bool excluded), or raise
+    TypeError
+    """
+    if isinstance(value, types) and not isinstance(value, bool):
+        return value
+    raise TypeError(value)
@@ -1,16 +1,128 @@
 import datetime
+import functools
+import re
 import warnings
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional, Pattern, Tuple, Union
+from .buffers import DatetimeBuffer, ObjectBuffer
 from .fuzzyfield import FuzzyField
 from .errors import FieldTypeError, MalformedFieldError
+from .tools import map_str
+
+
+_OUTOFBOUNDS_RE = re.compile(
+    r'(?<!\d)(\d{1,4})(-\d\d-\d\d \d\d:\d\d:\d\d)')
+"""Timestamp within the message of :class:`pandas.errors.OutOfBoundsDatetime`.
+pandas doesn't pad years below 1000, e.g. ``1-01-01 00:00:00``.
+"""
+
+_ISO_FORMATS = {
+    '%Y-%m-%d': re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})'),
+    '%Y-%m-%d %H:%M:%S': re.compile(
+        r'([0-9]{4})-([0-9]{2})-([0-9]{2}) '
+        r'([0-9]{2}):([0-9]{2}):([0-9]{2})'),
+}
+"""Fast path of :func:`_strptime` for the most common formats
+"""
+
+_INFER_FORMAT_ATTEMPTS = 10
+"""Number of successfully parsed strings after which :class:`Timestamp` gives
+up trying to pin their format
+"""
+
+_INFER_FORMAT_PROBES = [
+    # Ambiguous day and month
+    datetime.datetime(2001, 2, 3, 4, 5, 6, 70000),
+    # Unambiguous day and month; dateutil and strptime disagree on the
+    # century of 2-digit years
+    datetime.datetime(1975, 11, 23, 13, 14, 15, 160000),
+    datetime.datetime(2040, 12, 13, 16, 17, 18, 190000),
+]
+"""Timestamps that a guessed format must correctly round-trip through
+:func:`pandas.to_datetime` before it is pinned
+"""
+
+_STDLIB_DMY_RE = re.compile(
+    r'([0-9]{1,2})([/.-])([0-9]{1,2})\2([0-9]{4}|[0-9]{2})'
+    r'(?:[ T]([0-9]{1,2}):([0-9]{2})(?::([0-9]{2}))?)?')
+"""DD/MM/YYYY or MM/DD/YYYY, with any of / . - as separators,
+2 or 4 digit year, and optional hh:mm[:ss]
+"""
+
+_STDLIB_YMD_RE = re.compile(
+    r'([0-9]{4})([/.]?)([0-9]{1,2})\2([0-9]{1,2})'
+    r'(?:[ T]([0-9]{1,2}):([0-9]{2})(?::([0-9]{2}))?)?')
+"""YYYYMMDD, YYYY/MM/DD or YYYY.MM.DD, with optional hh:mm[:ss]
+"""
+
+_STDLIB_EXCEL_RE = re.compile(r'[0-9]{5}(?:\.[0-9]*)?')
+"""Excel serial date as a string, between 1927-05-18 and 2173-10-13
+"""
+
+_STDLIB_MONTH_NAME_FORMATS = [
+    fmt.replace('%B', month)
+    for fmt in ['%d %B %Y', '%B %d %Y', '%Y %B %d', '%Y %d %B', '%B %Y %d',
+                '%d %Y %B']
+    for month in ('%B', '%b')
+]
+"""Formats with month names, in all orders of day, month and year, after
+removing commas and ordinal suffixes
+"""
+
+_ORDINAL_RE = re.compile(r'([0-9])(?:st|nd|rd|th)\b', re.IGNORECASE)
+
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+"""Day 0 of Excel serial dates, accounting for the 1900 leap year bug
+"""
 
 
 class Timestamp(FuzzyField):
     """Parse and check various date and time formats
 
     .. note::
-       This field requires `pandas <https://pandas.pydata.org>`_.
+       The default backend requires `pandas <https://pandas.pydata.org>`_.
+
+    :param str backend:
+        Parsing engine. Possible values are:
 
+        'pandas'
+            Use :func:`pandas.to_datetime`, which recognizes almost any
+            date/time representation. This is the default; if pandas is not
+            installed, it raises ImportError.
+        'stdlib'
+            Use only the Python standard library. It is much faster to
+            import and lighter on memory, and it recognizes:
+
+            - ISO 8601 strings, as parsed by
+              :meth:`datetime.datetime.fromisoformat`
+            - DD/MM/YYYY and MM/DD/YYYY, with / . or - separators, 2 or 4
+              digit years (interpreted like :meth:`~datetime.datetime.strptime`
+              does), and optional hh:mm[:ss]
+            - YYYYMMDD, YYYY/MM/DD and YYYY.MM.DD
+            - day, full or abbreviated month name, and 4-digit year, in any
+              order, e.g. 11th March 2016, March 11, 2016 or 2016 Mar 11
+            - Excel serial dates: int, float, and strings of 5 digits with
+              optional decimals
+            - :class:`datetime.date`, :class:`datetime.datetime`, and
+              subclasses of the latter, e.g. :class:`pandas.Timestamp`
+
+            Only the 'datetime' and format string outputs are supported,
+            :meth:`~FuzzyField.parse_many` is not vectorized, and dayfirst is
+            the only accepted keyword argument.
+
+    :param str format:
+        Optional :meth:`~datetime.datetime.strptime` format string. If set,
+        strings that don't match it exactly are rejected; numbers may only
+        omit their leading zeros when they are delimited by separators, e.g.
+        '5/1/2012' matches '%d/%m/%Y' but '2012015' doesn't match '%Y%m%d'.
+        Other input types,
+        e.g. :class:`datetime.date`, are accepted as usual.
+    :param bool infer_format:
+        If True (default) and format is not set, guess the format of the first
+        strings that are successfully parsed by :func:`pandas.to_datetime`
+        and, if the guess is unambiguous, pin it and parse all following
+        strings with the much faster :meth:`~datetime.datetime.strptime`,
+        falling back to :func:`pandas.to_datetime` for the strings that don't
+        match it. Set to False to always use :func:`pandas.to_datetime`.
     :param str output:
         Format of the output value. Possible values are:
 
@@ -29,8 +141,12 @@ class Timestamp(FuzzyField):
             return type is `numpy.datetime64`
         any other string
             anything else will be interpreted as a format string for
-            :meth:`pandas.Timestamp.strftime`;
+            :meth:`pandas.Timestamp.strftime`, or
+            :meth:`datetime.datetime.strftime` with backend='stdlib';
             e.g. ``%Y/%m/%d`` will produce a string YYYY/MM/DD.
+
+        The default is 'pandas' with backend='pandas' and 'datetime' with
+        backend='stdlib'.
     :param bool required:
         See :class:`FuzzyField`
     :param default:
@@ -39,6 +155,10 @@ class Timestamp(FuzzyField):
         See :class:`FuzzyField`
     :param bool unique:
         See :class:`FuzzyField`
+    :param unique_store:
+        See :class:`FuzzyField`
+    :param int cache:
+        See :class:`FuzzyField`
     :param kwargs:
         Parameters to be passed to :func:`pandas.to_datetime`.
 
@@ -48,20 +168,59 @@ class Timestamp(FuzzyField):
            whereas the default for :func:`pandas.to_datetime` is dayfirst=False
            (American format MM/DD/YYYY).
     """
+    backend: str
     output: str
+    format: Optional[str]
+    infer_format: bool
     pandas_kwargs: Dict[str, Any]
 
-    def __init__(self, *, output: str = 'pandas', required: bool = True,
-                 default=None, description: str = None, unique: bool = False,
-                 **kwargs):
-        import pandas  # noqa: F401
+    _runtime_attributes = FuzzyField._runtime_attributes | {
+        '_pinned_format', '_infer_attempts'}
+
+    def __init__(self, *, backend: str = None, output: str = None,
+                 format: str = None, infer_format: bool = True,
+                 required: bool = True, default=None,
+                 description: str = None, unique: bool = False,
+                 unique_store: Union[str, Callable[[], Any]] = 'set',
+                 cache: int = 0, **kwargs):
+        if backend is None:
+            backend = 'pandas'
+        if backend == 'pandas':
+            try:
+                import pandas  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "Timestamp requires pandas; install it or use "
+                    "backend='stdlib'") from e
+        elif backend != 'stdlib':
+            raise ValueError("backend: expected 'pandas' or 'stdlib'; "
+                             "got %s" % backend)
+        if output is None:
+            output = 'pandas' if backend == 'pandas' else 'datetime'
 
         super().__init__(required=required, default=default,
-                         description=description, unique=unique)
+                         description=description, unique=unique,
+                         unique_store=unique_store, cache=cache)
         if '%' not in output and output not in ('pandas', 'datetime', 'numpy'):
             raise ValueError("output: expected 'pandas', 'datetime', 'numpy', "
                              "or format string; got %s" % output)
+        if backend == 'stdlib':
+            if output in ('pandas', 'numpy'):
+                raise ValueError(f"output='{output}' requires "
+                                 "backend='pandas'")
+            if kwargs.keys() - {'dayfirst'}:
+                raise ValueError("backend='stdlib' does not accept "
+                                 "parameters for pandas.to_datetime: "
+                                 + ", ".join(sorted(kwargs)))
+            # The vectorized kernel is pandas-based
+            self._vectorized = False
+            infer_format = False
+        self.backend = backend
         self.output = output
+        self.format = format
+        self.infer_format = infer_format and format is None
+        self._pinned_format = None
+        self._infer_attempts = 0
         kwargs.setdefault('dayfirst', True)
         self.pandas_kwargs = kwargs
 
@@ -73,15 +232,37 @@ class Timestamp(FuzzyField):
         :return:
             parsed date, depending on the 'output' parameter
         """
+        if self.backend == 'stdlib':
+            return self._validate_stdlib(value)
+
         import pandas
 
+        if isinstance(value, str):
+            if self.format is not None:
+                try:
+                    dt = _strptime(value, self.format)
+                except ValueError:
+                    raise MalformedFieldError(self.name, value, "date")
+                return self._from_datetime(dt)
+
+            if self._pinned_format is not None:
+                try:
+                    dt = _strptime(value, self._pinned_format)
+                except ValueError:
+                    pass
+                else:
+                    return self._from_datetime(dt)
+
         try:
-            value = pandas.to_datetime(value, **self.pandas_kwargs)
+            parsed = pandas.to_datetime(value, **self.pandas_kwargs)
         except pandas.errors.OutOfBoundsDatetime as e:
             # The timestamp has been parsed and is stored in the exception
             # message; it just can't be coerced into a pandas.Timestamp
-            value = ' '.join(str(e).split()[-2:])
-            return self._parse_outofbounds(value)
+            match = _OUTOFBOUNDS_RE.search(str(e))
+            if not match:
+                raise MalformedFieldError(self.name, value, "date")
+            year, rest = match.groups()
+            return self._parse_outofbounds(year.zfill(4) + rest)
         # OutOfBoundsDateTime is a subclass of ValueError so it must appear
         # higher in the list
         except ValueError:
@@ -89,6 +270,53 @@ class Timestamp(FuzzyField):
         except TypeError:
             raise FieldTypeError(self.name, value, "date")
 
+        if (self.infer_format and self._pinned_format is None
+                and isinstance(value, str)
+                and self._infer_attempts < _INFER_FORMAT_ATTEMPTS):
+            self._infer_attempts += 1
+            self._pinned_format = self._guess_format(value, parsed)
+
+        return self._convert(parsed)
+
+    def _validate_stdlib(self, value: Any) -> Any:
+        """Implementation of :meth:`Timestamp.validate` for backend='stdlib'
+        """
+        if isinstance(value, str):
+            if self.format is not None:
+                try:
+                    dt = _strptime(value, self.format)
+                except ValueError:
+                    raise MalformedFieldError(self.name, value, "date")
+            else:
+                dt = _parse_stdlib(value, self.pandas_kwargs['dayfirst'])
+                if dt is None:
+                    raise MalformedFieldError(self.name, value, "date")
+        elif isinstance(value, datetime.datetime):
+            # Convert subclasses, e.g. pandas.Timestamp
+            dt = datetime.datetime.combine(value.date(), value.timetz())
+        elif isinstance(value, datetime.date):
+            dt = datetime.datetime(value.year, value.month, value.day)
+        elif (isinstance(value, (int, float))
+                and not isinstance(value, bool)):
+            try:
+                dt = _EXCEL_EPOCH + datetime.timedelta(days=value)
+            except OverflowError:
+                raise MalformedFieldError(self.name, value, "date")
+        elif getattr(getattr(value, 'dtype', None), 'kind', None) == 'M':
+            # numpy.datetime64
+            dt = value.astype('datetime64[us]').item()
+            if not isinstance(dt, datetime.datetime):
+                raise MalformedFieldError(self.name, value, "date")
+        else:
+            raise FieldTypeError(self.name, value, "date")
+
+        if self.output == 'datetime':
+            return dt
+        return dt.strftime(self.output)
+
+    def _convert(self, value: Any) -> Any:
+        """Convert a :class:`pandas.Timestamp` to the output format
+        """
         if self.output == 'pandas':
             return value
         elif self.output == 'numpy':
@@ -98,6 +326,119 @@ class Timestamp(FuzzyField):
         else:
             return value.strftime(self.output)
 
+    def _from_datetime(self, value: datetime.datetime) -> Any:
+        """Convert the output of :meth:`~datetime.datetime.strptime` to the
+        output format
+        """
+        import pandas
+
+        try:
+            ts = pandas.Timestamp(value)
+        except pandas.errors.OutOfBoundsDatetime:
+            return self._parse_outofbounds(
+                value.isoformat(sep=' ', timespec='seconds'))
+        return self._convert(ts)
+
+    def _guess_format(self, value: str, parsed: Any) -> Optional[str]:
+        """Guess the strptime format of a string that was successfully
+        parsed by :func:`pandas.to_datetime`
+
+        :param str value:
+            raw input string
+        :param parsed:
+            output of :func:`pandas.to_datetime` for value
+        :returns:
+            format string, or None if the format can't be guessed or
+            :meth:`~datetime.datetime.strptime` would not interpret
+            other strings with the same format exactly like
+            :func:`pandas.to_datetime` does
+        """
+        try:
+            from pandas.tseries.api import guess_datetime_format
+        except ImportError:
+            try:
+                from pandas._libs.tslibs.parsing import guess_datetime_format
+            except ImportError:
+                return None
+
+        # Some versions of pandas guess %Y-%d-%m for ISO dates when
+        # dayfirst=True, but then parse them as %Y-%m-%d
+        dayfirst = self.pandas_kwargs['dayfirst']
+        for candidate_dayfirst in (dayfirst, not dayfirst):
+            try:
+                fmt = guess_datetime_format(value, dayfirst=candidate_dayfirst)
+                if self._verify_format(value, parsed, fmt):
+                    return fmt
+            except Exception:
+                pass
+        return None
+
+    def _verify_format(self, value: str, parsed: Any, fmt: Optional[str]
+                       ) -> bool:
+        """Test that :meth:`~datetime.datetime.strptime` with the given format
+        interprets value, as well as other strings with the same format,
+        exactly like :func:`pandas.to_datetime` does
+        """
+        import pandas
+
+        if not fmt or '%z' in fmt or '%Z' in fmt:
+            return False
+        if datetime.datetime.strptime(value, fmt) != parsed:
+            return False
+        for probe in _INFER_FORMAT_PROBES:
+            probe_str = probe.strftime(fmt)
+            if (datetime.datetime.strptime(probe_str, fmt)
+                    != pandas.to_datetime(probe_str, **self.pandas_kwargs)):
+                return False
+        return True
+
+    def _validate_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Timestamp.validate`.
+        See :meth:`FuzzyField._validate_many`.
+
+        Malformed and out of bounds dates are left to
+        :meth:`Timestamp.validate`.
+        """
+        import numpy
+        import pandas
+
+        if self.format is not None:
+            # Don't let pandas apply the format to non-strings, and reject
+            # anything that strptime wouldn't accept
+            is_str = numpy.frompyfunc(_is_str, 1, 1)(values).astype(bool)
+            values = map_str(self._strptime_or_none, values)
+            values[~is_str] = None
+
+        try:
+            res = pandas.to_datetime(pandas.Series(values), errors='coerce',
+                                     **self.pandas_kwargs)
+        except (TypeError, ValueError, OverflowError):
+            res = None
+        if res is None or res.dtype != 'datetime64[ns]':
+            # Unhashable objects, timezone-aware timestamps, etc.
+            return (numpy.empty(values.shape, dtype=object),
+                    numpy.zeros(values.shape, dtype=bool))
+
+        ok = res.notna().to_numpy()
+        if self.output == 'pandas':
+            res = res.astype(object).to_numpy()
+        elif self.output == 'numpy':
+            res = res.to_numpy()
+        elif self.output == 'datetime':
+            res = numpy.asarray(res.dt.to_pydatetime(), dtype=object)
+        else:
+            res = res.dt.strftime(self.output).to_numpy(dtype=object)
+        return res, ok
+
+    def _strptime_or_none(self, value: str) -> Optional[datetime.datetime]:
+        """Parse a string with the format parameter, or return None if it
+        doesn't match
+        """
+        try:
+            return _strptime(value, self.format)
+        except ValueError:
+            return None
+
     def _parse_outofbounds(self, value):
         """Deal with dates out of the range supported by pandas.Timestamp
 
@@ -124,12 +465,151 @@ class Timestamp(FuzzyField):
             return pandas.to_datetime(new_value)
         elif self.output == 'numpy':
             return numpy.datetime64(value)
-        elif self.output == 'datetime':
-            return datetime.datetime.strptime(
-                value, '%Y-%m-%d %H:%M:%S')
+        value = datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+        if self.output == 'datetime':
+            return value
         else:
-            return pandas.Period(value).strftime(self.output)
+            return value.strftime(self.output)
+
+    def _new_buffer(self) -> ObjectBuffer:
+        if self.output in ('pandas', 'numpy', 'datetime'):
+            return DatetimeBuffer()
+        # Format string
+        return ObjectBuffer()
 
     @property
     def sphinxdoc(self) -> str:
+        if self.format is not None:
+            return f"Date/time in the format {self.format}"
         return "Any date/time representation"
+
+
+def _strptime(value: str, fmt: str) -> datetime.datetime:
+    """Equivalent to :meth:`datetime.datetime.strptime`, but faster for
+    the most common ISO formats, and strict: numbers can only omit their
+    leading zeros when they are delimited by separators, so that e.g.
+    '2012015' doesn't match '%Y%m%d'.
+
+    :raises ValueError:
+        if the value doesn't match the format
+    """
+    iso = _ISO_FORMATS.get(fmt)
+    if iso is not None:
+        match = iso.fullmatch(value)
+        if match:
+            return datetime.datetime(*map(int, match.groups()))
+
+    strict = _strict_format_re(fmt)
+    if strict is not None and not strict.fullmatch(value):
+        raise ValueError(f"time data {value!r} does not match format {fmt!r}")
+    res = datetime.datetime.strptime(value, fmt)
+    if strict is None and res.strftime(fmt) != value:
+        # Unusual directives; fall back to round-tripping the value
+        raise ValueError(f"time data {value!r} does not match format {fmt!r}")
+    return res
+
+
+_STRICT_DIRECTIVES = {
+    'Y': (4, 4), 'y': (2, 2), 'm': (2, 1), 'd': (2, 1), 'H': (2, 1),
+    'I': (2, 1), 'M': (2, 1), 'S': (2, 1), 'j': (3, 1), 'f': (6, 1),
+}
+"""Numeric strptime directives, as {directive: (maximum number of digits,
+minimum number of digits when followed by a separator)}
+"""
+
+_STRICT_TEXT_DIRECTIVES = {
+    'b': r'[^\W\d_]+', 'B': r'[^\W\d_]+', 'a': r'[^\W\d_]+',
+    'A': r'[^\W\d_]+', 'p': r'[^\W\d_]+', '%': '%',
+    'z': r'Z|[+-]\d\d:?\d\d(?::?\d\d(?:\.\d{1,6})?)?',
+}
+"""Regular expressions of the other strptime directives
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _strict_format_re(fmt: str) -> Optional[Pattern]:
+    """Build the regular expression that a string must fully match, on top
+    of :meth:`datetime.datetime.strptime`, to be parsed by :func:`_strptime`
+
+    :returns:
+        compiled regular expression, or None if the format contains
+        directives other than those in _STRICT_DIRECTIVES and
+        _STRICT_TEXT_DIRECTIVES
+    """
+    tokens = re.split('(%.)', fmt)
+    pattern = ''
+    for i, token in enumerate(tokens):
+        if i % 2 == 0:
+            pattern += re.escape(token)
+            continue
+        directive = token[1]
+        if directive in _STRICT_TEXT_DIRECTIVES:
+            pattern += f'(?:{_STRICT_TEXT_DIRECTIVES[directive]})'
+            continue
+        try:
+            max_digits, min_digits = _STRICT_DIRECTIVES[directive]
+        except KeyError:
+            return None
+        # Allow omitting leading zeros only if the number is delimited on
+        # both sides by separators or by the ends of the string
+        preceding, following = tokens[i - 1], tokens[i + 1]
+        if (preceding[-1:].isdigit() or following[:1].isdigit()
+                or (not preceding and i > 1)
+                or (not following and i + 2 < len(tokens))):
+            min_digits = max_digits
+        pattern += f'[0-9]{{{min_digits},{max_digits}}}'
+    return re.compile(pattern)
+
+
+def _parse_stdlib(value: str, dayfirst: bool
+                  ) -> Optional[datetime.datetime]:
+    """Parse a string for :meth:`Timestamp.validate` with backend='stdlib'
+
+    :returns:
+        parsed value, or None if the string is not recognized
+    """
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (AttributeError, ValueError):
+        # AttributeError: Python 3.6
+        pass
+
+    for regex in (_STDLIB_DMY_RE, _STDLIB_YMD_RE):
+        match = regex.fullmatch(value)
+        if not match:
+            continue
+        groups = match.groups()
+        time = [int(x) for x in groups[4:] if x is not None]
+        if regex is _STDLIB_YMD_RE:
+            candidates = [(groups[0], groups[2], groups[3])]
+        else:
+            year = groups[3]
+            if len(year) == 2:
+                year = datetime.datetime.strptime(year, '%y').year
+            # Like dateutil, swap day and month if the preferred order is
+            # invalid
+            dmy = (year, groups[2], groups[0])
+            mdy = (year, groups[0], groups[2])
+            candidates = [dmy, mdy] if dayfirst else [mdy, dmy]
+        for ymd in candidates:
+            try:
+                return datetime.datetime(*(int(x) for x in ymd), *time)
+            except ValueError:
+                pass
+        return None
+
+    if _STDLIB_EXCEL_RE.fullmatch(value):
+        return _EXCEL_EPOCH + datetime.timedelta(days=float(value))
+
+    value = _ORDINAL_RE.sub(r'\1', value.replace(',', ' '))
+    value = ' '.join(value.split())
+    for fmt in _STDLIB_MONTH_NAME_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
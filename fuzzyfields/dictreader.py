@@ -1,7 +1,16 @@
+import collections
+import inspect
+import keyword
 import logging
-from typing import Any, Dict, Union, Callable, Iterable
+import os
+from typing import (Any, Dict, FrozenSet, Iterator, List, Optional,
+                    Sequence, Tuple, Union, Callable, Iterable)
 from .fuzzyfield import FuzzyField
-from .errors import ValidationError
+from .errorreport import ErrorReport
+from .errors import (DuplicateError, ErrorBudgetError, MissingFieldError,
+                     ValidationError, make_error)
+from .tools import canonical_key
+from .uniqueness import check_store, new_store
 
 
 class DictReader:
@@ -28,6 +37,10 @@ class DictReader:
         'critical', 'error', 'warning', 'info', 'debug'
             log the error with the matching functions in :mod:`logging` and
             continue
+        'collect'
+            store the error in :attr:`~DictReader.error_report` and continue.
+            This is much faster than logging when there are many errors, as
+            the messages are never formatted.
         callable(:class:`~fuzzyfields.ValidationError`)
             invoke a custom callable and continue (unless it itself raises an
             Exception)
@@ -46,6 +59,161 @@ class DictReader:
 
         Alternatively to passing this parameter, you may create a subclass of
         DictReader and override the DictReader.name_map class attribute.
+
+    :param str output:
+        Format of the rows yielded when iterating on the DictReader.
+        One of:
+
+        'dict' (default)
+            dict of ``{field name : parsed value}``
+        'tuple'
+            tuple of parsed values, in the order of the fields
+        'namedtuple'
+            :func:`~collections.namedtuple` whose attributes are the field
+            names
+        'slots'
+            instance of a generated class with ``__slots__``, whose attributes
+            are the field names. This is the most memory-efficient format
+            that allows accessing the values by name. Like tuples, the
+            records compare equal and hash by value.
+
+        Field names are after name mapping. The formats other than 'dict'
+        require the names to be unique, and 'namedtuple' and 'slots' require
+        them to be valid identifiers that don't start with an underscore.
+        :meth:`~DictReader.postprocess_row` always receives a dict, and must
+        return a mapping containing all the field names; the output is
+        converted afterwards.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.output class attribute.
+
+    :param header:
+        Set this parameter to read positional rows, e.g. the lists yielded by
+        :func:`csv.reader` or the tuples yielded by a DB-API cursor, instead
+        of dicts. One of:
+
+        None (default)
+            the iterable yields dicts of ``{field : value}``
+        True
+            the first row of the iterable contains the column names
+        sequence of str
+            the column names
+        sequence of sequences
+            the :attr:`description` of a DB-API cursor, whose items start
+            with the column name
+
+        The fields are bound to the column indices once. Rows shorter than the
+        header are padded with None, and excess cells are ignored, like
+        :class:`csv.DictReader` does.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.header class attribute.
+
+    :param str missing_columns:
+        What to do when the columns of one or more required fields are
+        missing. The column names are checked before any row is processed,
+        using the ``header`` parameter for positional rows or the
+        :attr:`~csv.DictReader.fieldnames` attribute of the iterable, if any
+        (e.g. :class:`csv.DictReader`).
+        Every missing column is reported once as a
+        :class:`~fuzzyfields.MissingFieldError`; when errors='raise', this
+        raises before any row is yielded. Then:
+
+        'skip' (default)
+            skip all the rows, which would fail validation anyway
+        'default'
+            replace the missing fields with their default value in every row,
+            without validating them
+
+        When the column names are not known in advance, e.g. when the
+        iterable is a list of dicts, the keys of every row may differ, so
+        the missing required fields are reported on every row instead,
+        regardless of this parameter.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.missing_columns class
+        attribute.
+
+    :param unique_together:
+        Sequence of composite unique constraints, each a sequence of field
+        names (before name mapping), e.g.
+        ``[('portfolio', 'trade_id', 'date')]``. A row whose values for all
+        the fields of a constraint match those of a previous row is
+        reported as a :class:`~fuzzyfields.DuplicateError`, whose name lists
+        the fields of the constraint and whose value is the tuple of their
+        values, and then discarded, unless errors='raise'. Rows where any of
+        the fields is None are not checked, like in SQL. Rows discarded
+        because of any error don't count towards the constraints.
+
+        Like the ``unique`` parameter of :class:`FuzzyField`, the checks are
+        performed after all the fields of the row have been validated, in
+        the parent process when workers > 1, and the values persist across
+        iterations; see :attr:`~DictReader.unique_together_values`.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.unique_together class
+        attribute.
+
+    :param unique_store:
+        Storage of the values of every constraint of ``unique_together``:
+        'set' (default), 'fingerprint', 'disk', or callable. See the
+        matching parameter of :class:`FuzzyField`.
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.unique_store class attribute.
+
+    :param int workers:
+        Number of processes to use when iterating on the DictReader.
+        If greater than 1, rows are drawn from the underlying iterable in
+        chunks of ``chunk_size`` and validated by a
+        :class:`~concurrent.futures.ProcessPoolExecutor`; the output rows are
+        yielded in input order, and errors are reported in the same order and
+        with the same record and line numbers as with a single process.
+
+        :meth:`~DictReader.preprocess_row` and
+        :meth:`~DictReader.postprocess_row` run in the parent process, as do
+        the uniqueness checks of the fields with unique=True and the whole
+        validation of passthrough :class:`Domain` fields, so that they see
+        the values of all rows. All other fields are validated in the worker
+        processes by copies of the fields, which must be picklable.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.workers class attribute.
+
+    :param int chunk_size:
+        Number of rows sent to a worker process at once when workers > 1.
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.chunk_size class attribute.
+
+    :param int max_errors:
+        Maximum number of validation errors. When it's exceeded, the error
+        is reported as usual and then the iteration stops with an
+        :class:`~fuzzyfields.ErrorBudgetError` carrying the number of errors
+        of every field. This prevents wasting time on a broken input, e.g.
+        one with the wrong delimiter or shifted columns. Default: no limit.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.max_errors class attribute.
+
+    :param float max_error_rate:
+        Maximum fraction, between 0 and 1, of the records read so far that
+        have at least one validation error. It is only enforced after
+        ``error_rate_min_records`` records have been read. When it's exceeded,
+        the iteration stops as for ``max_errors``. Default: no limit.
+
+        Alternatively to passing this parameter, you may create a subclass of
+        DictReader and override the DictReader.max_error_rate class
+        attribute.
+
+    :param int error_rate_min_records:
+        Minimum number of records to read before enforcing
+        ``max_error_rate``. Alternatively to passing this parameter, you may
+        create a subclass of DictReader and override the
+        DictReader.error_rate_min_records class attribute.
+
+    The error counters used by ``max_errors`` and ``max_error_rate`` are
+    reset every time the iteration on the DictReader, or
+    :meth:`~DictReader.read_columns`, :meth:`~DictReader.validate_dataframe`,
+    or :meth:`~DictReader.validate_arrow`, starts from the beginning.
     """
     fields: Dict[str, FuzzyField] = {}
     """Class-level map of ``{field name: FuzzyField}``. Overriding this dict is
@@ -68,11 +236,80 @@ class DictReader:
     matching ``__init__`` parameter.
     """
 
+    output: str = 'dict'
+    """Class-level format of the output rows. Can be overridden with an
+    instance-specific value through the matching ``__init__`` parameter.
+    """
+
+    header: Union[bool, Sequence[Any], None] = None
+    """Class-level column names of positional rows. Can be overridden with an
+    instance-specific value through the matching ``__init__`` parameter.
+    """
+
+    missing_columns: str = 'skip'
+    """Class-level handling of missing columns of required fields. Can be
+    overridden with an instance-specific value through the matching
+    ``__init__`` parameter.
+    """
+
+    unique_together: Sequence[Sequence[str]] = ()
+    """Class-level composite unique constraints. Can be overridden with an
+    instance-specific value through the matching ``__init__`` parameter.
+    """
+
+    unique_store: Union[str, Callable[[], Any]] = 'set'
+    """Class-level storage of the values of the unique_together constraints.
+    Can be overridden with an instance-specific value through the matching
+    ``__init__`` parameter.
+    """
+
+    workers: int = 1
+    """Class-level number of processes to use when iterating on the
+    DictReader. Can be overridden with an instance-specific value through the
+    matching ``__init__`` parameter.
+    """
+
+    chunk_size: int = 1000
+    """Class-level number of rows sent to a worker process at once when
+    workers > 1. Can be overridden with an instance-specific value through
+    the matching ``__init__`` parameter.
+    """
+
+    max_errors: Optional[int] = None
+    """Class-level maximum number of validation errors. Can be overridden
+    with an instance-specific value through the matching ``__init__``
+    parameter.
+    """
+
+    max_error_rate: Optional[float] = None
+    """Class-level maximum fraction of records with validation errors. Can be
+    overridden with an instance-specific value through the matching
+    ``__init__`` parameter.
+    """
+
+    error_rate_min_records: int = 1000
+    """Class-level minimum number of records to read before enforcing
+    max_error_rate. Can be overridden with an instance-specific value through
+    the matching ``__init__`` parameter.
+    """
+
     record_num: int
     """Current record (counting from 0), or -1 if the iteration hasn't started
     yet.
     """
 
+    error_report: Optional[ErrorReport]
+    """Errors collected when errors='collect', or None otherwise. Errors
+    accumulate across iterations until :meth:`ErrorReport.clear` is called.
+    """
+
+    unique_together_values: Dict[Tuple[str, ...], Any]
+    """Record of the already encountered values of every constraint of
+    unique_together, as a dict of ``{field names: set-like store of value
+    tuples}``. Unhashable tuples are recorded by their
+    :func:`~fuzzyfields.tools.canonical_key`.
+    """
+
     def __init_subclass__(cls):
         """Executed after all subclasses of the current class are defined. Set
         FuzzyField.name and enrich the docstring of the subclass with the
@@ -94,7 +331,15 @@ class DictReader:
     def __init__(self, iterable: Iterable,
                  fields: Dict[str, FuzzyField] = None, *,
                  errors: Union[str, Callable[[Exception], Any]] = None,
-                 name_map: Dict[str, str] = None):
+                 name_map: Dict[str, str] = None,
+                 output: str = None,
+                 header: Union[bool, Sequence[Any]] = None,
+                 missing_columns: str = None,
+                 unique_together: Sequence[Sequence[str]] = None,
+                 unique_store: Union[str, Callable[[], Any]] = None,
+                 workers: int = None, chunk_size: int = None,
+                 max_errors: int = None, max_error_rate: float = None,
+                 error_rate_min_records: int = None):
         """Build new object
         """
         self.iterable = iterable
@@ -113,9 +358,13 @@ class DictReader:
         if errors is not None:
             self.errors = errors
         if isinstance(self.errors, str) and self.errors not in {
-                'debug', 'info', 'warning', 'error', 'critical', 'raise'}:
+                'debug', 'info', 'warning', 'error', 'critical', 'raise',
+                'collect'}:
             raise ValueError("errors: expected log level, 'raise', "
-                             "or callable; got %s" % self.errors)
+                             "'collect', or callable; got %s" % self.errors)
+        self.error_report = None
+        if self.errors == 'collect':
+            self.error_report = ErrorReport(self.fields)
 
         if name_map is not None:
             self.name_map = self.name_map.copy()
@@ -125,86 +374,1526 @@ class DictReader:
             raise KeyError("Key(s) in name_map not found in fields: "
                            + ", ".join(sorted(name_map_check)))
 
+        if output is not None:
+            self.output = output
+        if self.output not in {'dict', 'tuple', 'namedtuple', 'slots'}:
+            raise ValueError("output: expected 'dict', 'tuple', 'namedtuple' "
+                             f"or 'slots'; got {self.output}")
+
+        if header is not None:
+            self.header = header
+        if self.header is False:
+            self.header = None
+
+        if missing_columns is not None:
+            self.missing_columns = missing_columns
+        if self.missing_columns not in {'skip', 'default'}:
+            raise ValueError("missing_columns: expected 'skip' or 'default'; "
+                             f"got {self.missing_columns}")
+        self._missing_fields: FrozenSet[str] = frozenset()
+
+        if unique_together is not None:
+            self.unique_together = unique_together
+        if unique_store is not None:
+            self.unique_store = unique_store
+        check_store(self.unique_store)
+        self.unique_together_values = {}
+        for names in self.unique_together:
+            if isinstance(names, str) or not names:
+                raise ValueError("unique_together: expected sequence of "
+                                 f"sequences of field names; got {names!r}")
+            names = tuple(names)
+            names_check = set(names) - self.fields.keys()
+            if names_check:
+                raise KeyError("Field(s) in unique_together not found in "
+                               "fields: " + ", ".join(sorted(names_check)))
+            self.unique_together_values[names] = new_store(self.unique_store)
+
+        if workers is not None:
+            self.workers = workers
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+        if self.workers < 1:
+            raise ValueError(f"workers must be >= 1; got {self.workers}")
+        if self.chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be >= 1; got {self.chunk_size}")
+
+        if max_errors is not None:
+            self.max_errors = max_errors
+        if max_error_rate is not None:
+            self.max_error_rate = max_error_rate
+        if error_rate_min_records is not None:
+            self.error_rate_min_records = error_rate_min_records
+        if self.max_errors is not None and self.max_errors < 0:
+            raise ValueError(
+                f"max_errors must be >= 0; got {self.max_errors}")
+        if (self.max_error_rate is not None
+                and not 0 <= self.max_error_rate <= 1):
+            raise ValueError("max_error_rate must be between 0 and 1; "
+                             f"got {self.max_error_rate}")
+        if self.error_rate_min_records < 1:
+            raise ValueError("error_rate_min_records must be >= 1; "
+                             f"got {self.error_rate_min_records}")
+        self._reset_error_budget()
+
+    @classmethod
+    def from_path(cls, path: Union[str, os.PathLike], *,
+                  encoding: str = 'utf-8', encoding_errors: str = 'strict',
+                  read_ahead: int = 16, read_ahead_batch: int = 1000,
+                  **kwargs) -> 'DictReader':
+        """Build a DictReader that reads a CSV file.
+
+        The file is opened at the beginning of every iteration on the
+        DictReader, and read by a background thread that decompresses,
+        decodes, and tokenises it, feeding a bounded queue of row batches.
+        This overlaps I/O with validation and keeps memory usage bounded.
+        Error messages report the line numbers of the file.
+
+        :param path:
+            Path to the CSV file. Files compressed with gzip, bz2 or xz are
+            recognised by their content and decompressed transparently.
+            Uncompressed files are memory-mapped.
+        :param str encoding:
+            text encoding of the file
+        :param str encoding_errors:
+            error handling scheme of the text decoder; see :func:`open`
+        :param int read_ahead:
+            maximum number of row batches read ahead of the validation
+        :param int read_ahead_batch:
+            number of rows in a batch
+        :param kwargs:
+            Parameters of ``__init__`` (of this class or of a child class),
+            and parameters of :class:`csv.DictReader`, e.g. ``delimiter`` or
+            ``fieldnames``.
+
+        Unless ``restkey`` or ``restval`` are set, or a child class overrides
+        :meth:`DictReader.preprocess_row`, the file is tokenised with
+        :func:`csv.reader` and the rows are read positionally (see the
+        ``header`` parameter of ``__init__``), which is faster and produces
+        the same output as :class:`csv.DictReader`. ``fieldnames``, if set,
+        becomes the header.
+        """
+        from .readahead import ReadAheadCSV
+
+        init_params = inspect.signature(cls.__init__).parameters
+        init_kwargs = {
+            k: kwargs.pop(k) for k in list(kwargs)
+            if k in init_params and k not in ('self', 'iterable')
+        }
+        csv_kwargs = kwargs
+        read_ahead_kwargs = dict(
+            encoding=encoding, encoding_errors=encoding_errors,
+            queue_size=read_ahead, batch_size=read_ahead_batch)
+
+        if ('restkey' in csv_kwargs or 'restval' in csv_kwargs
+                or cls.preprocess_row is not DictReader.preprocess_row):
+            iterable = ReadAheadCSV(
+                path, dicts=True, **read_ahead_kwargs, **csv_kwargs)
+        else:
+            fieldnames = csv_kwargs.pop('fieldnames', None)
+            if fieldnames is not None:
+                init_kwargs.setdefault('header', fieldnames)
+            elif cls.header is None:
+                # Read the header from the first line
+                init_kwargs.setdefault('header', True)
+            iterable = ReadAheadCSV(
+                path, dicts=False, **read_ahead_kwargs, **csv_kwargs)
+        return cls(iterable, **init_kwargs)
+
     def _error_handler(self, exc: ValidationError) -> None:
         """Deal with a validation failure
 
         :param ValidationError exc:
             error raised by an individual FuzzyField
         """
-        exc.record_num = self.record_num
-        try:
-            exc.line_num = self.line_num
-        except AttributeError:
-            # self.iterable is not a csv.DictReader or compatible class
-            pass
+        if exc.record_num is None:
+            exc.record_num = self.record_num
+        if exc.line_num is None:
+            try:
+                exc.line_num = self.line_num
+            except AttributeError:
+                # self.iterable is not a csv.DictReader or compatible class
+                pass
         if self.errors == 'raise':
             raise exc
+        elif self.errors == 'collect':
+            if self.error_report is None:
+                # errors was changed after __init__
+                self.error_report = ErrorReport(self.fields)
+            self.error_report.append(exc)
         elif isinstance(self.errors, str):
             logfn = getattr(logging, self.errors)
             logfn("%s", exc)
         else:
             self.errors(exc)
 
-    def __iter__(self):
+        if self.max_errors is not None or self.max_error_rate is not None:
+            self._check_error_budget(exc.name, exc.record_num, exc.line_num)
+
+    def _report_error(self, name: str,
+                      error: Union[ValidationError, Tuple[type, ...]],
+                      record_num: int = None, line_num: int = None) -> None:
+        """Deal with a validation failure returned by
+        :meth:`FuzzyField.try_parse`. With errors='collect', store it in
+        :attr:`~DictReader.error_report` without building the exception;
+        otherwise build it and pass it to :meth:`DictReader._error_handler`.
+
+        :param str name:
+            field name
+        :param error:
+            error returned by :meth:`FuzzyField.try_parse`
+        :param int record_num:
+            record number; default: :attr:`DictReader.record_num`
+        :param int line_num:
+            line number; default: :attr:`DictReader.line_num`, if available
+        """
+        if self.errors != 'collect' or isinstance(error, ValidationError):
+            exc = make_error(name, error)
+            if record_num is not None:
+                exc.record_num = record_num
+            if line_num is not None:
+                exc.line_num = line_num
+            self._error_handler(exc)
+            return
+
+        if record_num is None:
+            record_num = self.record_num
+        if line_num is None:
+            try:
+                line_num = self.line_num
+            except AttributeError:
+                # self.iterable is not a csv.DictReader or compatible class
+                pass
+        if self.error_report is None:
+            # errors was changed after __init__
+            self.error_report = ErrorReport(self.fields)
+        # The first parameter of all field errors after the name is the value
+        self.error_report.add(name, error[0], error[1] if len(error) > 1
+                              else None, record_num, line_num)
+
+        if self.max_errors is not None or self.max_error_rate is not None:
+            self._check_error_budget(name, record_num, line_num)
+
+    def _reset_error_budget(self) -> None:
+        """Reset the error counters of :meth:`DictReader._check_error_budget`
+        """
+        self._error_counts: Dict[Optional[str], int] = {}
+        self._num_errors = 0
+        self._num_error_records = 0
+        self._last_error_record = None
+
+    def _check_error_budget(self, name: Optional[str], record_num: int,
+                            line_num: Optional[int]) -> None:
+        """Count an error that has just been reported and abort if the
+        ``max_errors`` or ``max_error_rate`` parameters are exceeded.
+
+        :param str name:
+            field name of the error
+        :param int record_num:
+            record number of the error
+        :param int line_num:
+            line number of the error, or None if unavailable
+        :raises ErrorBudgetError:
+            if the budget is exceeded
+        """
+        self._error_counts[name] = self._error_counts.get(name, 0) + 1
+        self._num_errors += 1
+        if record_num != self._last_error_record:
+            self._last_error_record = record_num
+            self._num_error_records += 1
+        num_records = record_num + 1
+
+        if (self.max_errors is not None
+                and self._num_errors > self.max_errors) or (
+                self.max_error_rate is not None
+                and num_records >= self.error_rate_min_records
+                and self._num_error_records
+                > self.max_error_rate * num_records):
+            budget_exc = ErrorBudgetError(
+                dict(self._error_counts), self._num_errors, num_records)
+            budget_exc.record_num = record_num
+            budget_exc.line_num = line_num
+            raise budget_exc
+
+    def _unique_check(self, report_error: Callable[..., None] = None
+                      ) -> Optional[Callable[..., bool]]:
+        """Build the function that enforces the unique_together constraints
+        on a row whose fields have all been validated.
+
+        :param report_error:
+            function with the same signature as
+            :meth:`DictReader._report_error`, which is the default
+        :returns:
+            None if there are no constraints; otherwise a function
+            ``check_unique(values, record_num=None, line_num=None) -> bool``,
+            where values is the tuple of the parsed values of all the fields,
+            in order, that reports every violated constraint with
+            :meth:`DictReader._report_error` and returns False if the row
+            must be discarded. The values of a row are only recorded if it
+            violates no constraint.
+        """
+        if not self.unique_together_values:
+            return None
+        positions = {name: i for i, name in enumerate(self.fields)}
+        constraints = [
+            (', '.join(names), [positions[name] for name in names], store)
+            for names, store in self.unique_together_values.items()
+        ]
+        if report_error is None:
+            report_error = self._report_error
+
+        def check_unique(values, record_num=None, line_num=None):
+            ok = True
+            new_keys = []
+            for name, idx, store in constraints:
+                key = tuple([values[i] for i in idx])
+                if any(value is None for value in key):
+                    continue
+                try:
+                    hkey = key
+                    found = key in store
+                except TypeError:
+                    # Unhashable
+                    hkey = canonical_key(key)
+                    found = hkey in store
+                if found:
+                    report_error(name, (DuplicateError, key),
+                                 record_num, line_num)
+                    ok = False
+                else:
+                    new_keys.append((store, hkey))
+
+            if ok:
+                for store, hkey in new_keys:
+                    store.add(hkey)
+            return ok
+
+        return check_unique
+
+    def __iter__(self) -> Iterator[Any]:
         """Draw dicts from the underlying iterable and yield dicts of
-         ``{field name : parsed value}``.
+         ``{field name : parsed value}``, or another format depending on the
+         ``output`` parameter.
+        """
+        return self._iter_rows(self.output)
+
+    def _iter_rows(self, output: str) -> Iterator[Any]:
+        """Implementation of :meth:`DictReader.__iter__`
+
+        :param str output:
+            format of the output rows; see the ``output`` parameter
         """
-        for self.record_num, row in enumerate(self.iterable):
+        if self.workers > 1:
+            yield from self._iter_parallel(output)
+            return
+
+        rows, columns = self._open()
+        if columns is not None:
+            parse_row = self._get_row_parser(columns, output,
+                                             positional=True)
+        header = None
+        postprocess = self._has_postprocess_row
+        if postprocess:
+            to_record = self._record_converter(output)
 
+        for self.record_num, row in enumerate(rows):
             # Give child classes a chance to alter the row before parsing it
             row = self.preprocess_row(row)
             if row is None:
                 continue
 
+            # Most iterables, e.g. csv.DictReader, yield the same keys on
+            # every row. Build the row parser when the keys change.
+            if columns is None and tuple(row) != header:
+                header = tuple(row)
+                parse_row = self._get_row_parser(header, output)
+
+            out = parse_row(row)
+            # Skip blank rows. If a required field has an error, discard the
+            # whole line.
+            if out is None:
+                continue
+
+            if postprocess:
+                # Give child classes a chance to alter the row before pushing
+                # it out
+                out = self.postprocess_row(out)
+                if out is None:
+                    continue
+                if to_record:
+                    out = to_record(out)
+
+            yield out
+
+    def _open(self) -> Tuple[Iterator[Any], Union[Tuple[str, ...], None]]:
+        """Start iterating on the underlying iterable, consuming the header
+        row if header=True.
+
+        :returns:
+            tuple of (iterator of the data rows, column names of positional
+            rows or None if the rows are dicts)
+        """
+        self._reset_error_budget()
+        self._missing_fields = frozenset()
+        rows = iter(self.iterable)
+        if self.header is None:
+            fieldnames = getattr(self.iterable, 'fieldnames', None)
+            if (fieldnames is not None
+                    and type(self).preprocess_row is DictReader.preprocess_row
+                    and not self._check_header(tuple(fieldnames), 0)):
+                return iter(()), None
+            return rows, None
+        if self.header is True:
+            try:
+                header = next(rows)
+            except StopIteration:
+                return rows, ()
+        else:
+            header = self.header
+        # DB-API cursor.description
+        columns = tuple(
+            name if isinstance(name, str) else name[0] for name in header)
+        if not self._check_header(columns, 0, positional=True):
+            return iter(()), columns
+        return rows, columns
+
+    def _check_header(self, header: Tuple[Any, ...], record_num: int,
+                      positional: bool = False) -> bool:
+        """Check, before parsing any row, that the header, either positional
+        or from the fieldnames of the iterable, contains the columns of all
+        required fields. Report every missing column once
+        and, if missing_columns='default', make the row parsers replace the
+        missing fields with their default.
+
+        :param header:
+            see :meth:`DictReader._get_row_parser`
+        :param int record_num:
+            record number of the first row
+        :param bool positional:
+            see :meth:`DictReader._get_row_parser`
+        :returns:
+            False if all the rows must be skipped; True otherwise
+        """
+        plan = self._header_plan(header, positional)
+        missing = [
+            field for field in self.fields.values()
+            if field.required and field.name not in plan
+        ]
+        for field in missing:
+            exc = MissingFieldError(field.name)
+            exc.record_num = record_num
+            self._error_handler(exc)
+
+        if self.missing_columns == 'default':
+            self._missing_fields = frozenset(field.name for field in missing)
+            return True
+        return not missing
+
+    def _parse_row(self, row: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+        """Parse all fields of a row after :meth:`DictReader.preprocess_row`.
+
+        This is the reference implementation of the functions generated by
+        :meth:`DictReader._compile_row_parser`, which are what
+        :meth:`DictReader.__iter__` actually uses.
+
+        :returns:
+            dict of ``{field name (after name mapping): parsed value}``,
+            or None if the row is blank or a required field failed to
+            validate
+        """
+        row = self._strip_row(row)
+        if row is None:
+            return None
+
+        out = {}
+        values = []
+        required_field_error = False
+
+        # Parse each field. If a field fails to parse:
+        # - If there is no error handler, raise an Exception immediately.
+        # - If there's an error handler and the field is not required,
+        #   the field is replaced with its default value.
+        # - If there's an error handler and the field is required,
+        #   all fields are parsed and finally the line is skipped.
+        for field in self.fields.values():
+            # Apply name mapping
+            out_name = self.name_map.get(field.name, field.name)
+
+            if (field.name in self._missing_fields
+                    and field.name not in row):
+                # Already reported by _check_header()
+                value = field.default
+            else:
+                try:
+                    # Entirely missing columns are OK as long as they
+                    # pertain to non-required fields
+                    value = field.parse(row.get(field.name, None))
+
+                except ValidationError as exc:
+                    self._error_handler(exc)
+
+                    if field.required:
+                        required_field_error = True
+                    value = field.default
+
+            out[out_name] = value
+            values.append(value)
+
+        if required_field_error:
+            return None
+        check_unique = self._unique_check()
+        if check_unique is not None and not check_unique(tuple(values)):
+            return None
+        return out
+
+    def _get_row_parser(self, header: Tuple[Any, ...], output: str,
+                        positional: bool = False) -> Callable[[Any], Any]:
+        """Return the function generated by
+        :meth:`DictReader._compile_row_parser` for rows with the given keys,
+        building it the first time. All functions are discarded whenever the
+        fields, the name map, the output format, or the fields replaced by
+        missing_columns='default' change.
+
+        :param header:
+            tuple of the keys of the dict rows returned by
+            :meth:`DictReader.preprocess_row`, in the order of the row, or of
+            the column names of positional rows
+        :param str output:
+            format of the output rows; see the ``output`` parameter
+        :param bool positional:
+            True if the rows are positional; False if they are dicts
+        """
+        signature = tuple(
+            (field.name, self.name_map.get(field.name, field.name), field)
+            for field in self.fields.values())
+        key = output, self._missing_fields
+        try:
+            cached_key, cached_signature, parsers = self._row_parsers
+            # Compare fields by identity
+            if not (cached_key == key
+                    and len(cached_signature) == len(signature)
+                    and all(a[:2] == b[:2] and a[2] is b[2]
+                            for a, b in zip(cached_signature, signature))):
+                raise AttributeError()
+        except AttributeError:
+            parsers = {}
+            self._row_parsers = key, signature, parsers
+
+        try:
+            return parsers[positional, header]
+        except KeyError:
+            pass
+        # Don't grow indefinitely when every row has different keys
+        if len(parsers) >= 64:
+            parsers.clear()
+        parser = parsers[positional, header] = self._compile_row_parser(
+            header, output, positional)
+        return parser
+
+    def _header_plan(self, header: Tuple[Any, ...], positional: bool = False
+                     ) -> Dict[str, Any]:
+        """Map the fields to the keys of the input rows. Like
+        :class:`csv.DictReader`, if multiple keys are the same after
+        stripping whitespace, the last one wins.
+
+        :param header:
+            see :meth:`DictReader._get_row_parser`
+        :param bool positional:
+            see :meth:`DictReader._get_row_parser`
+        :returns:
+            dict of ``{field name: row key}``, where the row key is the
+            field name, possibly surrounded by spurious whitespace, or the
+            column index for positional rows.
+            Fields with no matching key are omitted.
+        """
+        if positional:
+            stripped = {name.strip(): i for i, name in enumerate(header)}
+        else:
             # csv.DictReader stores unexpected columns under the None key.
             # Discard them.
-            row.pop(None, None)
-            # Skip completely blank rows
-            if all(isinstance(cell, str) and not cell.strip() or cell is None
-                   for cell in row.values()):
+            stripped = {
+                key.strip(): key for key in header if key is not None}
+        return {
+            name: stripped[name]
+            for name in self.fields
+            if name in stripped
+        }
+
+    def _compile_row_parser(self, header: Tuple[Any, ...], output: str,
+                            positional: bool = False
+                            ) -> Callable[[Any], Any]:
+        """Generate a function equivalent to :meth:`DictReader._parse_row`
+        for the current fields and name map and for rows with the given keys.
+
+        The header plan (see :meth:`DictReader._header_plan`) is resolved
+        once; the loop on the fields is unrolled, and every field, bound
+        method, and key is stored in a closure variable. Missing columns of
+        optional fields are replaced with the field default without calling
+        :meth:`FuzzyField.parse`, unless the field customises its parsing.
+        Fields are validated with :meth:`FuzzyField.try_parse`, so that
+        invalid values never raise and the exceptions are only built if the
+        error policy needs them (see :meth:`DictReader._report_error`).
+
+        The function directly builds the output row in the requested format,
+        unless a child class overrides
+        :meth:`DictReader.postprocess_row`, in which case it returns a dict.
+
+        The ``required``, ``unique`` and ``default`` attributes of the fields
+        are read at every use, so changing them after the function has been
+        generated is safe.
+
+        :param header:
+            see :meth:`DictReader._get_row_parser`
+        :param str output:
+            format of the output rows; see the ``output`` parameter
+        :param bool positional:
+            see :meth:`DictReader._get_row_parser`
+        """
+        plan = self._header_plan(header, positional)
+        args = {'report_error': self._report_error}
+        lines = ['def parse_row(row):']
+
+        # Skip completely blank rows
+        if positional:
+            # Ignore excess cells
+            args['num_columns'] = len(header)
+            lines += [
+                '    num_cells = len(row)',
+                '    for cell in (row if num_cells <= num_columns',
+                '                 else row[:num_columns]):',
+                '        if cell is not None and not (',
+                '                isinstance(cell, str) and not cell.strip()):',
+            ]
+        elif None in header:
+            lines += [
+                '    for key, cell in row.items():',
+                '        if key is not None and cell is not None and not (',
+                '                isinstance(cell, str) and not cell.strip()):',
+            ]
+        else:
+            lines += [
+                '    for cell in row.values():',
+                '        if cell is not None and not (',
+                '                isinstance(cell, str) and not cell.strip()):',
+            ]
+        lines += [
+            '            break',
+            '    else:',
+            '        return None',
+            '',
+            '    required_field_error = False',
+        ]
+
+        for i, field in enumerate(self.fields.values()):
+            args[f'field{i}'] = field
+            args[f'name{i}'] = field.name
+            args[f'out_name{i}'] = self.name_map.get(field.name, field.name)
+            if type(field).try_parse is FuzzyField.try_parse:
+                # Skip a function call. The closure is rebuilt on the fly
+                # whenever the settings of the field change.
+                try_parse = f'field{i}._try_parse_func'
+            else:
+                args[f'try_parse{i}'] = field.try_parse
+                try_parse = f'try_parse{i}'
+            parse_block = [
+                f'ok, value{i} = {try_parse}({{}})',
+                'if not ok:',
+                f'    report_error(name{i}, value{i})',
+                f'    if field{i}.required:',
+                '        required_field_error = True',
+                '    else:',
+                f'        value{i} = field{i}.default',
+            ]
+
+            if field.name in plan:
+                args[f'key{i}'] = plan[field.name]
+                if positional:
+                    # Pad short rows with None
+                    parse_block[0] = parse_block[0].format(
+                        f'row[key{i}] if num_cells > key{i} else None')
+                else:
+                    parse_block[0] = parse_block[0].format(f'row[key{i}]')
+                lines += ['    ' + line for line in parse_block]
+            elif field.name in self._missing_fields:
+                # Already reported by _check_header()
+                lines += [f'    value{i} = field{i}.default']
+            elif _has_default_parse(field):
+                # Entirely missing columns are OK as long as they pertain to
+                # non-required fields
+                parse_block[0] = parse_block[0].format('None')
+                lines += [f'    if field{i}.required or field{i}.unique:']
+                lines += ['        ' + line for line in parse_block]
+                lines += [
+                    '    else:',
+                    f'        value{i} = field{i}.default',
+                ]
+            else:
+                parse_block[0] = parse_block[0].format('None')
+                lines += ['    ' + line for line in parse_block]
+
+        values = ''.join(f'value{i}, ' for i in range(len(self.fields)))
+        # Raise ValueError on duplicate names
+        self._output_names(output)
+        if self._has_postprocess_row:
+            # postprocess_row() always receives a dict
+            output = 'dict'
+        if output == 'dict':
+            out = '{%s}' % ', '.join(
+                f'out_name{i}: value{i}' for i in range(len(self.fields)))
+        elif output == 'tuple':
+            out = f'({values})'
+        elif output == 'namedtuple':
+            args['record_type'] = self._get_record_type(output)
+            args['new_tuple'] = tuple.__new__
+            out = f'new_tuple(record_type, ({values}))'
+        else:
+            args['record_type'] = self._get_record_type(output)
+            out = f'record_type({values})'
+
+        lines += [
+            '',
+            '    if required_field_error:',
+            '        return None',
+        ]
+        check_unique = self._unique_check()
+        if check_unique is not None:
+            args['check_unique'] = check_unique
+            lines += [
+                f'    if not check_unique(({values})):',
+                '        return None',
+            ]
+        lines += [f'    return {out}']
+
+        source = '\n'.join(
+            [f'def make_parse_row({", ".join(args)}):']
+            + ['    ' + line if line else '' for line in lines]
+            + ['    return parse_row'])
+        namespace = {}
+        exec(compile(source, f'<{type(self).__name__}.parse_row>', 'exec'),
+             namespace)
+        return namespace['make_parse_row'](**args)
+
+    def _output_names(self, output: str) -> Tuple[str, ...]:
+        """Return the names of the output fields, after name mapping
+
+        :param str output:
+            format of the output rows; see the ``output`` parameter
+        :raises ValueError:
+            if output is not 'dict' and there are duplicate names
+        """
+        names = tuple(self.name_map.get(name, name) for name in self.fields)
+        if output != 'dict' and len(set(names)) < len(names):
+            raise ValueError(f"output={output!r} requires unique field "
+                             f"names after name mapping; got {names}")
+        return names
+
+    def _get_record_type(self, output: str) -> type:
+        """Return the :func:`~collections.namedtuple` or ``__slots__`` class
+        of the output rows for output='namedtuple' or output='slots',
+        building it the first time and again whenever the field names or the
+        output format change.
+        """
+        key = output, self._output_names(output)
+        try:
+            cached_key, record_type = self._record_type
+            if cached_key == key:
+                return record_type
+        except AttributeError:
+            pass
+
+        output, names = key
+        typename = type(self).__name__ + 'Row'
+        if output == 'namedtuple':
+            record_type = collections.namedtuple(typename, names)
+        else:
+            record_type = _make_slots_class(typename, names)
+        self._record_type = key, record_type
+        return record_type
+
+    def _record_converter(self, output: str
+                          ) -> Union[Callable[[Dict[str, Any]], Any], None]:
+        """Return a function that converts the dicts returned by
+        :meth:`DictReader.postprocess_row` to the given format (see the
+        ``output`` parameter), or None for output='dict'
+        """
+        if output == 'dict':
+            return None
+        names = self._output_names(output)
+        if output == 'tuple':
+            return lambda row: tuple([row[name] for name in names])
+        record_type = self._get_record_type(output)
+        if output == 'namedtuple':
+            return lambda row: record_type._make([row[name] for name in names])
+        return lambda row: record_type(*[row[name] for name in names])
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """Iterate on the DictReader and return the validated data as
+        :class:`numpy.ndarray` columns, without building the intermediate row
+        dicts.
+
+        The values are appended to buffers that grow geometrically, with a
+        dtype chosen by each field: float64 for :class:`Float` and
+        :class:`Percentage`, int64 for :class:`Integer`, bool for
+        :class:`Boolean`, and datetime64[ns] for :class:`Timestamp`. If the
+        values don't fit, e.g. because of a default value of None or an
+        integer that overflows int64, the column is promoted to float64 or
+        object, in the same way as :class:`pandas.DataFrame` would do. All
+        other fields, including :class:`Domain`, produce object arrays.
+
+        :returns:
+            dict of ``{field name (after name mapping): numpy.ndarray}``
+        """
+        return {
+            name: buf.to_numpy()
+            for name, buf in self._fill_buffers().items()
+        }
+
+    def to_dataframe(self) -> Any:
+        """Iterate on the DictReader and return the validated data as a
+        :class:`pandas.DataFrame`, without building the intermediate row
+        dicts. This is equivalent to, but faster and much more memory
+        efficient than, ``pandas.DataFrame(list(reader))``.
+
+        Column dtypes are the same as in :meth:`DictReader.to_arrays`,
+        except that :class:`Domain` fields produce categorical columns.
+
+        :returns:
+            :class:`pandas.DataFrame` with one column per field, named after
+            name mapping, and a :class:`~pandas.RangeIndex`
+        """
+        import pandas
+
+        buffers = self._fill_buffers()
+        columns = {}
+        for name in list(buffers):
+            # Release each buffer as soon as it's converted
+            columns[name] = buffers.pop(name).to_pandas()
+        return pandas.DataFrame(columns, columns=list(columns), copy=False)
+
+    def _fill_buffers(self) -> Dict[str, Any]:
+        """Iterate on the DictReader, appending the values to the buffers
+        returned by :meth:`FuzzyField._new_buffer`, for
+        :meth:`DictReader.to_arrays` and :meth:`DictReader.to_dataframe`.
+
+        :returns:
+            dict of ``{field name (after name mapping): buffer}``
+        """
+        names = self._output_names('tuple')
+        buffers = [field._new_buffer() for field in self.fields.values()]
+        appends = [buf.append for buf in buffers]
+
+        # Tuples are freed as soon as their values are appended
+        for row_idx, row in enumerate(self._iter_rows('tuple'), 1):
+            for append, value in zip(appends, row):
+                append(value)
+            if row_idx % _BUFFER_FLUSH_ROWS == 0:
+                # Move the values to the typed arrays. Buffers may be
+                # promoted to a different class.
+                buffers = [buf.flush() for buf in buffers]
+                appends = [buf.append for buf in buffers]
+
+        return dict(zip(names, buffers))
+
+    def read_columns(self, batch_size: int = 10000, *, rows: bool = False
+                     ) -> Iterator:
+        """Alternative to iterating on the DictReader that validates whole
+        columns at once. Rows are drawn from the underlying iterable in
+        batches, transposed into columns, and every column is validated by
+        :meth:`FuzzyField.parse_many`. This is much faster for fields with a
+        vectorized implementation.
+
+        Error handling is the same as when iterating on the DictReader:
+        if a required field fails to validate, the whole row is discarded;
+        otherwise the field is replaced by its default value. Errors are
+        reported in the same order and with the same record and line numbers.
+        However, when errors='raise', the exception is raised before any of
+        the rows of the batch are yielded.
+
+        .. note::
+           As every column is validated before moving on to the next one,
+           a passthrough :class:`Domain` that references the seen_values of
+           another field will accept values that appear in later rows of the
+           same batch.
+
+        :param int batch_size:
+            Number of rows to validate at once
+        :param bool rows:
+            False (default)
+                yield a dict of ``{field name: column}`` for every batch,
+                after name mapping, where every column is a
+                :class:`numpy.ndarray` for fields with a vectorized
+                implementation, or a list otherwise.
+                Child classes that override :meth:`~DictReader.postprocess_row`
+                will receive lists instead.
+            True
+                yield the rows one by one, exactly like when iterating on the
+                DictReader
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1; got {batch_size}")
+
+        for batch in self._iter_batches(batch_size):
+            yield from self._parse_batch(batch, rows)
+
+    def _iter_batches(self, batch_size: int) -> Iterator[List[tuple]]:
+        """Draw rows from the underlying iterable, clean them with
+        :meth:`DictReader._clean_row`, and yield them in lists of up to
+        batch_size (record_num, line_num, row) tuples.
+        """
+        batch = []
+        rows, columns = self._open()
+        for self.record_num, row in enumerate(rows):
+            row = self._clean_row(row, columns)
+            if row is None:
                 continue
-            # Strip spurious whitespace from column headers
-            row = {k.strip(): v for k, v in row.items()}
+            try:
+                line_num = self.line_num
+            except AttributeError:
+                # self.iterable is not a csv.DictReader or compatible class
+                line_num = None
+            batch.append((self.record_num, line_num, row))
+
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
 
+        if batch:
+            yield batch
+
+    def _iter_parallel(self, output: str) -> Iterator[Any]:
+        """Implementation of :meth:`DictReader._iter_rows` for workers > 1
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Fields that must be validated by the parent process are replaced by
+        # None. Unique fields are validated by the workers, but postprocessed
+        # by the parent, which holds the global seen_values.
+        worker_fields = []
+        for field in self.fields.values():
+            if getattr(field, 'passthrough', False):
+                worker_fields.append(None)
+            else:
+                field = field.copy()
+                field.owner = None
+                worker_fields.append(field)
+
+        # Keep a bounded number of chunks in flight, so that a slow consumer
+        # doesn't cause the whole input to be loaded in memory
+        pending = collections.deque()
+        with ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                 initargs=(worker_fields, )) as pool:
+            try:
+                for batch in self._iter_batches(self.chunk_size):
+                    future = pool.submit(
+                        _parse_chunk, [row for _, _, row in batch])
+                    pending.append((batch, future))
+                    if len(pending) > self.workers * 2:
+                        # _merge_chunk() changes self.record_num
+                        record_num = self.record_num
+                        yield from self._merge_chunk(
+                            *pending.popleft(), output)
+                        self.record_num = record_num
+
+                record_num = self.record_num
+                while pending:
+                    yield from self._merge_chunk(*pending.popleft(), output)
+                self.record_num = record_num
+            finally:
+                # The generator was closed early, or a row raised
+                for _, future in pending:
+                    future.cancel()
+
+    def _merge_chunk(self, batch: List[tuple], future: Any, output: str
+                     ) -> Iterator[Any]:
+        """Complete the validation of a chunk of rows, for
+        :meth:`DictReader._iter_parallel`, and yield the output rows.
+
+        :param batch:
+            list of (record_num, line_num, row) tuples, as sent to the worker
+        :param future:
+            :class:`~concurrent.futures.Future` of :func:`_parse_chunk`
+        :param str output:
+            format of the output rows; see the ``output`` parameter
+        """
+        to_record = self._record_converter(output)
+        check_unique = self._unique_check()
+        for (self.record_num, line_num, row), (values, errors) in zip(
+                batch, future.result()):
             out = {}
             required_field_error = False
 
-            # Parse each field. If a field fails to parse:
-            # - If there is no error handler, raise an Exception immediately.
-            # - If there's an error handler and the field is not required,
-            #   the field is replaced with its default value.
-            # - If there's an error handler and the field is required,
-            #   all fields are parsed and finally the line is skipped.
-            for field in self.fields.values():
-                # Apply name mapping
+            for field_idx, field in enumerate(self.fields.values()):
                 out_name = self.name_map.get(field.name, field.name)
+                if (field.name in self._missing_fields
+                        and field.name not in row):
+                    # Already reported by _check_header()
+                    out[out_name] = values[field_idx] = field.default
+                    continue
+                error = errors.get(field_idx)
+                if error is None:
+                    try:
+                        if getattr(field, 'passthrough', False):
+                            value = field.parse(row.get(field.name, None))
+                        elif field.unique:
+                            value = field.postprocess(values[field_idx])
+                        else:
+                            value = values[field_idx]
+                        out[out_name] = values[field_idx] = value
+                    except ValidationError as exc:
+                        error = exc
 
-                try:
-                    # Entirely missing columns are OK as long as they pertain
-                    # to non-required fields
-                    value = row.get(field.name, None)
-                    out[out_name] = field.parse(value)
-
-                except ValidationError as exc:
-                    self._error_handler(exc)
+                if error is not None:
+                    self._report_error(
+                        field.name, error, self.record_num, line_num)
 
                     if field.required:
                         required_field_error = True
                     else:
-                        out[out_name] = field.default
+                        out[out_name] = values[field_idx] = field.default
 
-            # If a required field has an error, discard the whole line
             if required_field_error:
                 continue
+            if check_unique is not None and not check_unique(
+                    tuple(values), self.record_num, line_num):
+                continue
 
-            # Give child classes a chance to alter the row before pushing it
-            # out
             out = self.postprocess_row(out)
             if out is None:
                 continue
+            if to_record:
+                out = to_record(out)
 
             yield out
 
+    def _parse_batch(self, batch: List[tuple], rows: bool) -> Iterator:
+        """Validate a batch of rows for :meth:`DictReader.read_columns`
+
+        :param batch:
+            list of (record_num, line_num, row) tuples, where row has already
+            been cleaned by :meth:`DictReader._clean_row`
+        :param bool rows:
+            See :meth:`DictReader.read_columns`
+        """
+        columns, keep, _ = self._parse_columns(
+            lambda name: [row.get(name, None) for _, _, row in batch],
+            [(record_num, line_num) for record_num, line_num, _ in batch],
+            self._missing_fields)
+
+        if rows or self._has_postprocess_row:
+            out_rows = [row for _, row in
+                        self._postprocess_columns(columns, keep)]
+            if rows:
+                to_record = self._record_converter(self.output)
+                if to_record:
+                    out_rows = map(to_record, out_rows)
+                yield from out_rows
+            elif out_rows:
+                yield {name: [row[name] for row in out_rows]
+                       for name in out_rows[0]}
+            return
+
+        if not all(keep):
+            columns = {name: _compress(col, keep)
+                       for name, col in columns.items()}
+        if any(keep):
+            yield columns
+
+    def _parse_columns(self, get_column: Callable[[str], Any],
+                       positions: List[tuple],
+                       missing: FrozenSet[str] = frozenset()) -> tuple:
+        """Validate whole columns at once with :meth:`FuzzyField.parse_many`
+        and report the errors in the same order as :meth:`DictReader.__iter__`
+        would.
+
+        :param get_column:
+            callable that accepts a field name (before name mapping) and
+            returns the matching column of raw values
+        :param positions:
+            list of (record_num, line_num) tuples, one for every row
+        :param missing:
+            names of the fields to replace with their default without
+            validating them; see the missing_columns parameter
+        :returns:
+            tuple of (columns, keep, errors):
+
+            columns
+                dict of ``{field name (after name mapping): column}``,
+                as returned by :meth:`FuzzyField.parse_many`
+            keep
+                list of bools, one for every row; False if the row must be
+                discarded because of an error in a required field
+            errors
+                list of (row position, field, :class:`ValidationError`)
+                tuples, in the order they were reported. field is None for
+                the errors of the unique_together constraints.
+        """
+        columns = {}
+        field_columns = []
+        errors = []
+        for field_idx, field in enumerate(self.fields.values()):
+            out_name = self.name_map.get(field.name, field.name)
+            if field.name in missing:
+                # Already reported by _check_header()
+                column = [field.default] * len(positions)
+            else:
+                column, field_errors = field.parse_many(
+                    get_column(field.name))
+                # parse_many() already replaced invalid values with the
+                # default
+                for i, exc in field_errors.items():
+                    errors.append((i, field_idx, field, exc))
+            columns[out_name] = column
+            field_columns.append(column)
+
+        errors.sort(key=lambda e: e[:2])
+        keep = [True] * len(positions)
+        for i, _, field, exc in errors:
+            # If a required field has an error, discard the whole line
+            if field.required:
+                keep[i] = False
+
+        reported = []
+
+        def report(i, field, exc):
+            exc.record_num, exc.line_num = positions[i]
+            reported.append((i, field, exc))
+            self._error_handler(exc)
+
+        if not self.unique_together_values:
+            for i, _, field, exc in errors:
+                report(i, field, exc)
+            return columns, keep, reported
+
+        # Check the unique_together constraints row by row, and report their
+        # errors after those of the fields of the same row
+        row_idx = 0
+        check_unique = self._unique_check(
+            lambda name, error, *_: report(row_idx, None,
+                                           make_error(name, error)))
+        field_names = list(self.fields)
+        key_idx = {field_names.index(name)
+                   for names in self.unique_together_values
+                   for name in names}
+        key_columns = [_to_list(column) if j in key_idx else None
+                       for j, column in enumerate(field_columns)]
+
+        errors = collections.deque(errors)
+        for row_idx in range(len(positions)):
+            while errors and errors[0][0] == row_idx:
+                i, _, field, exc = errors.popleft()
+                report(i, field, exc)
+            if keep[row_idx] and not check_unique(tuple([
+                    None if column is None else column[row_idx]
+                    for column in key_columns])):
+                keep[row_idx] = False
+
+        return columns, keep, reported
+
+    @property
+    def _has_postprocess_row(self) -> bool:
+        """True if a child class overrides :meth:`DictReader.postprocess_row`
+        """
+        return type(self).postprocess_row is not DictReader.postprocess_row
+
+    def _postprocess_columns(self, columns: Dict[str, Any],
+                             keep: List[bool]) -> List[tuple]:
+        """Reassemble the output of :meth:`DictReader._parse_columns` into
+        rows and pass them through :meth:`DictReader.postprocess_row`
+
+        :returns:
+            list of (row position, row) tuples
+        """
+        names = list(columns)
+        out_rows = []
+        for i, values in enumerate(zip(
+                *(_to_list(col) for col in columns.values()))):
+            if not keep[i]:
+                continue
+            out = self.postprocess_row(dict(zip(names, values)))
+            if out is not None:
+                out_rows.append((i, out))
+        return out_rows
+
+    def validate_dataframe(self, df: Any) -> tuple:
+        """Validate a :class:`pandas.DataFrame` column by column with
+        :meth:`FuzzyField.parse_many`, without converting it to dicts first.
+
+        The iterable passed to ``__init__`` is ignored and can be None.
+        Error handling follows the ``errors`` parameter of ``__init__``,
+        and record numbers are the positions of the rows in the DataFrame,
+        counting from 0. Rows where all cells are null or blank strings are
+        discarded. :meth:`~DictReader.preprocess_row` is not invoked;
+        :meth:`~DictReader.postprocess_row` is invoked for every row if
+        overridden, which carries a performance penalty.
+
+        :param df:
+            :class:`pandas.DataFrame` with one column for every field, before
+            name mapping. Missing columns are treated as empty, and columns
+            that don't match any field are ignored.
+        :returns:
+            tuple of (validated, errors):
+
+            validated
+                :class:`pandas.DataFrame` with one column for every field,
+                after name mapping, and the same index as the input minus the
+                discarded rows
+            errors
+                :class:`pandas.DataFrame` with one row for every validation
+                error and columns:
+
+                - record_num (int)
+                - field (str, before name mapping)
+                - value (raw input value)
+                - error (str, the name of the exception class)
+                - message (str)
+
+                For the constraints of ``unique_together``, field lists the
+                names of the fields and value is the tuple of their parsed
+                values.
+        """
+        import numpy
+        import pandas
+
+        # Strip spurious whitespace from column headers
+        # If this causes duplicate names, the rightmost column wins
+        df = df.rename(columns=lambda k: k.strip() if isinstance(k, str)
+                       else k)
+        df = df.loc[:, ~df.columns.duplicated(keep='last')]
+
+        # Skip completely blank rows. Stop testing a row as soon as a
+        # non-blank cell is found.
+        blank = numpy.ones(len(df), dtype=bool)
+        for _, col in df.items():
+            idx = numpy.flatnonzero(blank)
+            if not len(idx):
+                break
+            cells = col.to_numpy()[idx]
+            is_blank = pandas.isnull(cells)
+            if cells.dtype == object:
+                is_blank |= numpy.array(
+                    [isinstance(cell, str) and not cell.strip()
+                     for cell in cells], dtype=bool)
+            blank[idx] = is_blank
+        record_nums = numpy.flatnonzero(~blank).tolist()
+        df = df.iloc[record_nums]
+
+        def get_column(name):
+            try:
+                return df[name]
+            except KeyError:
+                return [None] * len(df)
+
+        self.record_num = len(blank) - 1
+        self._reset_error_budget()
+        columns, keep, errors = self._parse_columns(
+            get_column, [(record_num, None) for record_num in record_nums])
+
+        if self._has_postprocess_row:
+            out_rows = self._postprocess_columns(columns, keep)
+            validated = pandas.DataFrame(
+                [row for _, row in out_rows],
+                index=df.index[[i for i, _ in out_rows]],
+                columns=None if out_rows else list(columns))
+        else:
+            validated = pandas.DataFrame(columns, index=df.index)[keep]
+
+        errors = pandas.DataFrame(
+            [(exc.record_num, exc.name, _raw_value(df, i, field, exc),
+              type(exc).__name__, str(exc))
+             for i, field, exc in errors],
+            columns=['record_num', 'field', 'value', 'error', 'message'])
+        return validated, errors
+
+    def validate_arrow(self, data: Any, *, batch_size: int = None
+                       ) -> Iterator[tuple]:
+        """Validate `Apache Arrow <https://arrow.apache.org>`_ data column by
+        column with :meth:`FuzzyField.parse_many`, without converting it to
+        dicts first. Requires pyarrow.
+
+        Columns are matched to the fields in the same way as
+        :meth:`~DictReader.validate_dataframe`, which also describes the
+        handling of blank rows, errors and record numbers, and of
+        :meth:`~DictReader.preprocess_row` and
+        :meth:`~DictReader.postprocess_row`. Record numbers keep counting
+        across batches.
+
+        Numeric and boolean columns are passed to
+        :meth:`~FuzzyField.parse_many` as :class:`numpy.ndarray` without
+        building a Python object for every cell. Nullable integer columns
+        are converted to float64 when all their values can be represented
+        exactly, and nullable boolean columns are always converted to
+        float64.
+
+        :param data:
+            :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch`, or any
+            iterable of :class:`pyarrow.RecordBatch`, e.g.
+            :meth:`pyarrow.parquet.ParquetFile.iter_batches`
+        :param int batch_size:
+            Maximum number of rows to validate at once. Input batches that
+            are longer than this are split. Default: validate the input
+            batches, or the chunks of the Table, as they are.
+        :returns:
+            iterator of (validated, errors) tuples of
+            :class:`pyarrow.RecordBatch`, one for every batch:
+
+            validated
+                one column for every field, after name mapping. Fields that
+                output float64, int64, bool or datetime64 when calling
+                :meth:`~DictReader.to_arrays` produce columns of the matching
+                Arrow type, with nulls instead of None or NaN; the types of
+                all other columns are inferred by :func:`pyarrow.array`.
+            errors
+                one row for every validation error and columns:
+
+                - record_num (int64)
+                - field (string, before name mapping)
+                - value (string, the raw input value converted to str)
+                - error (string, the name of the exception class)
+                - message (string)
+
+                For the constraints of ``unique_together``, field lists the
+                names of the fields and value is the tuple of their parsed
+                values.
+        """
+        import pyarrow
+
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1; got {batch_size}")
+        if isinstance(data, pyarrow.Table):
+            data = data.to_batches()
+        elif isinstance(data, pyarrow.RecordBatch):
+            data = [data]
+
+        types = {
+            self.name_map.get(field.name, field.name): _arrow_type(field)
+            for field in self.fields.values()
+        }
+        self.record_num = -1
+        self._reset_error_budget()
+        offset = 0
+        for batch in data:
+            step = batch_size or batch.num_rows
+            for start in range(0, batch.num_rows, step):
+                yield self._validate_arrow_batch(
+                    batch.slice(start, step), offset + start, types)
+            offset += batch.num_rows
+
+    def _validate_arrow_batch(self, batch: Any, offset: int,
+                              types: Dict[str, Any]) -> tuple:
+        """Validate a single :class:`pyarrow.RecordBatch` for
+        :meth:`DictReader.validate_arrow`
+
+        :param batch:
+            :class:`pyarrow.RecordBatch`
+        :param int offset:
+            record number of the first row of the batch
+        :param types:
+            dict of ``{field name (after name mapping): Arrow type or None}``
+        """
+        import numpy
+        import pyarrow
+
+        # Strip spurious whitespace from column headers
+        # If this causes duplicate names, the rightmost column wins
+        columns = {}
+        for name, column in zip(batch.schema.names, batch.columns):
+            if pyarrow.types.is_dictionary(column.type):
+                column = column.dictionary_decode()
+            columns[name.strip()] = column
+
+        # Skip completely blank rows
+        blank = _arrow_blank_rows(columns.values(), batch.num_rows)
+        record_nums = (numpy.flatnonzero(~blank) + offset).tolist()
+        if blank.any():
+            mask = pyarrow.array(~blank)
+            columns = {name: col.filter(mask) for name, col in columns.items()}
+
+        def get_column(name):
+            try:
+                return _from_arrow(columns[name])
+            except KeyError:
+                return [None] * len(record_nums)
+
+        self.record_num = offset + batch.num_rows - 1
+        parsed, keep, errors = self._parse_columns(
+            get_column, [(record_num, None) for record_num in record_nums])
+
+        def to_batch(keep):
+            return pyarrow.RecordBatch.from_arrays(
+                [_to_arrow(_compress(col, keep), types[name])
+                 for name, col in parsed.items()],
+                names=list(parsed))
+
+        if self._has_postprocess_row:
+            out_rows = [row for _, row
+                        in self._postprocess_columns(parsed, keep)]
+            if out_rows:
+                validated = pyarrow.RecordBatch.from_pylist(out_rows)
+            else:
+                validated = to_batch([False] * len(keep))
+        else:
+            validated = to_batch(keep)
+
+        values = []
+        for i, field, exc in errors:
+            if field is None:
+                # unique_together
+                value = exc.value
+            else:
+                try:
+                    value = columns[field.name][i].as_py()
+                except KeyError:
+                    value = None
+            values.append(None if value is None else str(value))
+
+        errors = pyarrow.RecordBatch.from_arrays([
+            pyarrow.array([exc.record_num for _, _, exc in errors],
+                          pyarrow.int64()),
+            pyarrow.array([exc.name for _, _, exc in errors],
+                          pyarrow.string()),
+            pyarrow.array(values, pyarrow.string()),
+            pyarrow.array([type(exc).__name__ for _, _, exc in errors],
+                          pyarrow.string()),
+            pyarrow.array([str(exc) for _, _, exc in errors],
+                          pyarrow.string()),
+        ], schema=_arrow_errors_schema())
+        return validated, errors
+
+    def write_parquet(self, data: Any, path: Any, errors_path: Any = None, *,
+                      schema: Any = None, batch_size: int = None,
+                      **kwargs) -> None:
+        """Validate Apache Arrow data with :meth:`DictReader.validate_arrow`
+        and stream the validated data and, optionally, the errors to Parquet
+        files. Only one batch at a time is held in memory. Requires pyarrow.
+
+        :param data:
+            :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch`, or any
+            iterable of :class:`pyarrow.RecordBatch`. To convert a Parquet
+            file with bounded memory, pass
+            ``pyarrow.parquet.ParquetFile(path).iter_batches()``.
+        :param path:
+            path or writable binary file-like object for the validated data
+        :param errors_path:
+            path or writable binary file-like object for the errors table
+            (see :meth:`~DictReader.validate_arrow`). Default: don't write
+            the errors, which are still reported according to the ``errors``
+            parameter of ``__init__``.
+        :param schema:
+            :class:`pyarrow.Schema` of the validated data. Every batch is
+            cast to it. Default: the schema of the first batch, where
+            columns that are entirely null have the type of the matching
+            field in :meth:`~DictReader.validate_arrow` if any. Set it if
+            a column, e.g. of a :class:`String` field, can be entirely null
+            in the first batch.
+        :param int batch_size:
+            See :meth:`DictReader.validate_arrow`
+        :param kwargs:
+            Parameters to :class:`pyarrow.parquet.ParquetWriter`, e.g.
+            compression
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        writer = errors_writer = None
+        try:
+            if errors_path is not None:
+                errors_writer = pyarrow.parquet.ParquetWriter(
+                    errors_path, _arrow_errors_schema(), **kwargs)
+
+            for validated, errors in self.validate_arrow(
+                    data, batch_size=batch_size):
+                if writer is None:
+                    if schema is None:
+                        schema = self._arrow_schema(validated.schema)
+                    writer = pyarrow.parquet.ParquetWriter(
+                        path, schema, **kwargs)
+                writer.write_table(
+                    pyarrow.Table.from_batches([validated]).cast(schema))
+                if errors_writer is not None and errors.num_rows:
+                    errors_writer.write_table(
+                        pyarrow.Table.from_batches([errors]))
+
+            if writer is None:
+                # No input batches
+                if schema is None:
+                    schema = self._arrow_schema()
+                writer = pyarrow.parquet.ParquetWriter(path, schema, **kwargs)
+        finally:
+            if writer is not None:
+                writer.close()
+            if errors_writer is not None:
+                errors_writer.close()
+
+    def _arrow_schema(self, inferred: Any = None) -> Any:
+        """Build the schema of the Parquet file for
+        :meth:`DictReader.write_parquet`
+
+        :param inferred:
+            :class:`pyarrow.Schema` of the first validated batch, or None
+            if there are no batches
+        """
+        import pyarrow
+
+        if inferred is None:
+            inferred = pyarrow.schema([
+                (self.name_map.get(field.name, field.name), pyarrow.null())
+                for field in self.fields.values()
+            ])
+        fields = {
+            self.name_map.get(field.name, field.name): field
+            for field in self.fields.values()
+        }
+        out = []
+        for arrow_field in inferred:
+            if (pyarrow.types.is_null(arrow_field.type)
+                    and arrow_field.name in fields):
+                type_ = _arrow_type(fields[arrow_field.name])
+                if type_ is not None:
+                    arrow_field = arrow_field.with_type(type_)
+            out.append(arrow_field)
+        return pyarrow.schema(out)
+
+    def _clean_row(self, row: Any, columns: Tuple[str, ...] = None
+                   ) -> Union[Dict[str, Any], None]:
+        """Give child classes a chance to alter the row with
+        :meth:`DictReader.preprocess_row`, then discard unexpected columns and
+        strip spurious whitespace from column headers.
+
+        :param columns:
+            column names if the rows are positional (see the header
+            parameter), or None if they are dicts
+        :returns:
+            cleaned row, or None if the row should be skipped
+        """
+        # Give child classes a chance to alter the row before parsing it
+        row = self.preprocess_row(row)
+        if row is None:
+            return None
+        if columns is not None:
+            # Positional row. Like csv.DictReader, ignore excess cells and pad
+            # short rows with None.
+            row = dict(zip(columns, row))
+        return self._strip_row(row)
+
+    @staticmethod
+    def _strip_row(row: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+        """Discard unexpected columns and strip spurious whitespace from
+        column headers.
+
+        :returns:
+            stripped row, or None if the row is blank
+        """
+        # csv.DictReader stores unexpected columns under the None key.
+        # Discard them.
+        row.pop(None, None)
+        # Skip completely blank rows
+        if all(isinstance(cell, str) and not cell.strip() or cell is None
+               for cell in row.values()):
+            return None
+        # Strip spurious whitespace from column headers
+        return {k.strip(): v for k, v in row.items()}
+
     @property
     def line_num(self) -> int:
         """Return line number of underlying file.
@@ -215,17 +1904,18 @@ class DictReader:
         """
         return self.iterable.line_num
 
-    def preprocess_row(self, row: Any) -> Dict[str, Any]:
+    def preprocess_row(self, row: Any) -> Union[Dict[str, Any], Sequence[Any]]:
         """Give child classes an opportunity to pre-process every row before
         feeding it to the FuzzyFields. This allows handling special cases.
 
-        You must use this method to manipulate the row if the underlying
-        iterator does not natively yields dicts, e.g. a :func:`csv.reader`
-        object.
+        If the underlying iterator yields neither dicts nor positional rows
+        that can be described by the ``header`` parameter, you must use this
+        method to convert the rows to dicts.
 
         :param row:
             The row as read by self.iterable, with all names and
-            before name mapping
+            before name mapping. If the ``header`` parameter is set, a
+            positional row, which must be returned as a list or tuple.
         :return:
             modified row, or None if the row should be skipped
         """
@@ -242,3 +1932,267 @@ class DictReader:
             Modified row, or None if the row should be skipped
         """
         return row
+
+
+#: Number of rows after which :meth:`DictReader._fill_buffers` flushes the
+#: buffers
+_BUFFER_FLUSH_ROWS = 4096
+
+_worker_fields: List[Union[FuzzyField, None]] = []
+"""Fields of the :class:`DictReader` being iterated upon by the current
+worker process. See :func:`_init_worker`.
+"""
+
+
+def _init_worker(fields: List[Union[FuzzyField, None]]) -> None:
+    """Initializer of the worker processes for
+    :meth:`DictReader._iter_parallel`
+
+    :param fields:
+        copies of the fields of the DictReader, in order, or None for the
+        fields that are validated by the parent process
+    """
+    global _worker_fields
+    _worker_fields = fields
+
+
+def _parse_chunk(rows: List[Dict[str, Any]]
+                 ) -> List[Tuple[list, Dict[int, Any]]]:
+    """Validate a chunk of rows in a worker process
+
+    :param rows:
+        rows cleaned by :meth:`DictReader._clean_row`
+    :returns:
+        list of (values, errors) tuples, one for every row, where values is
+        the list of parsed values, one for every field (None for fields
+        validated by the parent) and errors is a dict of
+        ``{field index: error}``, where error is as returned by
+        :meth:`FuzzyField.try_parse`.
+        The values of unique fields are not postprocessed.
+    """
+    out = []
+    for row in rows:
+        values = []
+        errors = {}
+        for field_idx, field in enumerate(_worker_fields):
+            value = None
+            if field is not None:
+                value = row.get(field.name, None)
+                if field.unique:
+                    try:
+                        value = field._validate_raw(value)
+                    except ValidationError as exc:
+                        errors[field_idx] = exc
+                else:
+                    ok, value = field.try_parse(value)
+                    if not ok:
+                        errors[field_idx] = value
+                        value = None
+            values.append(value)
+        out.append((values, errors))
+    return out
+
+
+def _raw_value(df: Any, i: int, field: Optional[FuzzyField],
+               exc: ValidationError) -> Any:
+    """Return the raw value of an error of :meth:`DictReader._parse_columns`
+    for :meth:`DictReader.validate_dataframe`. The value of the errors of
+    the unique_together constraints is the tuple of the parsed values.
+    """
+    if field is None:
+        return exc.value
+    if field.name in df:
+        return df[field.name].iat[i]
+    return None
+
+
+def _to_list(column: Any) -> list:
+    """Convert a column returned by :meth:`FuzzyField.parse_many` to a list of
+    the same objects that :meth:`FuzzyField.parse` would return
+    """
+    if isinstance(column, list):
+        return column
+    if column.dtype.kind in 'biufO':
+        return column.tolist()
+    # tolist() would convert datetime64[ns] to int
+    return list(column)
+
+
+def _compress(column: Any, keep: List[bool]) -> Any:
+    """Select the elements of a column returned by
+    :meth:`FuzzyField.parse_many` where keep is True
+    """
+    if isinstance(column, list):
+        return [value for value, k in zip(column, keep) if k]
+    return column[keep]
+
+
+def _arrow_type(field: FuzzyField) -> Any:
+    """Return the Arrow type matching the typed buffer of a field (see
+    :meth:`FuzzyField._new_buffer`), or None if it must be inferred from the
+    values
+    """
+    import numpy
+    import pyarrow
+    from .buffers import CategoricalBuffer
+
+    buf = field._new_buffer()
+    if buf.dtype is object or isinstance(buf, CategoricalBuffer):
+        return None
+    return pyarrow.from_numpy_dtype(numpy.dtype(buf.dtype))
+
+
+def _arrow_errors_schema() -> Any:
+    """Schema of the errors tables of :meth:`DictReader.validate_arrow`
+    """
+    import pyarrow
+
+    return pyarrow.schema([
+        ('record_num', pyarrow.int64()),
+        ('field', pyarrow.string()),
+        ('value', pyarrow.string()),
+        ('error', pyarrow.string()),
+        ('message', pyarrow.string()),
+    ])
+
+
+def _arrow_blank_rows(columns: Iterable, num_rows: int) -> Any:
+    """Find the rows where all cells are null, NaN, or blank strings
+
+    :param columns:
+        iterable of :class:`pyarrow.Array`
+    :param int num_rows:
+        number of rows
+    :returns:
+        :class:`numpy.ndarray` of bools
+    """
+    import numpy
+    import pyarrow
+    import pyarrow.compute as pc
+
+    blank = None
+    for column in columns:
+        is_blank = pc.is_null(column, nan_is_null=True)
+        if (pyarrow.types.is_string(column.type)
+                or pyarrow.types.is_large_string(column.type)):
+            is_blank = pc.or_(is_blank, pc.fill_null(
+                pc.equal(pc.utf8_trim_whitespace(column), ''), False))
+        blank = is_blank if blank is None else pc.and_(blank, is_blank)
+    if blank is None:
+        return numpy.ones(num_rows, dtype=bool)
+    return blank.to_numpy(zero_copy_only=False)
+
+
+def _from_arrow(column: Any) -> Any:
+    """Convert a :class:`pyarrow.Array` to a :class:`numpy.ndarray` for
+    :meth:`FuzzyField.parse_many`. Numeric and boolean columns don't create
+    a Python object for every cell.
+    """
+    import numpy
+    import pyarrow
+    import pyarrow.compute as pc
+
+    type_ = column.type
+    if column.null_count:
+        if pyarrow.types.is_boolean(type_):
+            # Boolean accepts 0.0 and 1.0; nulls become NaN
+            return column.cast(pyarrow.float64()).to_numpy(
+                zero_copy_only=False)
+        if pyarrow.types.is_integer(type_):
+            min_max = pc.min_max(column)
+            low, high = min_max['min'].as_py(), min_max['max'].as_py()
+            if low is None or (-2 ** 53 <= low and high <= 2 ** 53):
+                return column.cast(pyarrow.float64()).to_numpy(
+                    zero_copy_only=False)
+            # float64 would lose precision
+            return numpy.array(column.to_pylist(), dtype=object)
+    if pyarrow.types.is_timestamp(type_) and type_.tz is not None:
+        # to_numpy() would discard the timezone
+        return numpy.array(column.to_pylist(), dtype=object)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _to_arrow(column: Any, type_: Any) -> Any:
+    """Convert a column returned by :meth:`FuzzyField.parse_many` to a
+    :class:`pyarrow.Array`. None and NaN become null.
+
+    :param column:
+        list or :class:`numpy.ndarray`
+    :param type_:
+        Arrow type, or None to infer it. If the values don't fit the type,
+        e.g. an integer that overflows int64, it is inferred.
+    """
+    import pyarrow
+
+    if type_ is not None:
+        try:
+            return pyarrow.array(column, type=type_, from_pandas=True)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError,
+                OverflowError, TypeError):
+            pass
+    return pyarrow.array(column, from_pandas=True)
+
+
+def _has_default_parse(field: FuzzyField) -> bool:
+    """Return True if :meth:`FuzzyField.parse` of an optional, non-unique
+    field always returns the field default when the value is None
+    """
+    cls = type(field)
+    return (cls.parse is FuzzyField.parse
+            and cls.preprocess is FuzzyField.preprocess
+            and cls.postprocess is FuzzyField.postprocess)
+
+
+def _make_slots_class(typename: str, names: Tuple[str, ...]) -> type:
+    """Build a lightweight record class with ``__slots__``, for
+    DictReader(output='slots')
+
+    :param str typename:
+        name of the new class
+    :param names:
+        attribute names
+    """
+    for name in names:
+        if (not isinstance(name, str) or not name.isidentifier()
+                or keyword.iskeyword(name) or name.startswith('_')):
+            raise ValueError("output='slots' requires field names that are "
+                             "valid identifiers and don't start with an "
+                             f"underscore; got {name!r}")
+
+    source = '\n'.join(
+        [f'def __init__(self, {", ".join(names)}):']
+        + [f'    self.{name} = {name}' for name in names]
+        + ['    pass'])
+    namespace = {}
+    exec(source, namespace)
+
+    def __iter__(self):
+        for name in names:
+            yield getattr(self, name)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        # Like tuple, hashable as long as all values are
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return '%s(%s)' % (typename, ', '.join(
+            f'{name}={value!r}' for name, value in zip(names, self)))
+
+    def _asdict(self):
+        return dict(zip(names, self))
+
+    return type(typename, (), {
+        '__slots__': names,
+        '__init__': namespace['__init__'],
+        '__iter__': __iter__,
+        '__eq__': __eq__,
+        '__hash__': __hash__,
+        '__repr__': __repr__,
+        '_asdict': _asdict,
+        '_fields': names,
+    })
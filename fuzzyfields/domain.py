@@ -1,13 +1,59 @@
-import pickle
-from typing import Any, Iterable
+import collections.abc
+from typing import Any, Callable, Iterable, Tuple
+from .buffers import CategoricalBuffer, ObjectBuffer
 from .fuzzyfield import FuzzyField
-from .errors import DomainError, FieldTypeError, MalformedFieldError
+from .errors import DomainError, make_error
 from .numbers import Float
+from .tools import canonical_key, map_str
+from .uniqueness import UniqueStore
 
 
 _float_parser = Float()
 
 
+class _ChoicesStr:
+    """String representation of the choices of a :class:`Domain` for the
+    error messages: the sorted choices, separated by commas, truncated to
+    200 characters. It is only built when the message is first rendered, so
+    that validating values against a large domain that changes at runtime
+    doesn't need to sort it again for every value. Compares equal to, and
+    pickles to, a plain str.
+    """
+    __slots__ = ('choices', '_str')
+
+    def __init__(self, choices: Iterable):
+        self.choices = choices
+        self._str = None
+
+    def __str__(self) -> str:
+        if self._str is None:
+            if isinstance(self.choices, UniqueStore):
+                self._str = repr(self.choices)
+                return self._str
+            try:
+                sorted_choices = sorted(self.choices)
+            except TypeError:
+                # choices is a mix of incomparable types, e.g. (1, '2')
+                sorted_choices = sorted(self.choices, key=str)
+            res = ",".join(str(choice) for choice in sorted_choices)
+            if len(res) > 200:
+                res = res[:200] + '...'
+            self._str = res
+        return self._str
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other: Any) -> bool:
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __reduce__(self):
+        return str, (str(self), )
+
+
 class Domain(FuzzyField):
     """A field which can only accept a specific set of values
 
@@ -29,11 +75,29 @@ class Domain(FuzzyField):
         In the above example, the field 'CrossRef' must be one of the values
         that already appeared for the field 'ID'.
 
+        If choices is one of the memory-bounded stores of the ``unique_store``
+        parameter of :class:`FuzzyField`, values are looked up in it instead
+        of being copied, and are returned as they are received, or as int or
+        float for string representations of numbers. This can't be combined
+        with case_sensitive=False.
+
+        Changes to choices are detected by its length, without parsing it
+        again for every value: elements appended to a sequence are added
+        incrementally, and values are looked up directly in other
+        collections, e.g. a set, that grew since they were last parsed. In
+        the latter case, the values that are found are returned as they are
+        received. Removing values causes choices to be parsed again.
+        Changes that don't alter the length of choices, e.g. replacing an
+        element of a list, are not detected.
+
         passthrough comes with a performance cost; set it to False
         (the default) to allow for optimisations. This assumes that neither
         the choices collection nor the objects it contains will change in the
         future.
 
+        passthrough=True can't be combined with the ``cache`` parameter of
+        :class:`FuzzyField`.
+
     :param kwargs:
         extra parameters for :class:`FuzzyField`
     """
@@ -41,43 +105,106 @@ class Domain(FuzzyField):
     case_sensitive: bool
     passthrough: bool
 
+    _runtime_attributes = FuzzyField._runtime_attributes | {
+        '_choices_map', '_choices_len', '_choices_stale', '_choices_str',
+        '_has_numeric_choices'}
+
     def __init__(self, choices: Iterable, *, case_sensitive: bool = True,
                  passthrough: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.choices = choices
         self.case_sensitive = case_sensitive
         self.passthrough = passthrough
-        if not passthrough:
-            self._parse_choices()
+        if isinstance(choices, UniqueStore) and not case_sensitive:
+            raise ValueError("case_sensitive=False can't be used with "
+                             f"{type(choices).__name__}")
+        if passthrough and self.cache:
+            raise ValueError("cache can't be used together with "
+                             "passthrough=True")
+        self._parse_choices()
 
     def _parse_choices(self) -> None:
         """Parse choices and update several cache fields.
-        This needs to be invoked after every time choices changes.
+        This needs to be invoked after every time choices changes; with
+        passthrough=True, :meth:`Domain._sync_choices` takes care of it.
         """
         self._has_numeric_choices = False
         self._choices_map = {}
+        self._choices_str = _ChoicesStr(self.choices)
+
+        if isinstance(self.choices, UniqueStore):
+            # Look up all values directly in the store
+            self._choices_len = None
+            self._choices_stale = True
+            return
+
+        self._add_choices(self.choices)
+        try:
+            self._choices_len = len(self.choices)
+        except TypeError:
+            # Not a collection; parse it again every time
+            self._choices_len = None
+        self._choices_stale = False
 
-        for v in self.choices:
+    def _add_choices(self, choices: Iterable) -> None:
+        """Add choices to the cache fields built by
+        :meth:`Domain._parse_choices`
+        """
+        choices_map = self._choices_map
+        for v in choices:
             k = v
             if isinstance(v, str) and not self.case_sensitive:
                 k = v.lower()
             elif isinstance(v, (int, float, complex)):
                 self._has_numeric_choices = True
             try:
-                self._choices_map[k] = v
+                choices_map[k] = v
             except TypeError:
-                k = pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)
-                self._choices_map[k] = v
+                choices_map[canonical_key(k)] = v
+
+    def _sync_choices(self) -> None:
+        """With passthrough=True, follow the changes to choices made since
+        the last parsed value, without parsing again the whole collection:
 
-        # Build sorted list of choices, used for string representations
+        - if choices didn't change size, assume it didn't change at all;
+        - if choices shrank, parse it again;
+        - if choices is a sequence, e.g. a list, that grew, parse the new
+          elements at its end;
+        - if choices is any other collection, e.g. the seen_values of
+          another field, and case_sensitive=True, look up values that aren't
+          found among the choices parsed so far directly in choices (see
+          :meth:`Domain._lookup_live`);
+        - otherwise, parse choices again.
+
+        The sorted string representation of the choices for the error
+        messages is only rebuilt when it's rendered.
+        """
+        choices = self.choices
+        if self._choices_stale and self._choices_len is None:
+            # UniqueStore; nothing to do
+            return
         try:
-            sorted_choices = sorted(self.choices)
+            num_choices = len(choices)
         except TypeError:
-            # choices is a mix of incomparable types, e.g. (1, '2')
-            sorted_choices = sorted(self.choices, key=str)
-        self._choices_str = ",".join(str(choice) for choice in sorted_choices)
-        if len(self._choices_str) > 200:
-            self._choices_str = self._choices_str[:200] + '...'
+            self._parse_choices()
+            return
+
+        old_num_choices = self._choices_len
+        if num_choices == old_num_choices:
+            return
+        if old_num_choices is None or num_choices < old_num_choices:
+            # Never parsed, or values were removed
+            self._parse_choices()
+            return
+        if isinstance(choices, collections.abc.Sequence):
+            self._add_choices(choices[old_num_choices:])
+        elif self.case_sensitive:
+            self._choices_stale = True
+        else:
+            self._parse_choices()
+            return
+        self._choices_len = num_choices
+        self._choices_str = _ChoicesStr(choices)
 
     def validate(self, value: Any) -> Any:
         """Validate and convert the input
@@ -85,47 +212,133 @@ class Domain(FuzzyField):
         :raises DomainError:
             if the value is not one of the defined choices
         """
+        ok, res = self._try_validate_func(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Non-raising implementation of :meth:`Domain.validate`.
+        See :meth:`FuzzyField._compile_try_validate`.
+        """
+        passthrough = self.passthrough
+        case_sensitive = self.case_sensitive
+        float_parser = _float_parser._try_validate_func
+        missing = object()
+
+        def try_validate(value):
+            if passthrough:
+                self._sync_choices()
+            choices_map = self._choices_map
+
+            k = value
+            if isinstance(value, str) and not case_sensitive:
+                k = k.lower()
+
+            # This first paragraph quickly satisfies most use cases.
+            # Note that this returns the representation provided in the
+            # choices; e.g. Domain(choices=[1]).parse(1.0) returns 1
+            try:
+                res = choices_map.get(k, missing)
+            except TypeError:
+                # Unhashable
+                k = canonical_key(k)
+                res = choices_map.get(k, missing)
+            if res is not missing:
+                return True, res
+
+            # Deal with string representation of numbers
+            if self._has_numeric_choices and isinstance(k, str):
+                ok, num = float_parser(k)
+                if ok:
+                    res = choices_map.get(num, missing)
+                    if res is not missing:
+                        return True, res
+
+            if self._choices_stale:
+                ok, res = self._lookup_live(value, k)
+                if ok:
+                    return True, res
+
+            return False, (DomainError, value, self._choices_str)
+
+        return try_validate
+
+    def _lookup_live(self, value: Any, key: Any) -> Tuple[bool, Any]:
+        """Look up a value that was not found among the parsed choices
+        directly in choices, when they can't be parsed incrementally, e.g.
+        a set that grew or a :class:`~fuzzyfields.uniqueness.UniqueStore`,
+        which can't be iterated upon efficiently. Only for
+        case_sensitive=True.
+
+        :param value:
+            value to validate
+        :param key:
+            value, or its :func:`~fuzzyfields.tools.canonical_key` if
+            unhashable
+        :returns:
+            tuple of (found, value), where value is returned as it is
+            received, or as int or float for string representations of
+            numbers
+        """
+        choices = self.choices
+        if key in choices:
+            return True, value
+
+        # Deal with string representation of numbers
+        if isinstance(key, str):
+            ok, num = _float_parser._try_validate_func(key)
+            if not ok:
+                return False, None
+            if num.is_integer():
+                num = int(num)
+            if num in choices:
+                return True, num
+        return False, None
+
+    def _validate_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Domain.validate`.
+        See :meth:`FuzzyField._validate_many`.
+
+        Only hashable values that are found as-is in the choices are
+        validated here; string representations of numbers, unhashable values
+        and values out of the domain are left to :meth:`Domain.validate`.
+        """
+        import numpy
+        import pandas
+
         if self.passthrough:
-            self._parse_choices()
+            self._sync_choices()
+        if not self._choices_map:
+            # Empty domain, or UniqueStore
+            return (numpy.empty(values.shape, dtype=object),
+                    numpy.zeros(values.shape, dtype=bool))
 
-        k = value
-        if isinstance(value, str) and not self.case_sensitive:
-            k = k.lower()
+        keys = values
+        if not self.case_sensitive:
+            keys = map_str(str.lower, keys)
 
-        # This first paragraph quickly satisfies most use cases.
-        # Note that this returns the representation provided in the choices;
-        # e.g. Domain(choices=[1]).parse(1.0) returns 1
+        index = pandas.Index(list(self._choices_map), dtype=object)
         try:
-            return self._choices_map[k]
-        except KeyError:
-            pass
+            pos = index.get_indexer(keys)
         except TypeError:
             # Unhashable
-            k = pickle.dumps(k, protocol=pickle.HIGHEST_PROTOCOL)
-            try:
-                return self._choices_map[k]
-            except KeyError:
-                pass
-
-        # Deal with string representation of numbers
-        if self._has_numeric_choices and isinstance(k, str):
-            try:
-                k = _float_parser.validate(k)
-            except (FieldTypeError, MalformedFieldError):
-                pass
-            else:
-                try:
-                    return self._choices_map[k]
-                except KeyError:
-                    pass
+            return (numpy.empty(values.shape, dtype=object),
+                    numpy.zeros(values.shape, dtype=bool))
+        choices = pandas.Series(list(self._choices_map.values()),
+                                dtype=object).to_numpy()
+        return choices[pos], pos != -1
 
-        raise DomainError(self.name, value, self._choices_str)
+    def _new_buffer(self) -> ObjectBuffer:
+        return CategoricalBuffer()
 
     @property
     def sphinxdoc(self) -> str:
+        if isinstance(self.choices, UniqueStore):
+            return "Choice from a domain (dynamically defined at runtime)"
         if self.passthrough:
             if not self.choices:
                 return "Choice from a domain (dynamically defined at runtime)"
-            self._parse_choices()
+            self._sync_choices()
 
         return f"Any of: {self._choices_str}"
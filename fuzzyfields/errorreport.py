@@ -0,0 +1,226 @@
+"""Compact store of the validation errors collected by
+:class:`DictReader` with errors='collect'
+"""
+import csv
+import os
+from array import array
+from typing import (Any, Dict, IO, Iterable, Iterator, List, Optional,
+                    Tuple, Union)
+from .errors import ValidationError
+
+
+class ErrorReport:
+    """Columnar store of validation errors, which doesn't retain the
+    exception objects nor format their messages.
+
+    Every error is stored as a record number, a line number, a field code,
+    an error type code, and a reference to the raw value. The number of
+    errors and the first sample values for every combination of field and
+    error type are updated as the errors are collected.
+
+    :param fields:
+        names of the fields, before name mapping. Errors of other fields are
+        accepted too.
+    :param int max_samples:
+        number of sample values to keep for every combination of field and
+        error type
+    """
+    record_nums: array
+    """Record number of every error, counting from 0, or -1 if unavailable
+    """
+
+    line_nums: array
+    """Line number of every error, or -1 if unavailable
+    """
+
+    field_codes: array
+    """Index in :attr:`fields` of the field of every error
+    """
+
+    error_codes: array
+    """Index in :attr:`error_types` of the type of every error
+    """
+
+    values: List[Any]
+    """Raw value of every error, or None for :class:`MissingFieldError`
+    """
+
+    fields: List[Optional[str]]
+    """Field names, indexed by :attr:`field_codes`
+    """
+
+    error_types: List[type]
+    """Exception classes, indexed by :attr:`error_codes`
+    """
+
+    def __init__(self, fields: Iterable[str] = (), max_samples: int = 10):
+        if max_samples < 0:
+            raise ValueError(f"max_samples must be >= 0; got {max_samples}")
+        self.max_samples = max_samples
+        self.fields = list(fields)
+        self._field_codes = {name: i for i, name in enumerate(self.fields)}
+        self.error_types = []
+        self._error_codes = {}
+        self.clear()
+
+    def clear(self) -> None:
+        """Discard all collected errors
+        """
+        self.record_nums = array('q')
+        self.line_nums = array('q')
+        self.field_codes = array('i')
+        self.error_codes = array('i')
+        self.values = []
+        self._counts: Dict[Tuple[int, int], int] = {}
+        self._samples: Dict[Tuple[int, int], List[Any]] = {}
+
+    def append(self, exc: ValidationError) -> None:
+        """Collect an error
+
+        :param ValidationError exc:
+            exception with the record_num and line_num attributes set
+        """
+        self.add(exc.name, type(exc), getattr(exc, 'value', None),
+                 exc.record_num, exc.line_num)
+
+    def add(self, name: Optional[str], error_type: type, value: Any,
+            record_num: Optional[int] = None,
+            line_num: Optional[int] = None) -> None:
+        """Collect an error without building the exception object
+
+        :param str name:
+            field name
+        :param type error_type:
+            subclass of :class:`ValidationError`
+        :param value:
+            raw value
+        :param int record_num:
+            record number, or None if unavailable
+        :param int line_num:
+            line number, or None if unavailable
+        """
+        field_code = self._field_codes.get(name)
+        if field_code is None:
+            field_code = self._field_codes[name] = len(self.fields)
+            self.fields.append(name)
+        error_code = self._error_codes.get(error_type)
+        if error_code is None:
+            error_code = self._error_codes[error_type] = len(self.error_types)
+            self.error_types.append(error_type)
+
+        self.record_nums.append(-1 if record_num is None else record_num)
+        self.line_nums.append(-1 if line_num is None else line_num)
+        self.field_codes.append(field_code)
+        self.error_codes.append(error_code)
+        self.values.append(value)
+
+        key = field_code, error_code
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count < self.max_samples:
+            self._samples.setdefault(key, []).append(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Yield a (record_num, line_num, field, error, value) tuple for every
+        error, where error is the name of the exception class
+        """
+        for record_num, line_num, field_code, error_code, value in zip(
+                self.record_nums, self.line_nums, self.field_codes,
+                self.error_codes, self.values):
+            yield (record_num, line_num, self.fields[field_code],
+                   self.error_types[error_code].__name__, value)
+
+    @property
+    def counts(self) -> Dict[Tuple[Optional[str], str], int]:
+        """Number of errors, as a dict of ``{(field name, error name): count}``
+        in order of first occurrence
+        """
+        return {
+            (self.fields[f], self.error_types[e].__name__): count
+            for (f, e), count in self._counts.items()
+        }
+
+    @property
+    def field_counts(self) -> Dict[Optional[str], int]:
+        """Number of errors, as a dict of ``{field name: count}``
+        in order of first occurrence
+        """
+        out = {}
+        for (f, _), count in self._counts.items():
+            out[self.fields[f]] = out.get(self.fields[f], 0) + count
+        return out
+
+    @property
+    def samples(self) -> Dict[Tuple[Optional[str], str], List[Any]]:
+        """First raw values, as a dict of ``{(field name, error name): [value,
+        ...]}`` in order of first occurrence, with up to max_samples values
+        each
+        """
+        return {
+            (self.fields[f], self.error_types[e].__name__): list(values)
+            for (f, e), values in self._samples.items()
+        }
+
+    def __str__(self) -> str:
+        lines = [f"{len(self)} validation errors"]
+        samples = self.samples
+        for (field, error), count in self.counts.items():
+            line = f"Field {field}: {error}: {count}"
+            if samples.get((field, error)):
+                line += " (e.g. " + ", ".join(
+                    repr(value) for value in samples[field, error]) + ")"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"<ErrorReport: {len(self)} errors>"
+
+    def to_dataframe(self) -> Any:
+        """Return the errors as a :class:`pandas.DataFrame` with one row for
+        every error and columns:
+
+        - record_num (int, -1 if unavailable)
+        - line_num (int, -1 if unavailable)
+        - field (str, before name mapping)
+        - error (categorical, the name of the exception class)
+        - value (raw input value)
+        """
+        import numpy
+        import pandas
+
+        fields = numpy.empty(len(self.fields), dtype=object)
+        fields[:] = self.fields
+        return pandas.DataFrame({
+            'record_num': numpy.array(self.record_nums, dtype='i8'),
+            'line_num': numpy.array(self.line_nums, dtype='i8'),
+            'field': fields[numpy.array(self.field_codes, dtype=int)],
+            'error': pandas.Categorical.from_codes(
+                numpy.array(self.error_codes, dtype=int),
+                categories=[t.__name__ for t in self.error_types]),
+            'value': pandas.Series(self.values, dtype=object),
+        }, columns=['record_num', 'line_num', 'field', 'error', 'value'])
+
+    def to_csv(self, path_or_buf: Union[str, os.PathLike, IO[str]]
+               ) -> None:
+        """Write the errors to a CSV file with the same columns as
+        :meth:`ErrorReport.to_dataframe`. Unavailable record and line numbers
+        and None values are written as empty cells.
+
+        :param path_or_buf:
+            path, or file-like object opened in text mode with newline=''
+        """
+        if isinstance(path_or_buf, (str, os.PathLike)):
+            with open(path_or_buf, 'w', newline='') as fh:
+                self.to_csv(fh)
+            return
+
+        writer = csv.writer(path_or_buf)
+        writer.writerow(['record_num', 'line_num', 'field', 'error', 'value'])
+        for record_num, line_num, field, error, value in self:
+            writer.writerow([
+                '' if record_num == -1 else record_num,
+                '' if line_num == -1 else line_num,
+                field, error, value])
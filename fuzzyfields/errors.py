@@ -6,7 +6,7 @@
    So one must be very careful to allow the __init__ method to work with a
    single, dummy value.
 """
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 class ValidationError(Exception):
@@ -123,3 +123,52 @@ class MissingFieldError(ValidationError):
     """
     def __repr__(self) -> str:
         return f"{self.prefix}Missing or blank field"
+
+
+class ErrorBudgetError(ValidationError):
+    """The number of validation errors exceeded the ``max_errors`` parameter
+    of :class:`DictReader`, or their rate exceeded ``max_error_rate``.
+    The iteration is aborted.
+
+    :param dict counts:
+        ``{field name: number of errors}``
+    :param int num_errors:
+        total number of errors
+    :param int num_records:
+        number of records read so far
+    """
+    counts: Dict[Optional[str], int]
+    num_errors: int
+    num_records: int
+
+    def __init__(self, counts: Dict[Optional[str], int] = None,
+                 num_errors: int = 0, num_records: int = 0):
+        super().__init__(None)
+        self.counts = counts or {}
+        self.num_errors = num_errors
+        self.num_records = num_records
+
+    def __repr__(self) -> str:
+        counts = ", ".join(
+            f"{name}: {count}" for name, count in self.counts.items())
+        return (f"{self.prefix}Too many validation errors: {self.num_errors} "
+                f"errors in {self.num_records} records ({counts})")
+
+
+def make_error(name: Optional[str],
+               error: Union[ValidationError, Tuple[type, ...]]
+               ) -> ValidationError:
+    """Build the exception described by the error returned by
+    :meth:`FuzzyField.try_parse`
+
+    :param str name:
+        Field name
+    :param error:
+        either a :class:`ValidationError`, which is returned unchanged, or a
+        tuple of ``(exception class, *args)``, where args are the parameters
+        of the exception class after the field name
+    """
+    if isinstance(error, ValidationError):
+        return error
+    cls, *args = error
+    return cls(name, *args)
@@ -1,7 +1,11 @@
-import pickle
-from typing import Any, Optional
-from .errors import MissingFieldError, DuplicateError
-from .tools import NA_VALUES, isnull
+import copy
+import decimal
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from .buffers import ObjectBuffer
+from .errors import MissingFieldError, DuplicateError, ValidationError
+from .tools import NA_VALUES, canonical_key, isnull
+from .uniqueness import check_store, new_store
 
 
 class FuzzyField:
@@ -23,6 +27,39 @@ class FuzzyField:
         When FuzzyField instances are used as class attributes, the uniqueness
         check is performed across all instances of the owner class and its
         subclasses.
+    :param unique_store:
+        Storage of the values already seen by a field with unique=True:
+
+        'set' (default)
+            a :class:`set` of the values
+        'fingerprint'
+            a :class:`~fuzzyfields.FingerprintSet`, which takes
+            8 to 16 bytes per value at the cost of a tiny chance of false
+            duplicates. Requires numpy.
+        'disk'
+            a :class:`~fuzzyfields.SpillingSet`, which moves the
+            values to a temporary database on disk beyond 1 million values
+        callable
+            function without arguments that returns a new, empty, set-like
+            object, e.g. ``functools.partial(SpillingSet, max_size=10000)``.
+            It must be picklable to use :class:`DictReader` with workers > 1.
+    :param int cache:
+        Maximum number of distinct raw values for which the outcome of
+        :meth:`~FuzzyField.preprocess` and :meth:`~FuzzyField.validate`,
+        including any validation error, is memoized by
+        :meth:`~FuzzyField.parse` in a least-recently-used cache.
+        This can greatly speed up expensive fields, e.g. :class:`Timestamp`,
+        when the same raw values appear over and over.
+        The ``required`` and ``unique`` checks of
+        :meth:`~FuzzyField.postprocess` are still performed on every value.
+        Unhashable raw values are never cached. Raw values that are equal but
+        have a different type or, for numbers, representation (e.g. 1 and
+        1.0, or 0.0 and -0.0) are cached separately.
+        Default: 0 (disabled).
+
+        .. note::
+           The validated values are shared between all cache hits, so the
+           cache should only be enabled on fields whose output is immutable.
     """
 
     name: Optional[str]
@@ -39,23 +76,99 @@ class FuzzyField:
     default: Any
     description: str
     unique: bool
-    seen_values: set
-    """Record of already encountered values.
+    seen_values: Any
+    """Record of already encountered values; see the ``unique_store``
+    parameter. Unhashable values are recorded by their
+    :func:`~fuzzyfields.tools.canonical_key`.
     This attribute only exists if unique=True.
     """
+    unique_store: Union[str, Callable[[], Any]]
+    cache: int
+    """Maximum size of the cache of validated values; 0 if disabled
+    """
+    cache_hits: int
+    """Number of raw values found in the cache by :meth:`FuzzyField.parse`
+    """
+    cache_misses: int
+    """Number of hashable raw values that :meth:`FuzzyField.parse` did not
+    find in the cache and had to validate. Always 0 if the cache is disabled.
+    """
     owner: Any
     """The class to which the FuzzyField is attached to as a descriptor.
     None when used within the :doc:`dictreader` framework.
     """
 
+    _scalar_methods = ('preprocess', 'validate', 'postprocess', 'parse')
+    """Methods that define the behaviour of :meth:`FuzzyField.parse`.
+    See :meth:`FuzzyField.__init_subclass__`.
+    """
+    _kernel_methods = ('_validate_many', )
+    """Methods that implement the vectorized equivalent of
+    :meth:`FuzzyField.validate`. See :meth:`FuzzyField.__init_subclass__`.
+    """
+    _vectorized = False
+    """True if :meth:`FuzzyField.parse_many` can use the vectorized kernel
+    """
+    _try_methods = ('_compile_try_validate', )
+    """Methods that implement the non-raising equivalent of
+    :meth:`FuzzyField.validate`. See :meth:`FuzzyField.__init_subclass__`.
+    """
+    _native_try = False
+    """True if :meth:`FuzzyField.try_parse` can use the non-raising
+    implementation of the class
+    """
+    _runtime_attributes = frozenset({
+        '_parse_func', '_try_parse_func', '_try_validate_func', '_cache',
+        'cache_hits', 'cache_misses'})
+    """Attributes that change while parsing values and don't affect the
+    closure built by :meth:`FuzzyField._compile_parse`. Setting any other
+    attribute discards the closure. See :meth:`FuzzyField.__setattr__`.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Decide whether :meth:`FuzzyField.parse_many` can use the vectorized
+        kernel, :meth:`FuzzyField._validate_many`, of the new subclass, and
+        whether :meth:`FuzzyField.try_parse` can use its non-raising
+        implementation, :meth:`FuzzyField._compile_try_validate`.
+
+        Either is only used if it was defined by the same class, or a
+        subclass, of the one that last overrode any of the scalar methods.
+        This prevents a subclass that e.g. overrides
+        :meth:`~FuzzyField.validate` from silently inheriting a kernel that
+        no longer matches its behaviour.
+        """
+        super().__init_subclass__(**kwargs)
+
+        def owner(attr):
+            return next(klass for klass in cls.__mro__
+                        if attr in klass.__dict__)
+
+        def matches_scalar(methods):
+            owners = [owner(attr) for attr in methods]
+            last_owner = min(owners, key=cls.__mro__.index)
+            return last_owner is not FuzzyField and all(
+                issubclass(last_owner, owner(attr))
+                for attr in cls._scalar_methods)
+
+        cls._vectorized = matches_scalar(cls._kernel_methods)
+        cls._native_try = matches_scalar(cls._try_methods)
+
     def __init__(self, *, required: bool = True, default: Any = None,
-                 description: str = None, unique: bool = False):
+                 description: str = None, unique: bool = False,
+                 unique_store: Union[str, Callable[[], Any]] = 'set',
+                 cache: int = 0):
         self.required = required
         self.default = default
         self.description = description
         self.unique = unique
+        check_store(unique_store)
+        self.unique_store = unique_store
         if self.unique:
-            self.seen_values = set()
+            self.seen_values = new_store(unique_store)
+        if cache < 0:
+            raise ValueError(f"cache must be >= 0; got {cache}")
+        self.cache = cache
+        self.cache_clear()
         self.name = None
         self.owner = None
 
@@ -134,7 +247,7 @@ class FuzzyField:
                 hvalue = value
             except TypeError:
                 # Unhashable
-                hvalue = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                hvalue = canonical_key(value)
                 if hvalue in self.seen_values:
                     raise DuplicateError(self.name, value)
 
@@ -154,20 +267,507 @@ class FuzzyField:
             Fully preprocessed value, or self.default if the value is null-like
             and required=False
         """
-        value = self.preprocess(value)
-        if value is not None:
-            value = self.validate(value)
-        value = self.postprocess(value)
-        return value
+        return self._parse_func(value)
+
+    def try_parse(self, value: Any) -> Tuple[bool, Any]:
+        """Non-raising version of :meth:`~FuzzyField.parse`, for inputs with
+        a high rate of invalid values, where raising and catching a
+        :class:`ValidationError` for every one of them would dominate the
+        runtime.
+
+        All the built-in fields except :class:`Timestamp` implement it without
+        constructing or raising any :class:`ValidationError`; other fields,
+        and fields with the ``cache`` parameter, fall back to catching the
+        exception raised by :meth:`~FuzzyField.parse`.
+
+        :param value:
+            Raw value to be preprocessed and validated
+        :returns:
+            tuple of (ok, result):
+
+            (True, parsed value)
+                if the value is valid, with the same result as
+                :meth:`~FuzzyField.parse`
+            (False, error)
+                if the value is invalid, where error is either the
+                :class:`ValidationError` that :meth:`~FuzzyField.parse` would
+                raise, or a tuple of ``(exception class, *args)`` which builds
+                it when passed to :func:`~fuzzyfields.errors.make_error`
+                together with the field name.
+        """
+        return self._try_parse_func(value)
+
+    def __getattr__(self, name: str) -> Any:
+        """Build the closures returned by :meth:`FuzzyField._compile_parse`,
+        :meth:`FuzzyField._compile_try_parse` and
+        :meth:`FuzzyField._compile_try_validate` the first time they're
+        needed
+        """
+        if name == '_parse_func':
+            func = self._compile_parse()
+            self.__dict__['_parse_func'] = func
+            return func
+        if name == '_try_parse_func':
+            func = self._compile_try_parse()
+            self.__dict__['_try_parse_func'] = func
+            return func
+        if name == '_try_validate_func':
+            func = self._compile_try_validate()
+            self.__dict__['_try_validate_func'] = func
+            return func
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Discard the closures built by :meth:`FuzzyField._compile_parse`,
+        :meth:`FuzzyField._compile_try_parse` and
+        :meth:`FuzzyField._compile_try_validate` whenever a setting of the
+        field changes
+        """
+        object.__setattr__(self, name, value)
+        if name not in self._runtime_attributes:
+            self.__dict__.pop('_parse_func', None)
+            self.__dict__.pop('_try_parse_func', None)
+            self.__dict__.pop('_try_validate_func', None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Closures can't be pickled; rebuild them after unpickling
+        """
+        state = self.__dict__.copy()
+        state.pop('_parse_func', None)
+        state.pop('_try_parse_func', None)
+        state.pop('_try_validate_func', None)
+        return state
+
+    def _compile_parse(self) -> Callable[[Any], Any]:
+        """Build a closure equivalent to :meth:`~FuzzyField.preprocess` ->
+        :meth:`~FuzzyField.validate` -> :meth:`~FuzzyField.postprocess`,
+        specialised for the current settings of the field, e.g. without the
+        uniqueness check when unique=False.
+
+        This is invoked by :meth:`~FuzzyField.parse` after the field is
+        created or copied, and after any of its settings change.
+        Subclasses can specialise their validation logic by overriding
+        :meth:`~FuzzyField._compile_validate`.
+        """
+        cls = type(self)
+
+        if self.cache or cls.preprocess is not FuzzyField.preprocess:
+            validate_raw = self._validate_raw
+        else:
+            validate = self._compile_validate()
+            na_values = NA_VALUES
+
+            def validate_raw(value):
+                # Inlined FuzzyField.preprocess()
+                if isinstance(value, str):
+                    value = value.strip()
+                    if value in na_values:
+                        return None
+                elif isnull(value):
+                    return None
+                return validate(value)
+
+        if self.unique or cls.postprocess is not FuzzyField.postprocess:
+            postprocess = self.postprocess
+
+            def parse(value):
+                return postprocess(validate_raw(value))
+
+        elif self.required:
+            def parse(value):
+                value = validate_raw(value)
+                if value is None:
+                    raise MissingFieldError(self.name)
+                return value
+
+        else:
+            default = self.default
+
+            def parse(value):
+                value = validate_raw(value)
+                return default if value is None else value
+
+        return parse
+
+    def _compile_validate(self) -> Callable[[Any], Any]:
+        """Return a callable equivalent to :meth:`~FuzzyField.validate`,
+        for :meth:`~FuzzyField._compile_parse`. Subclasses can override this
+        method to return a closure specialised for their current settings.
+        """
+        return self.validate
+
+    def _compile_try_parse(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Build a closure implementing :meth:`~FuzzyField.try_parse`.
+        This is the non-raising equivalent of
+        :meth:`~FuzzyField._compile_parse`.
+
+        Subclasses implement the non-raising validation logic by overriding
+        :meth:`~FuzzyField._compile_try_validate`. Fields that enable the
+        cache, or that override :meth:`~FuzzyField.parse` or
+        :meth:`~FuzzyField.postprocess`, catch the exceptions of
+        :meth:`~FuzzyField.parse`.
+        """
+        cls = type(self)
+
+        if (self.cache or cls.parse is not FuzzyField.parse
+                or cls.postprocess is not FuzzyField.postprocess):
+            parse = self.parse
+
+            def try_parse(value):
+                try:
+                    return True, parse(value)
+                except ValidationError as exc:
+                    return False, exc
+
+            return try_parse
+
+        if cls._native_try:
+            try_validate = self._compile_try_validate()
+        else:
+            try_validate = FuzzyField._compile_try_validate(self)
+        preprocess = self.preprocess
+        custom_preprocess = cls.preprocess is not FuzzyField.preprocess
+        na_values = NA_VALUES
+        required = self.required
+        unique = self.unique
+        default = self.default
+
+        def try_parse(value):
+            if custom_preprocess:
+                try:
+                    value = preprocess(value)
+                except ValidationError as exc:
+                    return False, exc
+            # Inlined FuzzyField.preprocess()
+            elif isinstance(value, str):
+                value = value.strip()
+                if value in na_values:
+                    value = None
+            elif isnull(value):
+                value = None
+
+            if value is not None:
+                ok, value = try_validate(value)
+                if not ok:
+                    return False, value
+
+            # Inlined FuzzyField.postprocess()
+            if value is None:
+                if required:
+                    return False, (MissingFieldError, )
+                return True, default
+
+            if unique:
+                seen_values = self.seen_values
+                try:
+                    if value in seen_values:
+                        return False, (DuplicateError, value)
+                    hvalue = value
+                except TypeError:
+                    # Unhashable
+                    hvalue = canonical_key(value)
+                    if hvalue in seen_values:
+                        return False, (DuplicateError, value)
+                seen_values.add(hvalue)
+
+            return True, value
+
+        return try_parse
+
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Return a callable equivalent to :meth:`~FuzzyField.validate` that
+        returns ``(True, validated value)`` or ``(False, error)`` instead of
+        raising, where error has the same format as in
+        :meth:`~FuzzyField.try_parse`. Used by
+        :meth:`~FuzzyField._compile_try_parse`.
+
+        The default implementation catches the exceptions raised by
+        :meth:`~FuzzyField.validate`. Subclasses should override it to avoid
+        raising exceptions in the first place, and then implement
+        :meth:`~FuzzyField.validate` by raising the errors returned by the
+        closure, which is cached as ``self._try_validate_func``, so that the
+        two can't disagree.
+        """
+        validate = self._compile_validate()
+
+        def try_validate(value):
+            try:
+                return True, validate(value)
+            except ValidationError as exc:
+                return False, exc
+
+        return try_validate
+
+    def _validate_raw(self, value: Any) -> Any:
+        """Run :meth:`~FuzzyField.preprocess` and :meth:`~FuzzyField.validate`
+        on a raw value, going through the cache if enabled.
+        """
+        if not self.cache:
+            value = self.preprocess(value)
+            if value is not None:
+                value = self.validate(value)
+            return value
+
+        # Don't let e.g. 1, 1.0 and True share the same cache entry
+        if isinstance(value, (float, complex, decimal.Decimal)):
+            # Nor e.g. 0.0 and -0.0, or Decimal('1.0') and Decimal('1.00'),
+            # which are equal but may validate differently
+            key = (type(value), repr(value))
+        else:
+            key = (type(value), value)
+        try:
+            is_valid, res = self._cache[key]
+        except TypeError:
+            # Unhashable
+            value = self.preprocess(value)
+            if value is not None:
+                value = self.validate(value)
+            return value
+        except KeyError:
+            self.cache_misses += 1
+            try:
+                res = self.preprocess(value)
+                if res is not None:
+                    res = self.validate(res)
+            except ValidationError as exc:
+                # The caller may alter the exception, e.g. DictReader sets
+                # record_num and line_num
+                self._cache_store(key, (False, copy.copy(exc)))
+                raise
+            self._cache_store(key, (True, res))
+            return res
+
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        if is_valid:
+            return res
+        raise copy.copy(res)
+
+    def _cache_store(self, key: Any, outcome: Tuple[bool, Any]) -> None:
+        """Add an entry to the cache and evict the least recently used one
+        if it is full
+        """
+        self._cache[key] = outcome
+        if len(self._cache) > self.cache:
+            self._cache.popitem(last=False)
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset the hit and miss counters
+        """
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def parse_many(self, values: Iterable
+                   ) -> Tuple[Any, Dict[int, ValidationError]]:
+        """Batch version of :meth:`~FuzzyField.parse`, with the same
+        semantics for the ``required``, ``default`` and ``unique`` parameters.
+
+        Fields with a vectorized implementation (:class:`Float`,
+        :class:`Integer`, :class:`Percentage`, :class:`Boolean`,
+        :class:`Domain` and :class:`Timestamp`) validate the whole batch at
+        once with numpy and pandas, if installed; every other field, or
+        subclass that overrides the validation logic, falls back to invoking
+        :meth:`~FuzzyField.parse` on every element.
+
+        :param values:
+            list, :class:`numpy.ndarray`, :class:`pandas.Series`, or any
+            other iterable of raw values
+        :returns:
+            tuple of (parsed values, errors):
+
+            parsed values
+                :class:`numpy.ndarray` when using the vectorized
+                implementation, list otherwise. Elements that fail validation
+                are replaced with self.default.
+            errors
+                dict of ``{position: ValidationError}`` for every element that
+                failed validation
+        """
+        if self._vectorized:
+            try:
+                import numpy  # noqa: F401
+                import pandas  # noqa: F401
+            except ImportError:
+                pass
+            else:
+                return self._parse_many_vectorized(values)
+
+        out = []
+        errors = {}
+        for i, value in enumerate(values):
+            try:
+                out.append(self.parse(value))
+            except ValidationError as exc:
+                errors[i] = exc
+                out.append(self.default)
+        return out, errors
+
+    def _parse_many_vectorized(self, values: Iterable
+                               ) -> Tuple[Any, Dict[int, ValidationError]]:
+        """Implementation of :meth:`FuzzyField.parse_many` for fields with a
+        vectorized kernel
+        """
+        import numpy
+
+        values, null = self._preprocess_many(values)
+        notnull = numpy.flatnonzero(~null)
+        res, ok = self._validate_many(values[notnull])
+
+        # Elements that the kernel could not validate go through the scalar
+        # validate(), which either returns a value or raises the appropriate
+        # exception
+        errors = {}
+        fallback = {}
+        for i in notnull[~ok].tolist():
+            try:
+                value = self.validate(values[i])
+            except ValidationError as exc:
+                errors[i] = exc
+                continue
+            if value is None:
+                null[i] = True
+            else:
+                fallback[i] = value
+
+        good = numpy.zeros(len(values), dtype=bool)
+        good[notnull[ok]] = True
+        out = numpy.empty(len(values), dtype=res.dtype)
+        out[good] = res[ok]
+
+        if self.required:
+            for i in numpy.flatnonzero(null).tolist():
+                errors[i] = MissingFieldError(self.name)
+
+        if self.unique:
+            candidates = sorted(numpy.flatnonzero(good).tolist()
+                                + list(fallback))
+            for i in candidates:
+                try:
+                    value = fallback[i]
+                except KeyError:
+                    value = out[i]
+                    if out.dtype.kind in 'biuf':
+                        value = value.item()
+                try:
+                    self.postprocess(value)
+                except DuplicateError as exc:
+                    errors[i] = exc
+                    good[i] = False
+                    fallback.pop(i, None)
+
+        use_default = ~good
+        use_default[list(fallback)] = False
+        has_default = use_default.any()
+        fill = list(fallback.values())
+        if has_default:
+            fill.append(self.default)
+        if not _fits_dtype(fill, out.dtype):
+            if out.dtype.kind in 'mM':
+                # astype(object) would convert datetime64[ns] to int
+                obj = numpy.empty(out.shape, dtype=object)
+                obj[:] = list(out)
+                out = obj
+            else:
+                out = out.astype(object)
+        if has_default:
+            if out.dtype == object:
+                # Prevent numpy from broadcasting list or tuple defaults
+                default = numpy.empty((), dtype=object)
+                default[()] = self.default
+                out[use_default] = default
+            else:
+                out[use_default] = self.default
+        for i, value in fallback.items():
+            out[i] = value
+        return out, dict(sorted(errors.items()))
+
+    @staticmethod
+    def _preprocess_many(values: Iterable) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`FuzzyField.preprocess`
+
+        :param values:
+            list, :class:`numpy.ndarray`, :class:`pandas.Series`, or any
+            other iterable of raw values
+        :returns:
+            tuple of (values, null), where values is a 1-dimensional
+            :class:`numpy.ndarray` of preprocessed values and null is a
+            boolean mask of the null values
+        """
+        import numpy
+        import pandas
+
+        if isinstance(values, pandas.Series):
+            values = values.to_numpy()
+        elif not isinstance(values, numpy.ndarray):
+            values = pandas.Series(list(values), dtype=object).to_numpy()
+        if values.ndim != 1:
+            raise ValueError("Expected a 1-dimensional array")
+
+        kind = values.dtype.kind
+        if kind in 'biu':
+            return values, numpy.zeros(values.shape, dtype=bool)
+        if kind == 'f':
+            return values, numpy.isnan(values)
+        if kind in 'mM':
+            return values, numpy.isnat(values)
+
+        values = values.astype(object)
+        null = pandas.isnull(values)
+        if pandas.api.types.infer_dtype(values, skipna=False) == 'string':
+            is_str = numpy.ones(values.shape, dtype=bool)
+        else:
+            is_str = numpy.frompyfunc(_is_str, 1, 1)(values).astype(bool)
+        if is_str.any():
+            values[is_str] = numpy.frompyfunc(str.strip, 1, 1)(
+                values[is_str])
+            null[is_str] = pandas.Series(values[is_str]).isin(NA_VALUES)
+        return values, null
+
+    def _validate_many(self, values: Any) -> Tuple[Any, Any]:
+        """Virtual method - to be overridden by fields that offer a vectorized
+        equivalent of :meth:`FuzzyField.validate`.
+
+        The method can be conservative: it is fine to flag as not ok a value
+        that is valid but hard to parse in a vectorized way, as all not ok
+        values are later passed one by one to :meth:`FuzzyField.validate`,
+        which will either parse them or raise the appropriate exception.
+        However, all values flagged as ok must be identical to what
+        :meth:`~FuzzyField.validate` would return.
+
+        :param values:
+            1-dimensional :class:`numpy.ndarray` of non-null values,
+            already preprocessed by :meth:`FuzzyField._preprocess_many`
+        :returns:
+            tuple of (result, ok), where result is a :class:`numpy.ndarray`
+            of validated values and ok is a boolean mask of the values
+            that were successfully validated. The content of result where
+            ok is False is undefined.
+        """
+        raise NotImplementedError("Virtual method, must override")
+
+    def _new_buffer(self) -> ObjectBuffer:
+        """Return an empty column buffer for :meth:`DictReader.to_arrays` and
+        :meth:`DictReader.to_dataframe`. Subclasses should override this
+        method to return a typed buffer from :mod:`fuzzyfields.buffers`
+        matching the values they output.
+        """
+        return ObjectBuffer()
 
     def copy(self):
-        """Shallow copy of self. The seen_values set is recreated as an
-        empty set.
+        """Shallow copy of self. The seen_values store is recreated
+        empty, and the cache is emptied.
         """
         res = object.__new__(type(self))
         res.__dict__.update(self.__dict__)
+        # The closures reference self
+        res.__dict__.pop('_parse_func', None)
+        res.__dict__.pop('_try_parse_func', None)
+        res.__dict__.pop('_try_validate_func', None)
         if res.unique:
-            res.seen_values = set()
+            res.seen_values = new_store(res.unique_store)
+        res.cache_clear()
         return res
 
     @property
@@ -301,3 +901,35 @@ class FuzzyField:
         # It must be a real attribute; we can't just override it with a
         # @property.
         self.__doc__ = repr(self)
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _fits_dtype(values: list, dtype) -> bool:
+    """Test if all values can be stored in a numpy array of the given dtype
+    without altering their type or value, e.g. NaN fits in a float64 array but
+    None doesn't fit in a bool array.
+    """
+    import numpy
+
+    if dtype == object:
+        return True
+    try:
+        # Skip repeated values
+        values = list({(type(v), v): v for v in values}.values())
+    except TypeError:
+        # Unhashable
+        pass
+    try:
+        arr = numpy.array(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    for a, v in zip(arr, values):
+        # Note: numpy.datetime64('NaT').item() returns None
+        if dtype.kind not in 'mM' and not isinstance(v, numpy.generic):
+            a = a.item()
+        if type(a) is not type(v) or not (a == v or (a != a and v != v)):
+            return False
+    return True
@@ -1,17 +1,97 @@
 import decimal
 import math
 import re
-from typing import Any, Union
+import sys
+from typing import Any, Callable, Optional, Tuple, Union
+from .buffers import FloatBuffer, IntBuffer, ObjectBuffer
 from .fuzzyfield import FuzzyField
-from .errors import DomainError, FieldTypeError, MalformedFieldError
-from .tools import NA_VALUES
+from .errors import (DomainError, FieldTypeError, MalformedFieldError,
+                     ValidationError, make_error)
+from .tools import NA_VALUES, map_str
 
 
-try:
-    import numpy
-    CAN_CAST_TO_INT = str, numpy.integer
-except ImportError:
-    CAN_CAST_TO_INT = str
+def _can_cast_to_int(value: Any) -> bool:
+    """Return True if value is a str or a numpy integer. Don't import numpy
+    unless it has already been imported elsewhere.
+    """
+    if isinstance(value, str):
+        return True
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.integer)
+
+
+def _clean_number_str(value: str) -> str:
+    """Preprocess the string representation of a number before passing it to
+    :meth:`Float._try_num_converter`. Remove the thousands separator and
+    convert accounting-style and Excel-style negative numbers.
+    """
+    # Remove thousands separator
+    value = value.replace(',', '')
+
+    # Convert accounting-style negative numbers, e.g. '(1000)'
+    if value.startswith('(') and value.endswith(')'):
+        value = '-' + value[1:-1]
+
+    # Convert negative numbers formatted by Excel in some cases
+    # '- 1000 -'
+    elif value.startswith('- ') and value.endswith(' -'):
+        value = '-' + value[2:-2]
+
+    return value
+
+
+def _clean_decimal_str(value: str) -> str:
+    """Remove trailing zeros after the decimal point, as they confuse Decimal,
+    e.g.  Decimal('0.0000000000') -> Decimal("0E-10").
+    Do not accidentally drop leading zeros in the exponent.
+    """
+    value = value.upper()
+    if 'E' in value:
+        # Scientific notation
+        mantissa, _, exponent = value.partition('E')
+        if '.' in mantissa:
+            mantissa = re.sub(r'0*$', '', mantissa)
+        value = f'{mantissa}E{exponent}'
+    elif '.' in value:
+        # Not scientific notation
+        value = re.sub(r'0*$', '', value)
+    return value
+
+
+def _try_float(value: Any) -> float:
+    """float(value), or NaN if value can't be converted
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return math.nan
+
+
+def _try_int(value: Any) -> Optional[int]:
+    """Convert ints, floats with no decimals, and string representations of
+    ints to int. Return None for anything else and for ints that don't fit in
+    an int64.
+    """
+    if type(value) is str:
+        try:
+            value = int(value)
+        except ValueError:
+            return None
+    elif type(value) is float:
+        if not value.is_integer():
+            return None
+        value = int(value)
+    elif type(value) is not int:
+        return None
+    return value if -2 ** 63 <= value < 2 ** 63 else None
+
+
+def _is_percentage_str(value: Any) -> bool:
+    return isinstance(value, str) and value[-1:] == '%'
+
+
+def _strip_percentage(value: str) -> str:
+    return value[:-1].strip()
 
 
 class Float(FuzzyField):
@@ -40,6 +120,11 @@ class Float(FuzzyField):
     allow_max: bool
     allow_zero: bool
 
+    _scalar_methods = FuzzyField._scalar_methods + (
+        '_num_converter', '_try_num_converter')
+    _kernel_methods = FuzzyField._kernel_methods + ('_num_converter_many', )
+    _try_methods = FuzzyField._try_methods + ('_try_num_converter', )
+
     def __init__(self, *, min_value: Union[int, float] = -math.inf,
                  max_value: Union[int, float] = math.inf,
                  allow_min: bool = True, allow_max: bool = True,
@@ -62,41 +147,137 @@ class Float(FuzzyField):
             or in accounting negative format, e.g. (5,000.200) ==> -5000.2,
             or any number-like object
         :rtype:
-            as returned by :meth:`Numeric.num_converter`
+            as returned by :meth:`Float._try_num_converter`
         :raises DomainError:
             Number out of allowed range
         :raises MalformedFieldError, FieldTypeError:
             Not a number
         """
-        if isinstance(value, str):
-            # Preprocess strings before passing them to self._num_converter
-            # Remove thousands separator
-            value = value.replace(',', '')
+        ok, res = self._try_validate_func(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _compile_validate(self) -> Callable[[Any], Any]:
+        """Raising wrapper around the closure built by
+        :meth:`Float._compile_try_validate`.
+        See :meth:`FuzzyField._compile_validate`.
+        """
+        if type(self).validate is not Float.validate:
+            return super()._compile_validate()
+
+        try_validate = self._try_validate_func
+
+        def validate(value):
+            ok, res = try_validate(value)
+            if not ok:
+                raise make_error(self.name, res)
+            return res
+
+        return validate
 
-            # Convert accounting-style negative numbers, e.g. '(1000)'
-            if value.startswith('(') and value.endswith(')'):
-                value = '-' + value[1:-1]
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Non-raising implementation of :meth:`Float.validate`, which skips
+        the range checks that can't fail and formats the domain only once.
+        See :meth:`FuzzyField._compile_try_validate`.
+        """
+        num_converter = self._compile_try_num_converter()
+        out_of_domain = self._compile_out_of_domain()
+
+        if out_of_domain is None:
+            def try_validate(value):
+                if isinstance(value, str):
+                    value = _clean_number_str(value)
+                return num_converter(value)
+
+            return try_validate
+
+        domain_str = self.domain_str
+
+        def try_validate(value):
+            if isinstance(value, str):
+                value = _clean_number_str(value)
+            ok, value = num_converter(value)
+            if not ok or value is None:
+                return ok, value
+            if out_of_domain(value):
+                return False, (DomainError, value, domain_str)
+            return True, value
+
+        return try_validate
+
+    def _compile_try_num_converter(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Return :meth:`Float._try_num_converter`, or, if a subclass
+        overrides :meth:`Float._num_converter` but not
+        :meth:`Float._try_num_converter`, a wrapper that catches the
+        exceptions of the former.
+        """
+        mro = type(self).__mro__
+
+        def owner(attr):
+            return next(klass for klass in mro if attr in klass.__dict__)
+
+        if issubclass(owner('_try_num_converter'), owner('_num_converter')):
+            return self._try_num_converter
+
+        num_converter = self._num_converter
+
+        def try_num_converter(value):
+            try:
+                return True, num_converter(value)
+            except ValidationError as exc:
+                return False, exc
 
-            # Convert negative numbers formatted by Excel in some cases
-            # '- 1000 -'
-            elif value.startswith('- ') and value.endswith(' -'):
-                value = '-' + value[2:-2]
+        return try_num_converter
 
-        value = self._num_converter(value)
-        if value is None:
+    def _compile_out_of_domain(self) -> Optional[Callable[[Any], bool]]:
+        """Return a function that tests if a converted number falls outside
+        of the allowed domain, or None if the domain is unbounded.
+        """
+        min_value = self.min_value
+        max_value = self.max_value
+        allow_min = self.allow_min
+        allow_max = self.allow_max
+        allow_zero = self.allow_zero
+
+        if (allow_zero and allow_min and allow_max
+                and min_value == -math.inf and max_value == math.inf):
             return None
 
-        # Decimal has problems comparing to float/int
-        valuef = float(value)
+        def out_of_domain(value):
+            # Decimal has problems comparing to float/int
+            valuef = float(value)
+            return ((not allow_zero and valuef == 0)
+                    or (valuef < min_value if allow_min
+                        else valuef <= min_value)
+                    or (valuef > max_value if allow_max
+                        else valuef >= max_value))
 
-        if ((not self.allow_zero and valuef == 0)
-                or (self.allow_min and valuef < self.min_value)
-                or (not self.allow_min and valuef <= self.min_value)
-                or (self.allow_max and valuef > self.max_value)
-                or (not self.allow_max and valuef >= self.max_value)):
-            raise DomainError(self.name, value, choices=self.domain_str)
+        return out_of_domain
 
-        return value
+    def _validate_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Float.validate`.
+        See :meth:`FuzzyField._validate_many`.
+        """
+        import numpy
+
+        if values.dtype == object:
+            values = map_str(_clean_number_str, values)
+        res, ok = self._num_converter_many(values)
+
+        valuef = res.astype(float)
+        with numpy.errstate(invalid='ignore'):
+            if not self.allow_zero:
+                ok &= valuef != 0
+            if self.allow_min:
+                ok &= valuef >= self.min_value
+            else:
+                ok &= valuef > self.min_value
+            if self.allow_max:
+                ok &= valuef <= self.max_value
+            else:
+                ok &= valuef < self.max_value
+        return res, ok
 
     @property
     def domain_str(self) -> str:
@@ -109,15 +290,46 @@ class Float(FuzzyField):
             msg += ' non-zero'
         return msg
 
-    def _num_converter(self, value: Any) -> float:
+    def _num_converter(self, value: Any) -> Any:
+        """Raising wrapper around :meth:`Float._try_num_converter`
+        """
+        ok, res = self._try_num_converter(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _try_num_converter(self, value: Any) -> Tuple[bool, Any]:
         """Convert string, int, or other to float
+
+        :returns:
+            tuple of (ok, result); see :meth:`FuzzyField.try_parse`
         """
         try:
-            return float(value)
+            return True, float(value)
         except TypeError:
-            raise FieldTypeError(self.name, value, "number")
+            return False, (FieldTypeError, value, "number")
         except ValueError:
-            raise MalformedFieldError(self.name, value, "number")
+            return False, (MalformedFieldError, value, "number")
+
+    def _num_converter_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Float._try_num_converter`
+
+        :returns:
+            tuple of (result, ok); see :meth:`FuzzyField._validate_many`
+        """
+        import numpy
+
+        try:
+            # This invokes float() on every element of object arrays
+            res = values.astype(float)
+        except (TypeError, ValueError, OverflowError):
+            res = numpy.frompyfunc(_try_float, 1, 1)(values).astype(float)
+        # NaN can also be the result of a successful parsing, e.g. of 'NAN',
+        # but validate() will deal with that.
+        return res, ~numpy.isnan(res)
+
+    def _new_buffer(self) -> ObjectBuffer:
+        return FloatBuffer()
 
     @property
     def sphinxdoc(self) -> str:
@@ -132,35 +344,26 @@ class Decimal(Float):
     def __init__(self, *, default: Any = decimal.Decimal('nan'), **kwargs):
         super().__init__(default=default, **kwargs)
 
-    def _num_converter(self, value: Any) -> decimal.Decimal:
+    def _try_num_converter(self, value: Any) -> Tuple[bool, Any]:
         """Convert string, float, or int to decimal.Decimal
         """
         # Performance shortcut
         if isinstance(value, decimal.Decimal):
-            return value
+            return True, value
 
         orig_value = value
-        # Remove leading zeros after comma, as they confuse Decimal
-        # e.g.  Decimal('0.0000000000') -> Decimal("0E-10")
-        # Do not accidentally drop leading zeros in the exponent.
         if isinstance(value, str):
-            value = value.upper()
-            if 'E' in value:
-                # Scientific notation
-                mantissa, _, exponent = value.partition('E')
-                if '.' in mantissa:
-                    mantissa = re.sub(r'0*$', '', mantissa)
-                value = f'{mantissa}E{exponent}'
-            elif '.' in value:
-                # Not scientific notation
-                value = re.sub(r'0*$', '', value)
+            value = _clean_decimal_str(value)
 
         try:
-            return decimal.Decimal(value)
+            return True, decimal.Decimal(value)
         except (TypeError, ValueError):
-            raise FieldTypeError(self.name, orig_value, "number")
+            return False, (FieldTypeError, orig_value, "number")
         except decimal.InvalidOperation:
-            raise MalformedFieldError(self.name, orig_value, "number")
+            return False, (MalformedFieldError, orig_value, "number")
+
+    def _new_buffer(self) -> ObjectBuffer:
+        return ObjectBuffer()
 
 
 class Integer(Float):
@@ -187,21 +390,21 @@ class Integer(Float):
     :raises MalformedFieldError:
         if the number can't be cast to int without losing precision
     """
-    def _num_converter(self, value: Any) -> Union[int, float]:
+    def _try_num_converter(self, value: Any) -> Tuple[bool, Any]:
         """Convert value to int
         """
         # Quick exit
         if isinstance(value, int):
-            return value
+            return True, value
 
         # Attempt quick conversion. This won't work in case of the more
         # sophisticated cases we want to cover, e.g. '1.0e1'.
         # DO NOT blindly convert to int if value is a float, as int(3.5) = 3!
         # Not passing by float also prevents precision loss issues, e.g.
         # int('9999999999999999') != float('9999999999999999')
-        if isinstance(value, CAN_CAST_TO_INT):
+        if _can_cast_to_int(value):
             try:
-                return int(value)
+                return True, int(value)
             except ValueError:
                 pass
 
@@ -209,20 +412,66 @@ class Integer(Float):
         try:
             valued = decimal.Decimal(value)
         except (TypeError, ValueError):
-            raise FieldTypeError(self.name, value, "integer")
+            return False, (FieldTypeError, value, "integer")
         except decimal.InvalidOperation:
-            raise MalformedFieldError(self.name, value, "integer")
+            return False, (MalformedFieldError, value, "integer")
 
         # This should be already catered for by :meth:`FuzzyField.preprocess`
         assert not math.isnan(valued)
         if math.isinf(valued):
-            return float(valued)
+            return True, float(valued)
 
         valuei = int(valued)
         if valuei != valued:
             # Mantissa after the dot is not zero
-            raise MalformedFieldError(self.name, value, "integer")
-        return valuei
+            return False, (MalformedFieldError, value, "integer")
+        return True, valuei
+
+    def _num_converter_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Integer._try_num_converter`.
+
+        Only ints, floats with no decimals, and plain string representations
+        of integers that fit in an int64 are converted here; anything else
+        (e.g. '1.0e1') is left to :meth:`Integer._try_num_converter`.
+        """
+        import numpy
+        import pandas
+
+        kind = values.dtype.kind
+        if kind == 'b':
+            # _num_converter rejects numpy.bool_
+            return values, numpy.zeros(values.shape, dtype=bool)
+        if kind == 'i':
+            return (values.astype(numpy.int64),
+                    numpy.ones(values.shape, dtype=bool))
+        if kind == 'u':
+            ok = values <= numpy.iinfo(numpy.int64).max
+            return numpy.where(ok, values, 0).astype(numpy.int64), ok
+
+        if kind == 'f':
+            with numpy.errstate(invalid='ignore'):
+                ok = (numpy.isfinite(values)
+                      & (values == numpy.trunc(values))
+                      & (numpy.abs(values) < 2 ** 63))
+            res = numpy.where(ok, values, 0).astype(numpy.int64)
+            return res, ok
+
+        if pandas.api.types.infer_dtype(values, skipna=False) in (
+                'string', 'integer'):
+            try:
+                # This invokes int() on every element
+                return (values.astype(numpy.int64),
+                        numpy.ones(values.shape, dtype=bool))
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+        res = numpy.frompyfunc(_try_int, 1, 1)(values)
+        ok = pandas.notnull(res)
+        res[~ok] = 0
+        return res.astype(numpy.int64), ok
+
+    def _new_buffer(self) -> ObjectBuffer:
+        return IntBuffer()
 
     @property
     def sphinxdoc(self) -> str:
@@ -240,20 +489,43 @@ class Percentage(Float):
        ever protect you from a "1", which will be converted to 1.00 but the
        author of the input may have wanted to say 0.01.
     """
-    def _num_converter(self, value: Any) -> Union[float, None]:
+    def _try_num_converter(self, value: Any) -> Tuple[bool, Any]:
         """Convert string, int, or other to float
         """
         try:
             if isinstance(value, str) and value[-1] == '%':
                 value = value[:-1].strip()
                 if value in NA_VALUES:
-                    return None
-                return float(value) / 100
-            return float(value)
+                    return True, None
+                return True, float(value) / 100
+            return True, float(value)
         except TypeError:
-            raise FieldTypeError(self.name, value, "percentage")
+            return False, (FieldTypeError, value, "percentage")
         except ValueError:
-            raise MalformedFieldError(self.name, value, "percentage")
+            return False, (MalformedFieldError, value, "percentage")
+
+    def _num_converter_many(self, values: Any) -> Tuple[Any, Any]:
+        """Vectorized equivalent of :meth:`Percentage._try_num_converter`
+        """
+        import numpy
+        import pandas
+
+        pct = numpy.zeros(values.shape, dtype=bool)
+        blank = numpy.zeros(values.shape, dtype=bool)
+        if values.dtype == object:
+            pct = numpy.frompyfunc(_is_percentage_str, 1, 1)(values)
+            pct = pct.astype(bool)
+            if pct.any():
+                values = values.copy()
+                values[pct] = numpy.frompyfunc(_strip_percentage, 1, 1)(
+                    values[pct])
+                # '%' or 'N/A %'; let _try_num_converter return None
+                blank[pct] = pandas.Series(values[pct]).isin(NA_VALUES)
+
+        res, ok = super()._num_converter_many(values)
+        res[pct] /= 100
+        ok &= ~blank
+        return res, ok
 
     @property
     def sphinxdoc(self) -> str:
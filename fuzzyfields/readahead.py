@@ -0,0 +1,193 @@
+"""Read CSV files in a background thread, for :meth:`DictReader.from_path`
+"""
+import csv
+import importlib
+import io
+import mmap
+import os
+import queue
+import threading
+from typing import Any, BinaryIO, Dict, Iterator, Union
+
+
+#: Magic numbers of the supported compression formats
+_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'BZh': 'bz2',
+    b'\xfd7zXZ\x00': 'lzma',
+}
+
+
+def open_binary(path: Union[str, os.PathLike]) -> BinaryIO:
+    """Open a file for reading in binary mode, transparently decompressing
+    gzip, bz2 and xz files, which are recognised by their magic number.
+    Uncompressed files are memory-mapped.
+
+    :param path:
+        path to the file
+    :returns:
+        binary file-like object, which must be closed by the caller
+    """
+    with open(path, 'rb') as fh:
+        head = fh.read(6)
+        for magic, modname in _MAGIC.items():
+            if head.startswith(magic):
+                return importlib.import_module(modname).open(path, 'rb')
+
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file, or a file that can't be mapped, e.g. a pipe
+            return open(path, 'rb')
+    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        # Let the kernel read ahead aggressively
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return io.BufferedReader(_MmapIO(mm))
+
+
+class _MmapIO(io.RawIOBase):
+    """Raw binary stream on top of a :class:`mmap.mmap`
+    """
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        self._view = memoryview(mm)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        n = min(len(b), len(self._mm) - self._pos)
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            # The mmap can't be closed while there are exported buffers
+            self._view.release()
+            self._mm.close()
+        super().close()
+
+
+class ReadAheadCSV:
+    """Iterable that reads a CSV file in a background thread, which decodes
+    and tokenises it and feeds a bounded queue of row batches.
+    This lets the I/O, decompression, decoding, and tokenising of the file
+    overlap with the validation of the rows. Memory usage is bounded by the
+    size of the queue.
+
+    Every iteration opens the file again and starts a new thread.
+    The thread stops when the file is exhausted, when the iteration raises,
+    or when the iterator is closed or garbage-collected.
+
+    :param path:
+        path to the file, optionally compressed with gzip, bz2 or xz
+    :param bool dicts:
+        True to yield dicts like :class:`csv.DictReader`; False to yield
+        lists like :func:`csv.reader`, skipping blank lines like
+        :class:`csv.DictReader` does
+    :param str encoding:
+        text encoding of the file
+    :param str encoding_errors:
+        error handling scheme of the text decoder; see :func:`open`
+    :param int batch_size:
+        number of rows in a batch
+    :param int queue_size:
+        maximum number of batches that can be waiting in the queue
+    :param csv_kwargs:
+        parameters to :func:`csv.reader` or :class:`csv.DictReader`
+    """
+    line_num: int
+    """Number of lines read from the file up to the current row, like
+    :attr:`csv.DictReader.line_num`
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, dicts: bool,
+                 encoding: str = 'utf-8', encoding_errors: str = 'strict',
+                 batch_size: int = 1000, queue_size: int = 16,
+                 **csv_kwargs):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1; got {batch_size}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1; got {queue_size}")
+        self.path = path
+        self.dicts = dicts
+        self.encoding = encoding
+        self.encoding_errors = encoding_errors
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.csv_kwargs: Dict[str, Any] = csv_kwargs
+        self.line_num = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        self.line_num = 0
+        batches = queue.Queue(self.queue_size)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._produce, args=(batches, stop),
+            name=f'ReadAheadCSV({self.path})', daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                if isinstance(batch, BaseException):
+                    raise batch
+                rows, line_nums = batch
+                for self.line_num, row in zip(line_nums, rows):
+                    yield row
+        finally:
+            stop.set()
+            # Unblock the producer if it's waiting on a full queue
+            while thread.is_alive():
+                try:
+                    batches.get(timeout=0.01)
+                except queue.Empty:
+                    pass
+
+    def _produce(self, batches: queue.Queue, stop: threading.Event) -> None:
+        """Body of the background thread. Put batches of ``(rows,
+        line_nums)`` in the queue, followed by None when the file is
+        exhausted, or by the exception raised while reading it.
+        """
+        def put(item):
+            # Don't wait forever if the consumer went away
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            with open_binary(self.path) as fh, io.TextIOWrapper(
+                    fh, encoding=self.encoding, errors=self.encoding_errors,
+                    newline='') as text:
+                if self.dicts:
+                    reader = csv.DictReader(text, **self.csv_kwargs)
+                else:
+                    reader = csv.reader(text, **self.csv_kwargs)
+
+                rows = []
+                line_nums = []
+                for row in reader:
+                    if not row:
+                        # csv.reader yields [] for blank lines
+                        continue
+                    rows.append(row)
+                    line_nums.append(reader.line_num)
+                    if len(rows) == self.batch_size:
+                        if not put((rows, line_nums)):
+                            return
+                        rows = []
+                        line_nums = []
+                if rows and not put((rows, line_nums)):
+                    return
+        except BaseException as exc:
+            put(exc)
+        else:
+            put(None)
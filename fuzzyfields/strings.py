@@ -1,7 +1,7 @@
 import re
-from typing import Any
+from typing import Any, Callable, Tuple
 from .fuzzyfield import FuzzyField
-from .errors import FieldTypeError, MalformedFieldError
+from .errors import FieldTypeError, MalformedFieldError, make_error
 
 # Backwards compatibility with Python 3.6
 try:
@@ -23,10 +23,22 @@ class String(FuzzyField):
         :raise FieldTypeError:
             if value is neither a string nor None
         """
-        # Note: we'll never receive None as that is blocked upstream
-        if not isinstance(value, str):
-            raise FieldTypeError(self.name, value, 'string')
-        return value
+        ok, res = self._try_validate_func(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Non-raising implementation of :meth:`String.validate`.
+        See :meth:`FuzzyField._compile_try_validate`.
+        """
+        def try_validate(value):
+            # Note: we'll never receive None as that is blocked upstream
+            if not isinstance(value, str):
+                return False, (FieldTypeError, value, 'string')
+            return True, value
+
+        return try_validate
 
     @property
     def sphinxdoc(self) -> str:
@@ -56,12 +68,26 @@ class RegEx(FuzzyField):
         :raise FieldTypeError:
             if value is neither a string nor None
         """
-        if not isinstance(value, str):
-            raise FieldTypeError(self.name, value, 'string')
-        if not self.pattern.match(value):
-            raise MalformedFieldError(self.name, value,
-                                      "'" + self.pattern.pattern + "'")
-        return value
+        ok, res = self._try_validate_func(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Non-raising implementation of :meth:`RegEx.validate`.
+        See :meth:`FuzzyField._compile_try_validate`.
+        """
+        match = self.pattern.match
+        expect = "'" + self.pattern.pattern + "'"
+
+        def try_validate(value):
+            if not isinstance(value, str):
+                return False, (FieldTypeError, value, 'string')
+            if not match(value):
+                return False, (MalformedFieldError, value, expect)
+            return True, value
+
+        return try_validate
 
     @property
     def sphinxdoc(self) -> str:
@@ -90,12 +116,27 @@ class ISOCodeAlpha(FuzzyField):
     def validate(self, value: Any) -> str:
         """Validate input string and convert it to uppercase
         """
-        if not isinstance(value, str):
-            raise FieldTypeError(self.name, value, 'string')
-        uvalue = value.upper()
-        if not self._re.match(uvalue):
-            raise MalformedFieldError(self.name, value, self.sphinxdoc)
-        return uvalue
+        ok, res = self._try_validate_func(value)
+        if not ok:
+            raise make_error(self.name, res)
+        return res
+
+    def _compile_try_validate(self) -> Callable[[Any], Tuple[bool, Any]]:
+        """Non-raising implementation of :meth:`ISOCodeAlpha.validate`.
+        See :meth:`FuzzyField._compile_try_validate`.
+        """
+        match = self._re.match
+        expect = self.sphinxdoc
+
+        def try_validate(value):
+            if not isinstance(value, str):
+                return False, (FieldTypeError, value, 'string')
+            uvalue = value.upper()
+            if not match(uvalue):
+                return False, (MalformedFieldError, value, expect)
+            return True, uvalue
+
+        return try_validate
 
     @property
     def sphinxdoc(self) -> str:
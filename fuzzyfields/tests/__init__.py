@@ -1,4 +1,5 @@
 import importlib
+import timeit
 from distutils.version import LooseVersion
 import pytest
 
@@ -36,4 +37,57 @@ def _import_or_skip(modname, minversion=None):
     return has, func
 
 
+has_numpy, requires_numpy = _import_or_skip('numpy')
 has_pandas, requires_pandas = _import_or_skip('pandas')
+has_pyarrow, requires_pyarrow = _import_or_skip('pyarrow')
+
+
+def speedup(fast, slow, number, repeat=10):
+    """Micro-benchmark two functions without arguments, alternating between
+    them so that both are equally affected by noise on the host
+
+    :param fast:
+        function expected to be faster
+    :param slow:
+        function expected to be slower
+    :param int number:
+        number of calls of each function in a single timing
+    :param int repeat:
+        number of timings of each function
+    :return:
+        ratio of the best timing of slow to the best timing of fast
+    """
+    t_fast = t_slow = float('inf')
+    for _ in range(repeat):
+        t_fast = min(t_fast, timeit.timeit(fast, number=number))
+        t_slow = min(t_slow, timeit.timeit(slow, number=number))
+    return t_slow / t_fast
+
+
+def assert_try_parse(make_field, values):
+    """Test that :meth:`FuzzyField.try_parse` returns the same values and
+    errors as :meth:`FuzzyField.parse`
+
+    :param make_field:
+        function without arguments that returns a new FuzzyField; two
+        instances are needed for unique fields
+    :param values:
+        list of raw values
+    """
+    from fuzzyfields import ValidationError
+    from fuzzyfields.errors import make_error
+
+    ff1 = make_field()
+    ff2 = make_field()
+    for value in values:
+        try:
+            expect = True, ff1.parse(value)
+        except ValidationError as e:
+            expect = False, repr(e)
+
+        ok, res = ff2.try_parse(value)
+        if ok:
+            assert (ok, type(res)) == (expect[0], type(expect[1]))
+            assert res == expect[1] or (res != res and expect[1] != expect[1])
+        else:
+            assert (ok, repr(make_error(ff2.name, res))) == expect
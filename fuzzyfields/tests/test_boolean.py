@@ -1,6 +1,7 @@
 from decimal import Decimal
 from pytest import raises
 from fuzzyfields import Boolean, FieldTypeError, MalformedFieldError
+from . import assert_try_parse, requires_pandas
 
 
 def test_ok():
@@ -68,3 +69,35 @@ def test_malformed():
     with raises(MalformedFieldError) as e:
         ff.parse('-1')
     assert str(e.value) == "Malformed field: expected boolean, got '-1'"
+
+
+@requires_pandas
+def test_parse_many():
+    import numpy
+
+    ff = Boolean(required=False, default=False)
+    out, errors = ff.parse_many(
+        [' yEs ', 'n', ' 1.0e0 ', '0', 1, 0.0, Decimal('1.0'), 'N/A', None,
+         'Nope', -1, [], True])
+    assert out.dtype == bool
+    assert out.tolist() == [True, False, True, False, True, False, True,
+                            False, False, False, False, False, True]
+    assert sorted(errors) == [9, 10, 11]
+    assert isinstance(errors[9], MalformedFieldError)
+    assert isinstance(errors[10], MalformedFieldError)
+    assert isinstance(errors[11], FieldTypeError)
+
+    out, errors = Boolean().parse_many(numpy.array([1, 0, 2]))
+    assert out.tolist() == [True, False, None]
+    assert isinstance(errors[2], MalformedFieldError)
+
+
+def test_try_parse():
+    """try_parse() returns the same values and errors as parse()
+    """
+    assert Boolean._native_try
+    assert_try_parse(Boolean, [
+        True, False, 1, 0, 1.0, -0.0, Decimal('1.0'), '  1.0e0  ', '-0.0e0',
+        ' trUe ', 'faLSe', 'y', 'N', 'N/A', None, object(), [], 'Nope', -1,
+        -1.0, '-1', '2', 'inf', '-INF', 'Infinity', 2 ** 70, 0.5,
+    ])
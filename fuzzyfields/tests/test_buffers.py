@@ -0,0 +1,144 @@
+import datetime
+import math
+import pytest
+from fuzzyfields.buffers import (ObjectBuffer, FloatBuffer, IntBuffer,
+                                 BoolBuffer, DatetimeBuffer,
+                                 CategoricalBuffer)
+from . import has_numpy, requires_numpy, requires_pandas
+
+if has_numpy:
+    import numpy
+
+pytestmark = requires_numpy
+
+
+def fill(buf, values, flush_every=2):
+    """Append values to buf, flushing every few values like
+    DictReader._fill_buffers does
+    """
+    for i, value in enumerate(values, 1):
+        buf.append(value)
+        if i % flush_every == 0:
+            buf = buf.flush()
+    return buf.flush()
+
+
+@pytest.mark.parametrize('cls,values,dtype', [
+    (ObjectBuffer, ['a', None, [1, 2], (3, 4)], object),
+    (FloatBuffer, [1.5, 2, None, math.nan], 'float64'),
+    (IntBuffer, [1, -2, 2 ** 62], 'int64'),
+    (BoolBuffer, [True, False, True], bool),
+])
+def test_typed(cls, values, dtype):
+    buf = fill(cls(), values)
+    assert type(buf) is cls
+    res = buf.to_numpy()
+    assert res.dtype == dtype
+    assert res.shape == (len(values), )
+    if dtype is object:
+        assert res.tolist() == values
+    else:
+        numpy.testing.assert_array_equal(
+            res, numpy.array(values, dtype=float).astype(dtype))
+
+
+def test_grow():
+    buf = fill(FloatBuffer(), [float(i) for i in range(1000)],
+               flush_every=7)
+    assert len(buf.data) >= 1000
+    res = buf.to_numpy()
+    assert len(res) == 1000
+    assert res.tolist() == list(range(1000))
+
+
+@pytest.mark.parametrize('cls,values,new_cls,dtype', [
+    # Integer with default=None or NaN
+    (IntBuffer, [1, 2, None, 3], FloatBuffer, 'float64'),
+    (IntBuffer, [1, 2, math.nan], FloatBuffer, 'float64'),
+    # Overflow
+    (IntBuffer, [1, 2, 2 ** 70], ObjectBuffer, object),
+    # Overflow after promotion to float is fine
+    (IntBuffer, [1, None, 2 ** 70], FloatBuffer, 'float64'),
+    (FloatBuffer, [1.5, 2.5, 'N/A'], ObjectBuffer, object),
+    (BoolBuffer, [True, False, None], ObjectBuffer, object),
+    (BoolBuffer, [True, False, 1], ObjectBuffer, object),
+])
+def test_promote(cls, values, new_cls, dtype):
+    buf = fill(cls(), values)
+    assert type(buf) is new_cls
+    res = buf.to_numpy()
+    assert res.dtype == dtype
+    if dtype is object:
+        assert res.tolist() == values
+    else:
+        numpy.testing.assert_array_equal(res, numpy.array(
+            [math.nan if v is None else v for v in values], dtype=float))
+
+
+def test_datetime():
+    values = [
+        datetime.datetime(2000, 1, 2, 3, 4, 5, 6),
+        None,
+        numpy.datetime64('2001-01-01'),
+        numpy.datetime64('2002-01-01T00:00:00.000000001'),
+    ]
+    res = fill(DatetimeBuffer(), values).to_numpy()
+    assert res.dtype == 'datetime64[ns]'
+    assert res.astype(str).tolist() == [
+        '2000-01-02T03:04:05.000006000',
+        'NaT',
+        '2001-01-01T00:00:00.000000000',
+        '2002-01-01T00:00:00.000000001',
+    ]
+
+
+@requires_pandas
+def test_datetime_pandas():
+    import pandas
+
+    values = [pandas.Timestamp('2000-01-01 00:00:00.000000001')]
+    res = fill(DatetimeBuffer(), values).to_numpy()
+    assert res.astype(str).tolist() == ['2000-01-01T00:00:00.000000001']
+
+
+@pytest.mark.parametrize('value', [
+    # Out of bounds for datetime64[ns]
+    datetime.datetime(3000, 1, 1),
+    numpy.datetime64('3000-01-01') if has_numpy else None,
+    # Timezone-aware
+    datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc),
+    # Not a datetime
+    datetime.date(2000, 1, 1),
+])
+def test_datetime_promote(value):
+    values = [datetime.datetime(2000, 1, 1), None, value]
+    buf = fill(DatetimeBuffer(), values)
+    assert type(buf) is ObjectBuffer
+    res = buf.to_numpy()
+    assert res[:2].tolist() == values[:2]
+    assert res[2] is value
+
+
+def test_categorical():
+    values = ['b', 'a', None, 'b', 'c']
+    buf = fill(CategoricalBuffer(), values)
+    assert buf.categories == {'b': 0, 'a': 1, 'c': 2}
+    res = buf.to_numpy()
+    assert res.dtype == object
+    assert res.tolist() == values
+
+
+@requires_pandas
+def test_categorical_pandas():
+    values = ['b', 'a', None, 'b', 'c']
+    res = fill(CategoricalBuffer(), values).to_pandas()
+    assert res.categories.tolist() == ['b', 'a', 'c']
+    assert res.tolist()[:2] == ['b', 'a']
+    assert math.isnan(res.tolist()[2])
+
+
+def test_categorical_promote():
+    values = ['b', 'a', None, ['x'], 'c']
+    buf = fill(CategoricalBuffer(), values)
+    assert type(buf) is ObjectBuffer
+    assert buf.to_numpy().tolist() == values
@@ -1,6 +1,7 @@
 import datetime
+import sys
 import pytest
-from fuzzyfields import Timestamp, MalformedFieldError
+from fuzzyfields import Timestamp, FieldTypeError, MalformedFieldError
 from . import has_pandas, requires_pandas
 
 if has_pandas:
@@ -117,3 +118,267 @@ def test_outofbounds_notpandas(output, value, expect, recwarn):
     v = Timestamp(output=output)
     assert v.parse(value) == expect
     assert not recwarn
+
+
+@requires_pandas
+@pytest.mark.parametrize('pinned', [False, True])
+@pytest.mark.parametrize('output,value,expect', [
+    ('numpy', '0001-01-01', numpy.datetime64('0001-01-01')),
+    ('numpy', '0999-06-01', numpy.datetime64('0999-06-01')),
+    ('datetime', '0001-01-01', datetime.datetime(1, 1, 1)),
+    ('datetime', '0999-06-01', datetime.datetime(999, 6, 1)),
+    ('%d/%m', '0999-06-01', '01/06'),
+])
+def test_outofbounds_before_1000(output, value, expect, pinned, recwarn):
+    """Years below 1000 are parsed the same way regardless of the pinned
+    format
+    """
+    v = Timestamp(output=output)
+    if pinned:
+        v.parse('2012-11-10')
+        assert v._pinned_format == '%Y-%m-%d'
+    assert v.parse(value) == expect
+    assert not recwarn
+
+
+@requires_pandas
+@pytest.mark.parametrize('output,expect', [
+    ('pandas', pandas.to_datetime('2012-11-10')),
+    ('numpy', numpy.datetime64('2012-11-10')),
+    ('datetime', datetime.datetime(2012, 11, 10)),
+    ('%Y/%m/%d', '2012/11/10'),
+])
+def test_parse_many(output, expect):
+    v = Timestamp(output=output, required=False)
+    out, errors = v.parse_many(
+        ['10/11/12', ' 2012-11-10 ', 'N/A', 'not a date', '2016-02-30',
+         datetime.date(2012, 11, 10)])
+    assert out.tolist()[:2] == [expect, expect]
+    assert out[2] is None
+    assert out[3] is None
+    assert out[4] is None
+    assert out[5] == expect
+    assert sorted(errors) == [3, 4]
+    assert str(errors[3]) == ("Malformed field: expected date, got "
+                              "'not a date'")
+
+
+@requires_pandas
+def test_parse_many_numpy():
+    v = Timestamp(output='numpy', unique=True)
+    out, errors = v.parse_many(['10/11/12', '2012-11-11'])
+    assert out.dtype == 'datetime64[ns]'
+    assert not errors
+
+    # Duplicates are replaced by the default, None, which doesn't fit in a
+    # datetime64 array
+    out, errors = v.parse_many(['2012-11-10', '2012-11-12'])
+    assert out.dtype == object
+    assert out.tolist() == [None, numpy.datetime64('2012-11-12')]
+    assert list(errors) == [0]
+
+
+@requires_pandas
+@pytest.mark.parametrize('output,expect', [
+    ('pandas', pandas.to_datetime('2012-11-10')),
+    ('datetime', datetime.datetime(2012, 11, 10)),
+    ('%Y/%m/%d', '2012/11/10'),
+])
+def test_explicit_format(output, expect):
+    v = Timestamp(format='%d.%m.%Y', output=output)
+    assert v.parse('10.11.2012') == expect
+    # Non-strings are still accepted
+    assert v.parse(datetime.date(2012, 11, 10)) == expect
+    for value in ('2012-11-10', '10/11/2012', '30.02.2012'):
+        with pytest.raises(MalformedFieldError):
+            v.parse(value)
+
+    out, errors = v.parse_many(
+        ['10.11.2012', '2012-11-10', datetime.date(2012, 11, 10)])
+    assert out[0] == expect
+    assert out[2] == expect
+    assert list(errors) == [1]
+
+
+@requires_pandas
+@pytest.mark.parametrize('output,value,expect', [
+    ('pandas', '1000-01-01', pandas.to_datetime('1677-09-22')),
+    ('pandas', '5000-01-01', pandas.to_datetime('2262-04-11')),
+    ('numpy', '1000-01-01', numpy.datetime64('1000-01-01')),
+    ('datetime', '5000-01-01', datetime.datetime(5000, 1, 1)),
+    ('%Y-%m-%d', '1000-01-01', '1000-01-01'),
+])
+def test_explicit_format_outofbounds(output, value, expect, recwarn):
+    v = Timestamp(format='%Y-%m-%d', output=output)
+    assert v.parse(value) == expect
+    out, errors = v.parse_many([value])
+    assert not errors
+    assert out[0] == expect
+
+
+@requires_pandas
+def test_infer_format():
+    v = Timestamp()
+    assert v.parse('10/11/2012') == pandas.to_datetime('2012-11-10')
+    assert v._pinned_format == '%d/%m/%Y'
+    assert v.parse('13/11/2012') == pandas.to_datetime('2012-11-13')
+    # Values that don't match the pinned format fall back to
+    # pandas.to_datetime
+    assert v.parse('2012-11-10') == pandas.to_datetime('2012-11-10')
+    assert v.parse('10 nov 2012') == pandas.to_datetime('2012-11-10')
+    with pytest.raises(MalformedFieldError):
+        v.parse('30/02/2012')
+    assert v._pinned_format == '%d/%m/%Y'
+
+    v = Timestamp(infer_format=False)
+    assert v.parse('10/11/2012') == pandas.to_datetime('2012-11-10')
+    assert v._pinned_format is None
+
+
+@requires_pandas
+@pytest.mark.parametrize('kwargs,value,fmt', [
+    ({}, '2012-11-10', '%Y-%m-%d'),
+    ({}, '2012-11-10 01:02:03', '%Y-%m-%d %H:%M:%S'),
+    ({'dayfirst': False}, '11/10/2012', '%m/%d/%Y'),
+    # dateutil and strptime disagree on the century of 2-digit years
+    ({}, '10/11/12', None),
+    # Formats that pandas can't guess
+    ({}, '11 mar 2016', None),
+])
+def test_infer_format_pinned(kwargs, value, fmt):
+    v = Timestamp(**kwargs)
+    v.parse(value)
+    assert v._pinned_format == fmt
+
+
+@requires_pandas
+@pytest.mark.parametrize('value', ['2012015', '2012011'])
+def test_infer_format_strict(value):
+    """Strings that strptime would accept with the pinned format, but
+    pandas.to_datetime would not, are rejected exactly like before the
+    format was pinned
+    """
+    with pytest.raises(MalformedFieldError):
+        Timestamp(output='datetime').parse(value)
+    v = Timestamp(output='datetime')
+    assert v.parse('20120115') == datetime.datetime(2012, 1, 15)
+    assert v._pinned_format == '%Y%m%d'
+    with pytest.raises(MalformedFieldError):
+        v.parse(value)
+
+
+@pytest.mark.parametrize('backend', [
+    pytest.param('pandas', marks=requires_pandas), 'stdlib'])
+@pytest.mark.parametrize('fmt,value,expect', [
+    ('%Y%m%d', '20120115', datetime.datetime(2012, 1, 15)),
+    ('%Y%m%d', '2012015', None),
+    ('%Y%m%d', '2012011', None),
+    ('%d/%m/%Y', '5/1/2012', datetime.datetime(2012, 1, 5)),
+    ('%d/%m/%Y', '5/1/12', None),
+    ('%d/%m/%Y %H:%M', '05/01/2012 1:02',
+     datetime.datetime(2012, 1, 5, 1, 2)),
+    ('%d %b %Y', '5 jan 2012', datetime.datetime(2012, 1, 5)),
+])
+def test_explicit_format_strict(backend, fmt, value, expect):
+    """Numbers can only omit their leading zeros between separators
+    """
+    v = Timestamp(format=fmt, output='datetime', backend=backend)
+    if expect is None:
+        with pytest.raises(MalformedFieldError):
+            v.parse(value)
+    else:
+        assert v.parse(value) == expect
+
+
+@pytest.mark.parametrize('value,expect', [
+    ('2012-11-10', datetime.datetime(2012, 11, 10)),
+    (' 2012-11-10T10:11:12 ', datetime.datetime(2012, 11, 10, 10, 11, 12)),
+    ('10/11/2012', datetime.datetime(2012, 11, 10)),
+    ('10.11.12', datetime.datetime(2012, 11, 10)),
+    ('10-11-2012 10:11', datetime.datetime(2012, 11, 10, 10, 11)),
+    ('13/11/2012', datetime.datetime(2012, 11, 13)),
+    ('20121110', datetime.datetime(2012, 11, 10)),
+    ('2012/11/10', datetime.datetime(2012, 11, 10)),
+    ('2012.11.10', datetime.datetime(2012, 11, 10)),
+    ('11 March 2016', datetime.datetime(2016, 3, 11)),
+    ('11th March 2016', datetime.datetime(2016, 3, 11)),
+    ('March 11th, 2016', datetime.datetime(2016, 3, 11)),
+    ('11 mar 2016', datetime.datetime(2016, 3, 11)),
+    ('2016 March 11', datetime.datetime(2016, 3, 11)),
+    ('2016 11th mar', datetime.datetime(2016, 3, 11)),
+    ('March 2016 11', datetime.datetime(2016, 3, 11)),
+    ('11 2016 Mar', datetime.datetime(2016, 3, 11)),
+    ('43831', datetime.datetime(2020, 1, 1)),
+    ('43831.5', datetime.datetime(2020, 1, 1, 12)),
+    (43831, datetime.datetime(2020, 1, 1)),
+    (43831.25, datetime.datetime(2020, 1, 1, 6)),
+    ('1000-01-01', datetime.datetime(1000, 1, 1)),
+    (datetime.date(2012, 11, 10), datetime.datetime(2012, 11, 10)),
+    (datetime.datetime(2012, 11, 10, 1), datetime.datetime(2012, 11, 10, 1)),
+])
+def test_stdlib(value, expect):
+    v = Timestamp(backend='stdlib')
+    assert v.output == 'datetime'
+    assert v.parse(value) == expect
+
+    v = Timestamp(backend='stdlib', output='%Y/%m/%d %H')
+    assert v.parse(value) == expect.strftime('%Y/%m/%d %H')
+
+
+@pytest.mark.parametrize('value', [
+    'not a date', '2016-02-30', '30/02/2016', '1234', 'March 2016'
+])
+def test_stdlib_malformed(value):
+    v = Timestamp(backend='stdlib')
+    with pytest.raises(MalformedFieldError) as e:
+        v.parse(value)
+    assert str(e.value) == f"Malformed field: expected date, got '{value}'"
+
+
+def test_stdlib_params():
+    v = Timestamp(backend='stdlib', dayfirst=False)
+    assert v.parse('10/11/2012') == datetime.datetime(2012, 10, 11)
+    assert v.parse('13/11/2012') == datetime.datetime(2012, 11, 13)
+
+    v = Timestamp(backend='stdlib', format='%d.%m.%Y')
+    assert v.parse('10.11.2012') == datetime.datetime(2012, 11, 10)
+    with pytest.raises(MalformedFieldError):
+        v.parse('2012-11-10')
+
+    with pytest.raises(FieldTypeError):
+        v.parse(True)
+
+    v = Timestamp(backend='stdlib', required=False)
+    assert v.parse_many(['2012-11-10', 'N/A', 'x'])[0] == [
+        datetime.datetime(2012, 11, 10), None, None]
+
+    with pytest.raises(ValueError):
+        Timestamp(backend='stdlib', output='pandas')
+    with pytest.raises(ValueError):
+        Timestamp(backend='stdlib', output='numpy')
+    with pytest.raises(ValueError):
+        Timestamp(backend='stdlib', utc=True)
+    with pytest.raises(ValueError):
+        Timestamp(backend='foo')
+
+
+def test_default_backend(monkeypatch):
+    """The default backend doesn't depend on whether pandas is installed
+    """
+    monkeypatch.setitem(sys.modules, 'pandas', None)
+    with pytest.raises(ImportError) as e:
+        Timestamp()
+    assert "backend='stdlib'" in str(e.value)
+    with pytest.raises(ImportError):
+        Timestamp(backend='pandas')
+    assert Timestamp(backend='stdlib').output == 'datetime'
+
+
+@requires_pandas
+def test_stdlib_pandas_input():
+    v = Timestamp(backend='stdlib')
+    out = v.parse(pandas.Timestamp('2012-11-10 01:02:03'))
+    assert type(out) is datetime.datetime
+    assert out == datetime.datetime(2012, 11, 10, 1, 2, 3)
+    assert v.parse(numpy.datetime64('2012-11-10')) == \
+        datetime.datetime(2012, 11, 10)
@@ -1,7 +1,17 @@
+import bz2
 import csv
+import gzip
 import io
+import lzma
+import sqlite3
+import threading
+import tracemalloc
 import pytest
-from fuzzyfields import DictReader, String, Float, ISOCodeAlpha
+from fuzzyfields import (DictReader, Boolean, Domain, String, Float, Integer,
+                         ISOCodeAlpha, DuplicateError, FuzzyField,
+                         MissingFieldError, ErrorBudgetError, Timestamp,
+                         ValidationError)
+from . import requires_numpy, requires_pandas, requires_pyarrow, speedup
 
 
 class SampleReader(DictReader):
@@ -74,6 +84,17 @@ LOGLINES_CSV = [
 ]
 
 
+def csv_buffer():
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, ['owner', 'price', 'currency', 'other'])
+    writer.writeheader()
+    for row in INPUT_ROWS:
+        writer.writerow({k.strip(): v for k, v in row.items()
+                         if k is not None})
+    buf.seek(0)
+    return buf
+
+
 # Run test twice to verify that uniqueness checks are reset when parsing a
 # new file
 @pytest.mark.parametrize('round', [1, 2])
@@ -90,15 +111,1012 @@ def test_csv_roundtrip(caplog):
     """Same as test_parse, but log lines change to reflect actual row
     numbers on the file. Also test the line_num property.
     """
+    reader = SampleReader(csv.DictReader(csv_buffer()))
+    assert reader.record_num == -1
+    assert reader.line_num == 0
+    rows = list(reader)
+    assert reader.record_num == 8
+    assert reader.line_num == 10
+    assert rows == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 3, 100])
+def test_read_columns_rows(caplog, batch_size):
+    reader = SampleReader(INPUT_ROWS)
+    rows = list(reader.read_columns(batch_size, rows=True))
+    assert reader.record_num == 8
+    assert rows == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES
+
+
+@pytest.mark.parametrize('batch_size', [1, 3, 100])
+def test_read_columns_csv(caplog, batch_size):
+    reader = SampleReader(csv.DictReader(csv_buffer()))
+    rows = list(reader.read_columns(batch_size, rows=True))
+    assert reader.line_num == 10
+    assert rows == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+def test_read_columns():
+    reader = SampleReader(INPUT_ROWS)
+    batches = list(reader.read_columns(3))
+    assert len(batches) == 2
+    out = {}
+    for batch in batches:
+        assert list(batch) == ['user', 'price', 'currency']
+        for k, v in batch.items():
+            out.setdefault(k, []).extend(list(v))
+    assert out == {
+        'user': ['John', 'Jack', 'Bill', 'Jane', 'Todd'],
+        'price': [11.2, 15.7, 1000.7, 2000, 100],
+        'currency': ['EUR', 'EUR', 'GBP', 'GBP', 'GBP'],
+    }
+
+
+def test_read_columns_raise():
+    reader = SampleReader(INPUT_ROWS, errors='raise')
+    with pytest.raises(MissingFieldError) as e:
+        list(reader.read_columns(2, rows=True))
+    assert str(e.value) == 'At record 5: Field price: Missing or blank field'
+
+
+def test_read_columns_postprocess_row():
+    class Reader(SampleReader):
+        def postprocess_row(self, row):
+            if row['user'] != 'Jack':
+                row['price'] *= 2
+                return row
+
+    reader = Reader(INPUT_ROWS)
+    batch, = reader.read_columns()
+    assert batch == {
+        'user': ['John', 'Bill', 'Jane', 'Todd'],
+        'price': [22.4, 2001.4, 4000, 200],
+        'currency': ['EUR', 'GBP', 'GBP', 'GBP'],
+    }
+
+
+def input_dataframe():
+    import pandas
+
+    return pandas.DataFrame(
+        [{k.strip(): v for k, v in row.items() if k is not None}
+         for row in INPUT_ROWS],
+        columns=['owner', 'price', 'currency', 'other'])
+
+
+@requires_pandas
+def test_validate_dataframe(caplog):
+    reader = SampleReader(None)
+    validated, errors = reader.validate_dataframe(input_dataframe())
+    assert reader.record_num == 8
+    assert list(validated.columns) == ['user', 'price', 'currency']
+    assert validated.index.tolist() == [0, 1, 2, 3, 6]
+    assert validated.to_dict('records') == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES
+    assert errors.columns.tolist() == [
+        'record_num', 'field', 'value', 'error', 'message']
+    assert errors[['record_num', 'field', 'error']].values.tolist() == [
+        [5, 'price', 'MissingFieldError'],
+        [6, 'currency', 'MalformedFieldError'],
+        [7, 'owner', 'DuplicateError'],
+        [8, 'price', 'MissingFieldError'],
+        [8, 'currency', 'MalformedFieldError'],
+    ]
+    assert errors['value'].fillna('<NA>').tolist() == [
+        'N/A', 'Pounds', 'Sam', '<NA>', 'blah']
+    assert errors['message'].tolist() == [msg for _, _, msg in LOGLINES]
+
+
+@requires_pandas
+def test_validate_dataframe_missing_column(caplog):
+    df = input_dataframe().drop(columns=['currency'])
+    df.columns = ['  owner', 'price  ', 'other']
+    validated, errors = SampleReader(None).validate_dataframe(df)
+    assert validated['currency'].tolist() == ['GBP'] * 5
+    assert errors['field'].tolist() == ['price', 'owner', 'price']
+
+
+@requires_pandas
+def test_validate_dataframe_postprocess_row():
+    class Reader(SampleReader):
+        def postprocess_row(self, row):
+            if row['user'] != 'Jack':
+                row['price'] *= 2
+                return row
+
+    validated, _ = Reader(None).validate_dataframe(input_dataframe())
+    assert validated.index.tolist() == [0, 2, 3, 6]
+    assert validated.to_dict('list') == {
+        'user': ['John', 'Bill', 'Jane', 'Todd'],
+        'price': [22.4, 2001.4, 4000, 200],
+        'currency': ['EUR', 'GBP', 'GBP', 'GBP'],
+    }
+
+
+@requires_pandas
+def test_validate_dataframe_raise():
+    reader = SampleReader(None, errors='raise')
+    with pytest.raises(MissingFieldError) as e:
+        reader.validate_dataframe(input_dataframe())
+    assert str(e.value) == 'At record 5: Field price: Missing or blank field'
+
+
+def input_table():
+    import pyarrow
+
+    return pyarrow.Table.from_pylist(
+        [{k.strip(): None if v is None else str(v)
+          for k, v in row.items() if k is not None}
+         for row in INPUT_ROWS])
+
+
+@requires_pyarrow
+@pytest.mark.parametrize('batch_size', [None, 1, 2, 4, 100])
+def test_validate_arrow(caplog, batch_size):
+    import pyarrow
+
+    reader = SampleReader(None)
+    out = list(reader.validate_arrow(input_table(), batch_size=batch_size))
+    assert len(out) == (1 if batch_size is None else -(-9 // batch_size))
+    assert reader.record_num == 8
+    for validated, _ in out:
+        assert validated.schema.names == ['user', 'price', 'currency']
+        assert validated.schema.field('price').type == pyarrow.float64()
+    assert [row for v, _ in out for row in v.to_pylist()] == OUTPUT_ROWS
+    errors = pyarrow.Table.from_batches([e for _, e in out])
+    assert caplog.record_tuples == LOGLINES
+    assert errors.to_pydict() == {
+        'record_num': [5, 6, 7, 8, 8],
+        'field': ['price', 'currency', 'owner', 'price', 'currency'],
+        'value': ['N/A', 'Pounds', 'Sam', None, 'blah'],
+        'error': ['MissingFieldError', 'MalformedFieldError',
+                  'DuplicateError', 'MissingFieldError',
+                  'MalformedFieldError'],
+        'message': [msg for _, _, msg in LOGLINES],
+    }
+
+
+@requires_pyarrow
+def test_validate_arrow_batches(caplog):
+    """Iterable of RecordBatches; record numbers keep counting across them
+    """
+    batches = input_table().to_batches(max_chunksize=4)
+    reader = SampleReader(None)
+    out = list(reader.validate_arrow(iter(batches)))
+    assert len(out) == 3
+    assert [row for v, _ in out for row in v.to_pylist()] == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES
+    assert reader.record_num == 8
+
+    validated, errors = next(SampleReader(None).validate_arrow(batches[1]))
+    assert validated.to_pylist() == [
+        {'user': 'Todd', 'price': 100, 'currency': 'GBP'}]
+    assert errors['record_num'].to_pylist() == [1, 2, 3]
+
+
+@requires_pyarrow
+def test_validate_arrow_missing_column(caplog):
+    table = input_table().drop(['currency'])
+    table = table.rename_columns([
+        {'owner': '  owner', 'price': 'price  '}.get(name, name)
+        for name in table.column_names])
+    validated, errors = next(SampleReader(None).validate_arrow(table))
+    assert validated['currency'].to_pylist() == ['GBP'] * 5
+    assert errors['field'].to_pylist() == ['price', 'owner', 'price']
+
+
+@requires_pyarrow
+def test_validate_arrow_types(caplog):
+    """Numeric, boolean, timestamp and dictionary columns
+    """
+    import datetime
+    import pyarrow
+
+    class Reader(DictReader):
+        fields = {
+            'f': Float(required=False),
+            'i': Integer(required=False),
+            'big': Integer(required=False),
+            'b': Boolean(required=False),
+            'ts': Timestamp(required=False, output='datetime'),
+            'd': Domain(['x', 'y'], required=False),
+        }
+        errors = 'error'
+
+    table = pyarrow.table({
+        'f': pyarrow.array([1.5, None, float('nan'), 2]),
+        'i': pyarrow.array([1, None, 3, -2], pyarrow.int32()),
+        'big': pyarrow.array([2 ** 62, None, 1, 2], pyarrow.int64()),
+        'b': pyarrow.array([True, None, False, True]),
+        'ts': pyarrow.array([
+            datetime.datetime(2020, 1, 2), None,
+            datetime.datetime(2020, 1, 3, 12), None],
+            pyarrow.timestamp('us')),
+        'd': pyarrow.array(['x', None, 'z', 'y']).dictionary_encode(),
+    })
+    validated, errors = next(Reader(None).validate_arrow(table))
+    assert validated.schema.types[:5] == [
+        pyarrow.float64(), pyarrow.int64(), pyarrow.int64(), pyarrow.bool_(),
+        pyarrow.timestamp('ns')]
+    # Record 1 is blank
+    assert validated.to_pydict() == {
+        'f': [1.5, None, 2.0],
+        'i': [1, 3, -2],
+        'big': [2 ** 62, 1, 2],
+        'b': [True, False, True],
+        'ts': [datetime.datetime(2020, 1, 2),
+               datetime.datetime(2020, 1, 3, 12), None],
+        'd': ['x', None, 'y'],
+    }
+    assert errors.to_pydict()['value'] == ['z']
+    assert caplog.record_tuples == [
+        ('root', 40, "At record 2: Field d: value 'z' is not acceptable "
+                     "(choices: x,y)"),
+    ]
+
+
+@requires_pyarrow
+def test_validate_arrow_postprocess_row():
+    class Reader(SampleReader):
+        def postprocess_row(self, row):
+            if row['user'] != 'Jack':
+                row['price'] *= 2
+                return row
+
+    out = Reader(None).validate_arrow(input_table(), batch_size=2)
+    assert [row for v, _ in out for row in v.to_pylist()] == [
+        {'user': 'John', 'price': 22.4, 'currency': 'EUR'},
+        {'user': 'Bill', 'price': 2001.4, 'currency': 'GBP'},
+        {'user': 'Jane', 'price': 4000, 'currency': 'GBP'},
+        {'user': 'Todd', 'price': 200, 'currency': 'GBP'},
+    ]
+
+
+@requires_pyarrow
+def test_validate_arrow_raise():
+    reader = SampleReader(None, errors='raise')
+    with pytest.raises(MissingFieldError) as e:
+        list(reader.validate_arrow(input_table()))
+    assert str(e.value) == 'At record 5: Field price: Missing or blank field'
+    with pytest.raises(ValueError):
+        list(reader.validate_arrow(input_table(), batch_size=0))
+
+
+@requires_pyarrow
+@pytest.mark.parametrize('batch_size', [None, 2])
+def test_write_parquet(caplog, tmp_path, batch_size):
+    import pyarrow.parquet
+
+    pyarrow.parquet.write_table(input_table(), tmp_path / 'in.parquet')
+    source = pyarrow.parquet.ParquetFile(tmp_path / 'in.parquet')
+    SampleReader(None).write_parquet(
+        source.iter_batches(batch_size=3), tmp_path / 'out.parquet',
+        tmp_path / 'errors.parquet', batch_size=batch_size)
+    validated = pyarrow.parquet.read_table(tmp_path / 'out.parquet')
+    errors = pyarrow.parquet.read_table(tmp_path / 'errors.parquet')
+    assert validated.to_pylist() == OUTPUT_ROWS
+    assert errors['record_num'].to_pylist() == [5, 6, 7, 8, 8]
+    assert caplog.record_tuples == LOGLINES
+
+
+@requires_pyarrow
+def test_write_parquet_schema(tmp_path):
+    """Columns that are entirely null in the first batch take the type of the
+    matching field, or an explicit schema
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    class Reader(DictReader):
+        fields = {
+            'x': Integer(required=False),
+            'y': String(required=False),
+        }
+
+    table = pyarrow.table({'x': [1, None], 'y': [None, 'foo']})
+    path = tmp_path / 'out.parquet'
+    Reader(None).write_parquet(table.select(['x']), path)
+    assert pyarrow.parquet.read_schema(path).types == [
+        pyarrow.int64(), pyarrow.null()]
+
+    schema = pyarrow.schema([('x', pyarrow.int64()), ('y', pyarrow.string())])
+    Reader(None).write_parquet(table, path, batch_size=1, schema=schema)
+    assert pyarrow.parquet.read_table(path).to_pydict() == {
+        'x': [1, None], 'y': [None, 'foo']}
+
+    # Empty input
+    Reader(None).write_parquet([], path, tmp_path / 'errors.parquet')
+    assert pyarrow.parquet.read_table(path).num_rows == 0
+    assert pyarrow.parquet.read_table(tmp_path / 'errors.parquet'
+                                      ).column_names == [
+        'record_num', 'field', 'value', 'error', 'message']
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 100])
+def test_parallel(caplog, chunk_size):
+    reader = SampleReader(INPUT_ROWS, workers=2, chunk_size=chunk_size)
+    assert list(reader) == OUTPUT_ROWS
+    assert reader.record_num == 8
+    assert caplog.record_tuples == LOGLINES
+
+
+def test_parallel_csv(caplog):
+    reader = SampleReader(csv.DictReader(csv_buffer()), workers=2,
+                          chunk_size=3)
+    assert list(reader) == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+def test_parallel_raise():
+    reader = SampleReader(INPUT_ROWS, errors='raise', workers=2,
+                          chunk_size=2)
+    with pytest.raises(MissingFieldError) as e:
+        list(reader)
+    assert str(e.value) == 'At record 5: Field price: Missing or blank field'
+
+
+def test_parallel_passthrough(caplog):
+    rows = [{'owner': 'John', 'ref': 'John'},
+            {'owner': 'Jack', 'ref': 'Bill'},
+            {'owner': 'Bill', 'ref': 'Jack'}]
+    reader = DictReader(rows, {'owner': String(unique=True)},
+                        errors='error', workers=2, chunk_size=1)
+    ref = Domain(reader.fields['owner'].seen_values, passthrough=True)
+    ref.name = 'ref'
+    reader.fields['ref'] = ref
+    assert list(reader) == [{'owner': 'John', 'ref': 'John'},
+                            {'owner': 'Bill', 'ref': 'Jack'}]
+    assert caplog.record_tuples == [
+        ('root', 40, "At record 1: Field ref: value 'Bill' is not "
+                     "acceptable (choices: Jack,John)")]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_unique_store_passthrough(workers, caplog):
+    rows = [{'owner': 'John', 'ref': 'John'},
+            {'owner': 'Jack', 'ref': 'Bill'},
+            {'owner': 'John', 'ref': 'Jack'}]
+    reader = DictReader(
+        rows, {'owner': String(unique=True, unique_store='disk')},
+        errors='error', workers=workers, chunk_size=1)
+    ref = Domain(reader.fields['owner'].seen_values, passthrough=True)
+    ref.name = 'ref'
+    reader.fields['ref'] = ref
+    assert list(reader) == [{'owner': 'John', 'ref': 'John'}]
+    assert caplog.record_tuples == [
+        ('root', 40, "At record 1: Field ref: value 'Bill' is not "
+                     "acceptable (choices: <SpillingSet: 2 values>)"),
+        ('root', 40, "At record 2: Field owner: Duplicate value: 'John'")]
+
+
+def test_workers_invalid():
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, workers=0)
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, chunk_size=0)
+
+
+COLLECTED_ERRORS = [
+    (5, 'price', 'MissingFieldError', None),
+    (6, 'currency', 'MalformedFieldError', 'Pounds'),
+    (7, 'owner', 'DuplicateError', 'Sam'),
+    (8, 'price', 'MissingFieldError', None),
+    (8, 'currency', 'MalformedFieldError', 'blah'),
+]
+
+
+@pytest.mark.parametrize('mode', ['iter', 'read_columns', 'parallel'])
+def test_errors_collect(caplog, mode):
+    reader = SampleReader(INPUT_ROWS, errors='collect')
+    if mode == 'iter':
+        rows = list(reader)
+    elif mode == 'read_columns':
+        rows = list(reader.read_columns(batch_size=2, rows=True))
+    else:
+        reader.workers = 2
+        reader.chunk_size = 2
+        rows = list(reader)
+    assert rows == OUTPUT_ROWS
+    assert caplog.record_tuples == []
+    report = reader.error_report
+    assert [(record_num, field, error, value)
+            for record_num, _, field, error, value in report] \
+        == COLLECTED_ERRORS
+    assert report.counts == {
+        ('price', 'MissingFieldError'): 2,
+        ('currency', 'MalformedFieldError'): 2,
+        ('owner', 'DuplicateError'): 1,
+    }
+    assert report.samples[('currency', 'MalformedFieldError')] == [
+        'Pounds', 'blah']
+
+
+def test_errors_collect_csv():
+    reader = SampleReader(csv.DictReader(csv_buffer()), errors='collect')
+    assert list(reader) == OUTPUT_ROWS
+    assert list(reader.error_report.line_nums) == [7, 8, 9, 10, 10]
+
+
+def test_errors_collect_set_later():
+    reader = SampleReader(INPUT_ROWS)
+    assert reader.error_report is None
+    reader.errors = 'collect'
+    assert list(reader) == OUTPUT_ROWS
+    assert len(reader.error_report) == 5
+
+
+@pytest.mark.parametrize('mode', ['iter', 'parallel'])
+def test_errors_collect_no_exceptions(monkeypatch, mode):
+    """With errors='collect', the errors returned by the built-in fields are
+    never turned into exceptions
+    """
+    def make_error(name, error):
+        assert isinstance(error, ValidationError)
+        return error
+
+    monkeypatch.setattr('fuzzyfields.dictreader.make_error', make_error)
+    reader = SampleReader(INPUT_ROWS, errors='collect')
+    if mode == 'parallel':
+        reader.workers = 2
+        reader.chunk_size = 2
+    assert list(reader) == OUTPUT_ROWS
+    assert [(record_num, field, error, value)
+            for record_num, _, field, error, value in reader.error_report] \
+        == COLLECTED_ERRORS
+
+
+def test_try_parse_override():
+    """A custom FuzzyField.try_parse() is used by the reader
+    """
+    class Lenient(Float):
+        def try_parse(self, value):
+            ok, res = super().try_parse(value)
+            return True, res if ok else -1.0
+
+    class Reader(DictReader):
+        fields = {'x': Lenient()}
+
+    assert list(Reader([{'x': '1'}, {'x': 'foo'}])) == [
+        {'x': 1.0}, {'x': -1.0}]
+
+
+class CollectReader(DictReader):
+    fields = {
+        f'col{i}': Float(required=False) for i in range(20)
+    }
+    errors = 'collect'
+
+
+def test_try_parse_no_exceptions(monkeypatch):
+    """With errors='collect', invalid values are collected without building
+    exception objects
+    """
+    reader = CollectReader(None)
+    reader.record_num = 0
+    row = {f'col{i}': 'x' for i in range(20)}
+    parse_row = reader._get_row_parser(tuple(row), 'dict')
+    expect = reader._parse_row(row)
+    assert len(reader.error_report) == 20
+
+    def fail(*args, **kwargs):
+        raise AssertionError("exception object was built")
+
+    monkeypatch.setattr(ValidationError, '__init__', fail)
+    assert parse_row(row) == expect
+    assert len(reader.error_report) == 40
+    assert reader.error_report.counts[('col0', 'MalformedFieldError')] == 2
+
+
+@pytest.mark.benchmark
+def test_try_parse_benchmark():
+    """Micro-benchmark: with errors='collect', invalid values must be
+    substantially cheaper than raising and catching exceptions
+    """
+    reader = CollectReader(None)
+    reader.record_num = 0
+    row = {f'col{i}': 'x' for i in range(20)}
+    parse_row = reader._get_row_parser(tuple(row), 'dict')
+    assert speedup(lambda: parse_row(row), lambda: reader._parse_row(row),
+                   number=200) > 1.3
+
+
+@pytest.mark.parametrize('mode', ['iter', 'read_columns', 'parallel'])
+def test_max_errors(caplog, mode):
+    reader = SampleReader(INPUT_ROWS, max_errors=2)
+    if mode == 'iter':
+        it = iter(reader)
+    elif mode == 'read_columns':
+        it = reader.read_columns(batch_size=2, rows=True)
+    else:
+        reader.workers = 2
+        reader.chunk_size = 2
+        it = iter(reader)
+
+    with pytest.raises(ErrorBudgetError) as e:
+        for row in it:
+            pass
+    assert str(e.value) == (
+        "At record 7: Too many validation errors: 3 errors in 8 records "
+        "(price: 1, currency: 1, owner: 1)")
+    assert e.value.counts == {'price': 1, 'currency': 1, 'owner': 1}
+    assert e.value.num_errors == 3
+    assert e.value.num_records == 8
+    # The error that exceeded the budget was reported
+    assert caplog.record_tuples == LOGLINES[:3]
+
+
+def test_max_errors_csv():
+    reader = SampleReader(csv.DictReader(csv_buffer()), max_errors=0,
+                          errors='collect')
+    with pytest.raises(ErrorBudgetError) as e:
+        list(reader)
+    assert str(e.value) == ('At line 7: Too many validation errors: 1 errors '
+                            'in 6 records (price: 1)')
+    assert len(reader.error_report) == 1
+
+
+class BudgetReader(DictReader):
+    fields = {
+        'a': Integer(),
+        'b': Integer(required=False),
+    }
+
+
+def budget_rows(n, every):
+    """n rows, where every n-th row has an error in a and b
+    """
+    return [{'a': 'x', 'b': 'y'} if i % every == 0 else {'a': '1', 'b': '2'}
+            for i in range(1, n + 1)]
+
+
+def test_max_error_rate():
+    # 25% of records have errors
+    reader = BudgetReader(budget_rows(100, 4), max_error_rate=0.25,
+                          error_rate_min_records=10, errors='collect')
+    assert len(list(reader)) == 75
+    # The rate counts records, not errors
+    assert len(reader.error_report) == 50
+
+    # Counters are reset when the iteration restarts
+    assert len(list(reader)) == 75
+
+    reader.max_error_rate = 0.2
+    with pytest.raises(ErrorBudgetError) as e:
+        list(reader)
+    # After 4 records, 1 has errors, but the rate is enforced from 10
+    # records onwards
+    assert e.value.num_records == 12
+    # Abort on the first error of the record
+    assert e.value.num_errors == 5
+    assert e.value.counts == {'a': 3, 'b': 2}
+
+    reader.error_rate_min_records = 1
+    with pytest.raises(ErrorBudgetError) as e:
+        list(reader)
+    assert e.value.num_records == 4
+
+
+@requires_pandas
+def test_max_errors_dataframe():
+    with pytest.raises(ErrorBudgetError):
+        SampleReader(None, max_errors=4).validate_dataframe(input_dataframe())
+    SampleReader(None, max_errors=5).validate_dataframe(input_dataframe())
+
+
+def test_error_budget_invalid():
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, max_errors=-1)
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, max_error_rate=1.1)
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, max_error_rate=-0.1)
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, error_rate_min_records=0)
+
+
+def test_error_budget_pickle():
+    import pickle
+
+    exc = ErrorBudgetError({'a': 1}, 1, 2)
+    exc.record_num = 1
+    exc2 = pickle.loads(pickle.dumps(exc))
+    assert str(exc2) == str(exc)
+
+
+def test_row_parser(caplog):
+    """The generated row parser behaves exactly like the reference
+    implementation DictReader._parse_row
+    """
+    class ReferenceReader(SampleReader):
+        def _get_row_parser(self, header, output):
+            return self._parse_row
+
+    assert list(ReferenceReader(INPUT_ROWS)) == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES
+    caplog.clear()
+    assert list(SampleReader(INPUT_ROWS)) == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES
+
+
+def test_row_parser_rebuild():
+    """The row parser is regenerated when fields or name_map change
+    """
+    reader = SampleReader(INPUT_ROWS[:1])
+    assert list(reader) == OUTPUT_ROWS[:1]
+    reader.name_map = {}
+    del reader.fields['currency']
+    reader.fields['price'].default = 0
+    reader.iterable = INPUT_ROWS[1:2]
+    assert list(reader) == [{'owner': 'Jack', 'price': 15.7}]
+    # Changing required/default does not require a rebuild
+    reader.fields['price'].required = False
+    reader.iterable = [{'owner': 'Todd', 'price': 'N/A'}]
+    assert list(reader) == [{'owner': 'Todd', 'price': 0}]
+
+
+class TradeReader(DictReader):
+    """Reader with composite unique constraints
+    """
+    fields = {
+        'portfolio': String(),
+        'trade_id': Integer(),
+        'ref': String(required=False),
+        'amount': Float(),
+    }
+    errors = 'error'
+    name_map = {'trade_id': 'id'}
+    unique_together = [('portfolio', 'trade_id'), ('portfolio', 'ref')]
+
+
+TRADE_ROWS = [
+    {'portfolio': 'P1', 'trade_id': '1', 'ref': 'a', 'amount': '10'},
+    {'portfolio': 'P2', 'trade_id': '1', 'ref': 'a', 'amount': '20'},
+    # Duplicate portfolio, trade_id; spurious whitespace and float
+    {'portfolio': ' P1 ', 'trade_id': '1.0', 'ref': 'b', 'amount': '30'},
+    # Discarded because of a required field; doesn't count
+    {'portfolio': 'P1', 'trade_id': '2', 'ref': 'c', 'amount': 'x'},
+    {'portfolio': 'P1', 'trade_id': '2', 'ref': 'c', 'amount': '40'},
+    # Both constraints violated
+    {'portfolio': 'P2', 'trade_id': '1', 'ref': 'a', 'amount': '50'},
+    # ref is None, so the second constraint is not checked
+    {'portfolio': 'P1', 'trade_id': '3', 'ref': 'N/A', 'amount': '60'},
+    {'portfolio': 'P1', 'trade_id': '4', 'ref': '', 'amount': '70'},
+]
+
+TRADE_OUTPUT = [
+    {'portfolio': 'P1', 'id': 1, 'ref': 'a', 'amount': 10.0},
+    {'portfolio': 'P2', 'id': 1, 'ref': 'a', 'amount': 20.0},
+    {'portfolio': 'P1', 'id': 2, 'ref': 'c', 'amount': 40.0},
+    {'portfolio': 'P1', 'id': 3, 'ref': None, 'amount': 60.0},
+    {'portfolio': 'P1', 'id': 4, 'ref': None, 'amount': 70.0},
+]
+
+TRADE_LOGLINES = [
+    ('root', 40, "At record 2: Field portfolio, trade_id: Duplicate value: "
+                 "'('P1', 1)'"),
+    ('root', 40, "At record 3: Field amount: Malformed field: expected "
+                 "number, got 'x'"),
+    ('root', 40, "At record 5: Field portfolio, trade_id: Duplicate value: "
+                 "'('P2', 1)'"),
+    ('root', 40, "At record 5: Field portfolio, ref: Duplicate value: "
+                 "'('P2', 'a')'"),
+]
+
+
+@pytest.mark.parametrize('mode', [
+    'iter', 'reference', 'tuple', 'read_columns', 'parallel'])
+def test_unique_together(caplog, mode):
+    reader = TradeReader(TRADE_ROWS)
+    if mode == 'iter':
+        rows = list(reader)
+    elif mode == 'reference':
+        reader._get_row_parser = lambda header, output: reader._parse_row
+        rows = list(reader)
+    elif mode == 'tuple':
+        reader.output = 'tuple'
+        rows = [dict(zip(TRADE_OUTPUT[0], row)) for row in reader]
+    elif mode == 'read_columns':
+        rows = list(reader.read_columns(batch_size=3, rows=True))
+    else:
+        reader.workers = 2
+        reader.chunk_size = 3
+        rows = list(reader)
+    assert rows == TRADE_OUTPUT
+    assert caplog.record_tuples == TRADE_LOGLINES
+    assert len(reader.unique_together_values[('portfolio', 'trade_id')]) == 5
+    assert len(reader.unique_together_values[('portfolio', 'ref')]) == 3
+
+    # The values persist across iterations, like FuzzyField.unique
+    reader.iterable = TRADE_ROWS[:1]
+    assert list(reader) == []
+
+
+@pytest.mark.parametrize('unique_store', [
+    'disk', pytest.param('fingerprint', marks=requires_numpy)])
+def test_unique_together_store(unique_store):
+    reader = TradeReader(TRADE_ROWS, errors='collect',
+                         unique_store=unique_store)
+    assert list(reader) == TRADE_OUTPUT
+    assert [(record_num, field, error, value)
+            for record_num, _, field, error, value in reader.error_report
+            if error == 'DuplicateError'] == [
+        (2, 'portfolio, trade_id', 'DuplicateError', ('P1', 1)),
+        (5, 'portfolio, trade_id', 'DuplicateError', ('P2', 1)),
+        (5, 'portfolio, ref', 'DuplicateError', ('P2', 'a')),
+    ]
+    assert type(reader.unique_together_values[
+        ('portfolio', 'trade_id')]).__name__ in (
+            'SpillingSet', 'FingerprintSet')
+
+
+def test_unique_together_raise():
+    reader = TradeReader(TRADE_ROWS, errors='raise')
+    with pytest.raises(DuplicateError) as e:
+        list(reader)
+    assert e.value.name == 'portfolio, trade_id'
+    assert e.value.value == ('P1', 1)
+    assert e.value.record_num == 2
+
+
+def test_unique_together_unhashable():
+    class Anything(FuzzyField):
+        def validate(self, value):
+            return value
+
+        @property
+        def sphinxdoc(self):
+            return "Anything goes"
+
+    class JSONReader(DictReader):
+        fields = {'a': Anything(), 'b': Anything()}
+        unique_together = [('a', 'b')]
+        errors = 'collect'
+
+    reader = JSONReader([{'a': [1], 'b': {'x': 1, 'y': 2}},
+                         {'a': [1], 'b': {'y': 2, 'x': 1}},
+                         {'a': [1], 'b': {'x': 2}}])
+    assert len(list(reader)) == 2
+    assert [error for _, _, _, error, _ in reader.error_report] == [
+        'DuplicateError']
+
+
+def test_unique_together_invalid():
+    with pytest.raises(KeyError) as e:
+        TradeReader(None, unique_together=[('portfolio', 'foo', 'bar')])
+    assert str(e.value) == (
+        "'Field(s) in unique_together not found in fields: bar, foo'")
+    for unique_together in (['portfolio'], [()]):
+        with pytest.raises(ValueError):
+            TradeReader(None, unique_together=unique_together)
+    with pytest.raises(ValueError):
+        TradeReader(None, unique_store='list')
+
+
+@requires_pandas
+def test_unique_together_dataframe():
+    import pandas
+
+    reader = TradeReader(None)
+    validated, errors = reader.validate_dataframe(
+        pandas.DataFrame(TRADE_ROWS))
+    assert validated.to_dict('records') == TRADE_OUTPUT
+    assert errors[['record_num', 'field', 'value']].values.tolist() == [
+        [2, 'portfolio, trade_id', ('P1', 1)],
+        [3, 'amount', 'x'],
+        [5, 'portfolio, trade_id', ('P2', 1)],
+        [5, 'portfolio, ref', ('P2', 'a')],
+    ]
+
+
+@requires_pyarrow
+def test_unique_together_arrow():
+    import pyarrow
+
+    reader = TradeReader(None)
+    (validated, errors), = reader.validate_arrow(
+        pyarrow.Table.from_pylist(TRADE_ROWS))
+    assert validated.to_pylist() == TRADE_OUTPUT
+    assert errors.to_pydict()['field'] == [
+        'portfolio, trade_id', 'amount', 'portfolio, trade_id',
+        'portfolio, ref']
+    assert errors.to_pydict()['value'] == [
+        "('P1', 1)", 'x', "('P2', 1)", "('P2', 'a')"]
+
+
+def test_header_plan():
+    reader = SampleReader(None)
+    assert reader._header_plan(
+        ['  owner', 'price ', 'other', None]) == {
+            'owner': '  owner', 'price': 'price '}
+
+
+def test_header_change(caplog):
+    """Rows with different keys, or keys in a different order, get the
+    same result
+    """
+    rows = [
+        {'owner': 'John', 'price': '1', 'currency': 'EUR'},
+        {'  price': '2', ' owner': 'Jack'},
+        {'currency': 'USD', 'owner': 'Bill', 'price': '3'},
+        {'owner': 'Jane', 'price': '4', None: ['x']},
+        {'owner': 'Sam', 'price': '5', 'currency': 'USD', 'other': 'x'},
+        {'owner': '  ', 'price': ' ', None: ['  ']},
+        {'owner': 'Todd', 'price': '6', 'currency': 'blah'},
+    ]
+    assert list(SampleReader(rows)) == [
+        {'user': 'John', 'price': 1, 'currency': 'EUR'},
+        {'user': 'Jack', 'price': 2, 'currency': 'GBP'},
+        {'user': 'Bill', 'price': 3, 'currency': 'USD'},
+        {'user': 'Jane', 'price': 4, 'currency': 'GBP'},
+        {'user': 'Sam', 'price': 5, 'currency': 'USD'},
+        {'user': 'Todd', 'price': 6, 'currency': 'GBP'},
+    ]
+    assert caplog.record_tuples == [
+        ('root', 40, "At record 6: Field currency: Malformed field: expected "
+                     "3 letters ISO code (case insensitive), got 'blah'")]
+
+
+@pytest.mark.parametrize('mode', ['iter', 'read_columns', 'parallel'])
+def test_header_duplicate_stripped(mode):
+    """When multiple keys are the same after stripping whitespace, the last
+    one in the row wins, regardless of the hash seed
+    """
+    rows = [
+        {'owner': 'John', 'price': '1', ' price ': '2'},
+        {'owner': 'Jack', ' price ': '3', 'price': '4'},
+        {'owner': 'Bill', 'price': '5', ' price ': '6'},
+    ]
+    reader = SampleReader(rows)
+    if mode == 'iter':
+        out = list(reader)
+    elif mode == 'read_columns':
+        out = list(reader.read_columns(batch_size=2, rows=True))
+    else:
+        reader.workers = 2
+        reader.chunk_size = 2
+        out = list(reader)
+    assert [row['price'] for row in out] == [2, 4, 6]
+
+
+def test_header_missing_column(caplog):
+    """Missing columns are reported at every row for required fields and
+    replaced with the default for optional fields, including when the
+    field settings change after the row parser has been generated
+    """
+    rows = [{'owner': 'John'}, {'owner': 'Jack'}]
+    reader = SampleReader(rows[:1])
+    assert list(reader) == []
+    reader.fields['price'].required = False
+    reader.fields['price'].default = 0
+    reader.fields['currency'].default = 'USD'
+    reader.iterable = rows[1:]
+    assert list(reader) == [{'user': 'Jack', 'price': 0, 'currency': 'USD'}]
+    assert caplog.record_tuples == [
+        ('root', 40, 'At record 0: Field price: Missing or blank field')]
+
+
+def missing_price_csv():
     buf = io.StringIO()
-    writer = csv.DictWriter(buf, ['owner', 'price', 'currency', 'other'])
-    writer.writeheader()
-    for row in INPUT_ROWS:
-        writer.writerow({k.strip(): v for k, v in row.items()})
+    writer = csv.writer(buf)
+    writer.writerow(['owner', 'currency'])
+    writer.writerow(['John', 'EUR'])
+    writer.writerow([])
+    writer.writerow(['Jack', 'USD'])
     buf.seek(0)
-    reader = SampleReader(csv.DictReader(buf))
+    return buf
+
+
+@pytest.mark.parametrize('positional', [False, True])
+def test_missing_columns_skip(positional):
+    errors = []
+    if positional:
+        reader = SampleReader(csv.reader(missing_price_csv()), header=True,
+                              errors=errors.append)
+    else:
+        reader = SampleReader(csv.DictReader(missing_price_csv()),
+                              errors=errors.append)
+    assert list(reader) == []
+    # Reported once, at the header line
+    assert [str(exc) for exc in errors] == [
+        'At line 1: Field price: Missing or blank field']
+
+    # Same with an empty file
+    errors.clear()
+    reader.iterable = csv.DictReader(io.StringIO('owner,currency\n'))
+    reader.header = None
+    assert list(reader) == []
+    assert len(errors) == 1
+
+
+@pytest.mark.parametrize('mode', ['iter', 'read_columns', 'parallel'])
+def test_missing_columns_default(mode):
+    errors = []
+    reader = SampleReader(csv.DictReader(missing_price_csv()),
+                          missing_columns='default', errors=errors.append)
+    reader.fields['price'].default = -1
+    if mode == 'iter':
+        rows = list(reader)
+    elif mode == 'read_columns':
+        rows = list(reader.read_columns(batch_size=1, rows=True))
+    else:
+        reader.workers = 2
+        reader.chunk_size = 1
+        rows = list(reader)
+    assert rows == [
+        {'user': 'John', 'price': -1, 'currency': 'EUR'},
+        {'user': 'Jack', 'price': -1, 'currency': 'USD'},
+    ]
+    assert [str(exc) for exc in errors] == [
+        'At line 1: Field price: Missing or blank field']
+
+
+def test_missing_columns_raise():
+    reader = SampleReader(csv.DictReader(missing_price_csv()),
+                          errors='raise')
+    with pytest.raises(MissingFieldError) as e:
+        next(iter(reader))
+    assert str(e.value) == 'At line 1: Field price: Missing or blank field'
+    assert reader.iterable.line_num == 1
+
+
+@pytest.mark.parametrize('missing_columns', ['skip', 'default'])
+@pytest.mark.parametrize('mode', ['iter', 'read_columns', 'parallel'])
+def test_missing_columns_first_row(caplog, missing_columns, mode):
+    """Without a header or fieldnames, the keys of the first row are not
+    treated as a header: missing fields are reported on every row, and the
+    valid rows are still yielded
+    """
+    rows = [
+        {'owner': 'John', 'currency': 'EUR'},
+        {'owner': 'Jack', 'price': '1'},
+        {'owner': 'Jane'},
+        {'owner': 'Bill', 'price': '2', 'currency': 'USD'},
+    ]
+    reader = SampleReader(rows, missing_columns=missing_columns)
+    if mode == 'iter':
+        out = list(reader)
+    elif mode == 'read_columns':
+        out = list(reader.read_columns(batch_size=3, rows=True))
+    else:
+        reader.workers = 2
+        reader.chunk_size = 3
+        out = list(reader)
+    assert out == [
+        {'user': 'Jack', 'price': 1, 'currency': 'GBP'},
+        {'user': 'Bill', 'price': 2, 'currency': 'USD'},
+    ]
+    assert caplog.record_tuples == [
+        ('root', 40, 'At record 0: Field price: Missing or blank field'),
+        ('root', 40, 'At record 2: Field price: Missing or blank field'),
+    ]
+
+
+def test_missing_columns_preprocess_row():
+    """fieldnames are ignored when preprocess_row() may change the keys
+    """
+    class Reader(SampleReader):
+        def preprocess_row(self, row):
+            row['price'] = '1'
+            return row
+
+    reader = Reader(csv.DictReader(missing_price_csv()))
+    assert [row['price'] for row in reader] == [1, 1]
+
+
+def test_missing_columns_invalid():
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, missing_columns='foo')
+
+
+def test_positional_csv(caplog):
+    """Same as test_csv_roundtrip, with csv.reader instead of
+    csv.DictReader
+    """
+    reader = SampleReader(csv.reader(csv_buffer()), header=True)
     assert reader.record_num == -1
-    assert reader.line_num == 0
     rows = list(reader)
     assert reader.record_num == 8
     assert reader.line_num == 10
@@ -106,6 +1124,423 @@ def test_csv_roundtrip(caplog):
     assert caplog.record_tuples == LOGLINES_CSV
 
 
+@pytest.mark.parametrize('batch_size', [1, 3, 100])
+def test_positional_read_columns(caplog, batch_size):
+    reader = SampleReader(csv.reader(csv_buffer()), header=True)
+    rows = list(reader.read_columns(batch_size, rows=True))
+    assert rows == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+def test_positional_parallel(caplog):
+    reader = SampleReader(csv.reader(csv_buffer()), header=True, workers=2,
+                          chunk_size=3)
+    assert list(reader) == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+def test_positional_header():
+    """Explicit header, with spurious whitespace. Short rows are padded with
+    None; excess cells are ignored
+    """
+    rows = [
+        ('John', '1', 'EUR', 'x'),
+        ['Jack', '2'],
+        ('Bill', '3', 'USD'),
+        ('  ', None, '', 'x'),
+        [],
+    ]
+    reader = SampleReader(rows, header=[' owner', 'price ', 'currency'])
+    assert list(reader) == [
+        {'user': 'John', 'price': 1, 'currency': 'EUR'},
+        {'user': 'Jack', 'price': 2, 'currency': 'GBP'},
+        {'user': 'Bill', 'price': 3, 'currency': 'USD'},
+    ]
+    assert reader.record_num == 4
+
+
+def test_positional_empty():
+    assert list(SampleReader([], header=True)) == []
+    assert list(SampleReader([], header=['owner'])) == []
+
+
+def test_positional_preprocess_row():
+    class Reader(SampleReader):
+        header = ['owner', 'price']
+
+        def preprocess_row(self, row):
+            if row[0] != 'Jack':
+                return [row[0].upper(), row[1]]
+
+    rows = [['John', '1'], ['Jack', '2']]
+    assert list(Reader(rows)) == [
+        {'user': 'JOHN', 'price': 1, 'currency': 'GBP'}]
+
+
+def test_dbapi_cursor():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE t (owner TEXT, price REAL, currency TEXT)')
+    conn.executemany('INSERT INTO t VALUES (?, ?, ?)', [
+        ('John', 11.2, 'EUR'), ('Jack', 15.7, None), ('Bill', None, 'USD')])
+    cursor = conn.execute('SELECT * FROM t')
+    reader = SampleReader(cursor, header=cursor.description, errors='error')
+    assert list(reader) == [
+        {'user': 'John', 'price': 11.2, 'currency': 'EUR'},
+        {'user': 'Jack', 'price': 15.7, 'currency': 'GBP'},
+    ]
+    conn.close()
+
+
+@pytest.mark.parametrize('compress,suffix', [
+    (lambda b: b, '.csv'),
+    (gzip.compress, '.csv.gz'),
+    (bz2.compress, '.csv.bz2'),
+    (lzma.compress, '.csv.xz'),
+])
+@pytest.mark.parametrize('read_ahead_batch', [1, 3, 1000])
+def test_from_path(caplog, tmp_path, compress, suffix, read_ahead_batch):
+    path = tmp_path / ('data' + suffix)
+    path.write_bytes(compress(csv_buffer().getvalue().encode('utf-8')))
+    reader = SampleReader.from_path(
+        path, read_ahead=2, read_ahead_batch=read_ahead_batch)
+    assert reader.header is True
+    assert list(reader) == OUTPUT_ROWS
+    assert reader.record_num == 8
+    assert reader.line_num == 10
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+def test_from_path_dicts(caplog, tmp_path):
+    """preprocess_row() receives the same dicts as with csv.DictReader
+    """
+    class Reader(SampleReader):
+        def preprocess_row(self, row):
+            assert isinstance(row, dict)
+            return row
+
+    path = tmp_path / 'data.csv'
+    path.write_text(csv_buffer().getvalue(), newline='')
+    reader = Reader.from_path(str(path))
+    assert reader.header is None
+    assert list(reader) == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES_CSV
+
+
+def test_from_path_kwargs(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_bytes('John;1\nJos\xe9;2\n'.encode('latin-1'))
+    reader = SampleReader.from_path(
+        path, encoding='latin-1', delimiter=';',
+        fieldnames=['owner', 'price'], name_map={'owner': 'name'},
+        workers=2, chunk_size=1)
+    assert reader.header == ['owner', 'price']
+    assert list(reader) == [
+        {'name': 'John', 'price': 1, 'currency': 'GBP'},
+        {'name': 'José', 'price': 2, 'currency': 'GBP'},
+    ]
+
+    reader = SampleReader.from_path(path, fieldnames=['owner', 'price'],
+                                    delimiter=';')
+    with pytest.raises(UnicodeDecodeError):
+        list(reader)
+
+
+def test_from_path_header(tmp_path):
+    """A header set by the class is not overridden
+    """
+    class Reader(SampleReader):
+        header = ['owner', 'price']
+
+    path = tmp_path / 'data.csv'
+    path.write_text('John,1\n\nJack,2\n')
+    assert list(Reader.from_path(path)) == [
+        {'user': 'John', 'price': 1, 'currency': 'GBP'},
+        {'user': 'Jack', 'price': 2, 'currency': 'GBP'},
+    ]
+
+
+def test_from_path_empty(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_bytes(b'')
+    assert list(SampleReader.from_path(path)) == []
+
+
+def test_from_path_break(tmp_path):
+    """Stopping the iteration early stops the background thread
+    """
+    path = tmp_path / 'data.csv'
+    path.write_text('owner,price\n' + 'John,1\n' * 10000)
+    before = threading.active_count()
+    for _ in SampleReader.from_path(path, read_ahead=1, read_ahead_batch=1):
+        break
+    assert threading.active_count() == before
+
+
+def test_from_path_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        SampleReader.from_path(tmp_path / 'data.csv', read_ahead=0)
+    with pytest.raises(ValueError):
+        SampleReader.from_path(tmp_path / 'data.csv', read_ahead_batch=0)
+
+
+def as_dicts(rows, output):
+    names = ['user', 'price', 'currency']
+    if output == 'dict':
+        return rows
+    if output == 'tuple':
+        assert all(type(row) is tuple for row in rows)
+        return [dict(zip(names, row)) for row in rows]
+    for row in rows:
+        assert row._fields == tuple(names)
+        assert [getattr(row, name) for name in names] == list(row)
+    return [row._asdict() for row in rows]
+
+
+@pytest.mark.parametrize('output', ['dict', 'tuple', 'namedtuple', 'slots'])
+def test_output(caplog, output):
+    reader = SampleReader(INPUT_ROWS, output=output)
+    assert as_dicts(list(reader), output) == OUTPUT_ROWS
+    assert caplog.record_tuples == LOGLINES
+
+
+@pytest.mark.parametrize('output', ['tuple', 'namedtuple', 'slots'])
+def test_output_read_columns(output):
+    reader = SampleReader(INPUT_ROWS, output=output, errors='error')
+    rows = list(reader.read_columns(3, rows=True))
+    assert as_dicts(rows, output) == OUTPUT_ROWS
+
+
+@pytest.mark.parametrize('output', ['tuple', 'namedtuple', 'slots'])
+def test_output_parallel(output):
+    reader = SampleReader(INPUT_ROWS, output=output, errors='error',
+                          workers=2, chunk_size=2)
+    assert as_dicts(list(reader), output) == OUTPUT_ROWS
+
+
+@pytest.mark.parametrize('output', ['tuple', 'namedtuple', 'slots'])
+def test_output_postprocess_row(output):
+    class Reader(SampleReader):
+        def postprocess_row(self, row):
+            assert type(row) is dict
+            if row['user'] != 'Jack':
+                row['price'] *= 2
+                return row
+
+    rows = list(Reader(INPUT_ROWS, output=output, errors='error'))
+    assert as_dicts(rows, output) == [
+        {'user': 'John', 'price': 22.4, 'currency': 'EUR'},
+        {'user': 'Bill', 'price': 2001.4, 'currency': 'GBP'},
+        {'user': 'Jane', 'price': 4000, 'currency': 'GBP'},
+        {'user': 'Todd', 'price': 200, 'currency': 'GBP'},
+    ]
+
+
+def test_output_slots():
+    row, = SampleReader(INPUT_ROWS[:1], output='slots')
+    assert not hasattr(row, '__dict__')
+    assert repr(row) == (
+        "SampleReaderRow(user='John', price=11.2, currency='EUR')")
+    assert row == row
+    assert row != tuple(row)
+    assert tuple(row) == ('John', 11.2, 'EUR')
+
+    # Hashable like tuple and namedtuple
+    rows = list(SampleReader(INPUT_ROWS[:2] * 2, output='slots',
+                             fields={**SampleReader.fields,
+                                     'owner': String()}))
+    assert len(rows) == 4
+    assert len(set(rows)) == 2
+    assert hash(rows[0]) == hash(rows[2])
+    assert {rows[0]: 1}[rows[2]] == 1
+
+
+def test_output_invalid():
+    with pytest.raises(ValueError):
+        SampleReader(INPUT_ROWS, output='list')
+    # Not a valid identifier
+    reader = SampleReader(INPUT_ROWS, output='slots',
+                          name_map={'owner': 'user name'})
+    with pytest.raises(ValueError):
+        list(reader)
+    # Duplicate names after name mapping
+    reader = SampleReader(INPUT_ROWS, output='tuple',
+                          name_map={'owner': 'price'})
+    with pytest.raises(ValueError):
+        list(reader)
+
+
+@pytest.mark.parametrize('output', ['tuple', 'namedtuple', 'slots'])
+def test_output_memory(output):
+    """Memory benchmark: compact output formats must take substantially less
+    memory than dicts
+    """
+    class Reader(DictReader):
+        fields = {f'col{i}': String() for i in range(10)}
+
+    # All the parsed values are the same object, so only the containers
+    # are measured
+    rows = [{f'col{i}': 'x' for i in range(10)}] * 1000
+
+    def measure(output):
+        reader = Reader(rows, output=output)
+        tracemalloc.start()
+        try:
+            out = list(reader)  # noqa: F841
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    # Typically 50% or less with 10 fields
+    assert measure(output) < measure('dict') * 0.6
+
+
+class TypedReader(DictReader):
+    fields = {
+        'str': String(),
+        'float': Float(required=False),
+        'int': Integer(),
+        'optint': Integer(required=False, default=None),
+        'bool': Boolean(),
+        'dt': Timestamp(backend='stdlib'),
+        'domain': Domain(['a', 'b', 'c'], required=False),
+    }
+    name_map = {'str': 'string'}
+
+
+TYPED_ROWS = [
+    {'str': 'x', 'float': '1.5', 'int': '1', 'optint': '4', 'bool': 'Y',
+     'dt': '2000-01-02', 'domain': 'b'},
+    {'str': 'y', 'float': '', 'int': '2', 'optint': '', 'bool': 'N',
+     'dt': '2000-01-03', 'domain': ''},
+    {'str': 'z', 'float': '3', 'int': '3', 'optint': '6', 'bool': 'Y',
+     'dt': '2000-01-04', 'domain': 'a'},
+]
+
+
+@requires_numpy
+def test_to_arrays(caplog):
+    reader = SampleReader(INPUT_ROWS, errors='error')
+    arrays = reader.to_arrays()
+    assert reader.record_num == 8
+    assert caplog.record_tuples == LOGLINES
+    assert list(arrays) == ['user', 'price', 'currency']
+    assert arrays['price'].dtype == 'float64'
+    assert {k: v.tolist() for k, v in arrays.items()} == {
+        'user': ['John', 'Jack', 'Bill', 'Jane', 'Todd'],
+        'price': [11.2, 15.7, 1000.7, 2000, 100],
+        'currency': ['EUR', 'EUR', 'GBP', 'GBP', 'GBP'],
+    }
+
+
+@requires_numpy
+def test_to_arrays_dtypes():
+    arrays = TypedReader(TYPED_ROWS).to_arrays()
+    assert {k: str(v.dtype) for k, v in arrays.items()} == {
+        'string': 'object',
+        'float': 'float64',
+        'int': 'int64',
+        'optint': 'float64',
+        'bool': 'bool',
+        'dt': 'datetime64[ns]',
+        'domain': 'object',
+    }
+    assert arrays['domain'].tolist() == ['b', None, 'a']
+
+
+@requires_numpy
+def test_to_arrays_postprocess_row():
+    class Reader(SampleReader):
+        def postprocess_row(self, row):
+            if row['user'] != 'Jack':
+                row['price'] *= 2
+                return row
+
+    arrays = Reader(INPUT_ROWS, errors='error').to_arrays()
+    assert arrays['price'].tolist() == [22.4, 2001.4, 4000, 200]
+
+
+@requires_pandas
+@pytest.mark.parametrize('flush_rows', [1, 2, 4096])
+def test_to_dataframe(monkeypatch, flush_rows):
+    import pandas
+    from fuzzyfields import dictreader
+
+    monkeypatch.setattr(dictreader, '_BUFFER_FLUSH_ROWS', flush_rows)
+    df = TypedReader(TYPED_ROWS).to_dataframe()
+    expect = pandas.DataFrame(list(TypedReader(TYPED_ROWS)))
+    assert df.dtypes['domain'] == 'category'
+    assert df['domain'].cat.categories.tolist() == ['b', 'a']
+    expect['domain'] = expect['domain'].astype(df.dtypes['domain'])
+    pandas.testing.assert_frame_equal(df, expect)
+
+
+@requires_pandas
+def test_to_dataframe_empty():
+    df = SampleReader([]).to_dataframe()
+    assert df.columns.tolist() == ['user', 'price', 'currency']
+    assert len(df) == 0
+
+
+@requires_pandas
+def test_to_dataframe_memory():
+    """Memory benchmark: to_dataframe() must have a substantially lower
+    peak memory usage than pandas.DataFrame(list(reader))
+    """
+    import pandas
+
+    class Reader(DictReader):
+        fields = {f'col{i}': Float() for i in range(10)}
+
+    rows = [{f'col{i}': '1.5' for i in range(10)}] * 10000
+
+    def measure(func):
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Typically 20%
+    assert (measure(lambda: Reader(rows).to_dataframe())
+            < measure(lambda: pandas.DataFrame(list(Reader(rows)))) * 0.5)
+
+
+class WideReader(DictReader):
+    # Cheapest possible fields, to measure the overhead of the reader
+    fields = {
+        f'col{i}': String(required=False) for i in range(20)
+    }
+    name_map = {'col0': 'first'}
+
+
+def test_row_parser_wide():
+    """The generated row parser returns the same records as the reference
+    implementation with many fields
+    """
+    reader = WideReader(None)
+    row = {f'col{i}': 'x' for i in range(20)}
+    row['col5'] = ' '
+    parse_row = reader._get_row_parser(tuple(row), 'dict')
+    expect = reader._parse_row(row)
+    assert parse_row(row) == expect
+    assert expect['first'] == 'x'
+    assert 'col0' not in expect
+    assert expect['col5'] is None
+
+
+@pytest.mark.benchmark
+def test_row_parser_benchmark():
+    """Micro-benchmark: the per-row overhead of the generated row parser
+    must be substantially lower than the reference implementation
+    """
+    reader = WideReader(None)
+    row = {f'col{i}': 'x' for i in range(20)}
+    parse_row = reader._get_row_parser(tuple(row), 'dict')
+    assert speedup(lambda: parse_row(row), lambda: reader._parse_row(row),
+                   number=200) > 1.3
+
+
 # TODO: preprocess_row(), postprocess_row()
 # TODO: __init__ params
 # TODO: errors='raise'
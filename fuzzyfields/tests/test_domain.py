@@ -1,6 +1,8 @@
+import pickle
 import pytest
 from decimal import Decimal
-from fuzzyfields import Domain, DomainError
+from fuzzyfields import Domain, DomainError, Integer, String
+from . import assert_try_parse, requires_numpy, requires_pandas
 
 
 def test_basic():
@@ -89,3 +91,227 @@ def test_passthrough():
     # Non-passthrough Domain was created before choices was populated
     with pytest.raises(DomainError):
         ff1.parse("foo")
+
+
+@pytest.mark.parametrize('unique_store', [
+    'disk', pytest.param('fingerprint', marks=requires_numpy)])
+def test_passthrough_unique_store(unique_store):
+    """Domain cross-references the memory-bounded seen_values of a unique
+    field without copying them
+    """
+    ff1 = String(unique=True, unique_store=unique_store)
+    ff2 = Integer(unique=True, unique_store=unique_store)
+    ff3 = Domain(choices=[[1], [2]], unique=True, unique_store=unique_store)
+    xref1 = Domain(choices=ff1.seen_values, passthrough=True)
+    xref2 = Domain(choices=ff2.seen_values, passthrough=True)
+    xref3 = Domain(choices=ff3.seen_values, passthrough=True)
+
+    with pytest.raises(DomainError) as e:
+        xref1.parse('foo')
+    assert str(e.value) == ("value 'foo' is not acceptable (choices: "
+                            f"<{type(ff1.seen_values).__name__}: 0 values>)")
+
+    ff1.parse('foo')
+    ff2.parse('123')
+    ff3.parse([1])
+    assert xref1.parse('foo') == 'foo'
+    assert xref1.try_parse(' foo ') == (True, 'foo')
+    assert xref2.parse(' 123 ') == 123
+    assert xref2.parse('1.23e2') == 123
+    assert xref2.parse(123.0) == 123.0
+    assert xref2.try_parse('123') == (True, 123)
+    assert xref3.parse([1]) == [1]
+    for ff, value in ((xref1, 'bar'), (xref2, '124'), (xref3, [2])):
+        with pytest.raises(DomainError):
+            ff.parse(value)
+        assert ff.try_parse(value)[1][0] is DomainError
+    assert xref1.sphinxdoc == (
+        "Choice from a domain (dynamically defined at runtime)")
+
+    with pytest.raises(ValueError):
+        Domain(choices=ff1.seen_values, case_sensitive=False)
+
+
+@requires_pandas
+def test_parse_many_unique_store():
+    ff1 = String(unique=True, unique_store='disk')
+    ff1.parse('foo')
+    xref = Domain(choices=ff1.seen_values, passthrough=True)
+    out, errors = xref.parse_many(['foo', 'bar'])
+    assert out.tolist()[0] == 'foo'
+    assert list(errors) == [1]
+
+
+@requires_pandas
+def test_parse_many():
+    ff = Domain(choices=['Foo', 1, 2.0, [1]], case_sensitive=False,
+                required=False, default='stub')
+    out, errors = ff.parse_many(
+        ['foo', ' FOO ', 1.0, '1.0e0', 2, [1], 'N/A', 'bar', [2]])
+    assert out.tolist() == ['Foo', 'Foo', 1, 1, 2.0, [1], 'stub', 'stub',
+                            'stub']
+    assert isinstance(out[2], int)
+    assert isinstance(out[4], float)
+    assert sorted(errors) == [7, 8]
+    assert str(errors[7]) == ("value 'bar' is not acceptable "
+                              "(choices: 1,2.0,Foo,[1])")
+
+
+def test_passthrough_cache():
+    with pytest.raises(ValueError):
+        Domain(choices=['a'], passthrough=True, cache=10)
+
+
+@requires_pandas
+def test_parse_many_passthrough():
+    choices = []
+    ff = Domain(choices=choices, passthrough=True)
+    out, errors = ff.parse_many(['foo'])
+    assert list(errors) == [0]
+    choices.append('foo')
+    out, errors = ff.parse_many(['foo'])
+    assert out.tolist() == ['foo']
+    assert not errors
+
+
+@pytest.mark.parametrize('ff', [
+    lambda: Domain(required=False, default='stub',
+                   choices=['foo', False, [1]]),
+    lambda: Domain(case_sensitive=False, choices=['Foo', 1, 2.0, 3 + 4j]),
+    lambda: Domain(choices=['foo', 1], unique=True),
+])
+def test_try_parse(ff):
+    """try_parse() returns the same values and errors as parse()
+    """
+    assert ff()._native_try
+    assert_try_parse(ff, [
+        'foo', 'Foo', 'FOO', False, [1], [2], 'N/A', 1, 1.0, ' 1.0e0 ',
+        Decimal(2), '2', 3 + 4j, 'bar', {}, 'foo', 1,
+    ])
+
+
+def test_try_parse_passthrough():
+    choices = []
+    ff = Domain(choices=choices, passthrough=True)
+    ok, error = ff.try_parse('foo')
+    assert not ok
+    choices += ['foo', 1, [1]]
+    assert ff.try_parse('foo') == (True, 'foo')
+    assert ff.try_parse('1.0e0') == (True, 1)
+    assert ff.try_parse([1]) == (True, [1])
+
+
+@pytest.mark.parametrize('case_sensitive', [True, False])
+def test_passthrough_incremental(case_sensitive):
+    """passthrough=True follows a growing list without parsing it again
+    """
+    choices = ['foo']
+    ff = Domain(choices=choices, passthrough=True,
+                case_sensitive=case_sensitive)
+    assert ff.parse('foo') == 'foo'
+    ff._parse_choices = None  # Not called again
+    for i in range(100):
+        choices.append(f'Bar{i}')
+        assert ff.parse(f'Bar{i}') == f'Bar{i}'
+    choices.append(2)
+    assert ff.parse('2.0') == 2
+    assert ff.parse('Bar0') == 'Bar0'
+    assert ff._parse_func is not None
+    with pytest.raises(DomainError) as e:
+        ff.parse('baz')
+    assert str(e.value).startswith(
+        "value 'baz' is not acceptable (choices: 2,Bar0,Bar1,Bar10,")
+
+
+def test_passthrough_set():
+    """passthrough=True follows the seen_values of a unique field
+    """
+    ff1 = String(unique=True)
+    xref = Domain(choices=ff1.seen_values, passthrough=True)
+    ff2 = Integer(unique=True)
+    xref2 = Domain(choices=ff2.seen_values, passthrough=True)
+    ff1.parse('foo')
+    ff2.parse('1')
+    assert xref.parse('foo') == 'foo'
+    assert xref2.parse('1') == 1
+    ff1.parse('bar')
+    ff2.parse('2')
+    assert xref.parse('foo') == 'foo'
+    assert xref.parse('bar') == 'bar'
+    assert xref.try_parse('bar') == (True, 'bar')
+    assert xref2.parse(' 2.0 ') == 2
+    assert xref2.try_parse('2') == (True, 2)
+    with pytest.raises(DomainError) as e:
+        xref.parse('baz')
+    assert str(e.value) == ("value 'baz' is not acceptable "
+                            "(choices: bar,foo)")
+    assert xref.try_parse('baz')[1][0] is DomainError
+
+    # Case insensitive Domains parse the set again
+    xref = Domain(choices=ff1.seen_values, passthrough=True,
+                  case_sensitive=False)
+    assert xref.parse('FOO') == 'foo'
+    ff1.parse('Baz')
+    assert xref.parse('BAZ') == 'Baz'
+
+
+def test_choices_str_lazy():
+    """The sorted choices are only built when the error message is rendered
+    """
+    class Choices(list):
+        iterated = 0
+
+        def __iter__(self):
+            Choices.iterated += 1
+            return super().__iter__()
+
+    choices = Choices()
+    ff = Domain(choices=choices, passthrough=True)
+    Choices.iterated = 0
+    for i in range(10):
+        choices.append(str(i))
+        assert ff.try_parse('x')[1][0] is DomainError
+        with pytest.raises(DomainError):
+            ff.parse('x')
+    assert Choices.iterated == 0
+
+    with pytest.raises(DomainError) as e:
+        ff.parse('x')
+    assert e.value.choices == '0,1,2,3,4,5,6,7,8,9'
+    assert Choices.iterated == 1
+    # Rendered once
+    assert str(e.value) == str(e.value)
+    assert Choices.iterated == 1
+
+    # Pickled as a plain str
+    e2 = pickle.loads(pickle.dumps(e.value))
+    assert type(e2.choices) is str
+    assert str(e2) == str(e.value)
+
+
+@pytest.mark.parametrize('choices', [
+    lambda: ['a', 'b', 'c'], lambda: {'a', 'b', 'c'}])
+@pytest.mark.parametrize('case_sensitive', [True, False])
+def test_passthrough_remove(choices, case_sensitive):
+    """passthrough=True stops accepting values removed from choices
+    """
+    choices = choices()
+    ff = Domain(choices=choices, passthrough=True,
+                case_sensitive=case_sensitive)
+    assert ff.parse('a') == 'a'
+    choices.remove('a')
+    with pytest.raises(DomainError) as e:
+        ff.parse('a')
+    assert str(e.value) == "value 'a' is not acceptable (choices: b,c)"
+    assert ff.try_parse('a')[1][0] is DomainError
+    assert ff.parse('b') == 'b'
+
+    # Removed after growing
+    if isinstance(choices, list):
+        choices.append('d')
+    else:
+        choices.add('d')
+    assert ff.parse('d') == 'd'
+    choices.remove('d')
+    with pytest.raises(DomainError):
+        ff.parse('d')
@@ -0,0 +1,103 @@
+import io
+import pytest
+from fuzzyfields import (ErrorReport, DomainError, DuplicateError,
+                         MalformedFieldError, MissingFieldError)
+from . import requires_pandas
+
+
+def make_report(max_samples=2):
+    report = ErrorReport(['a', 'b'], max_samples=max_samples)
+    errors = [
+        (MalformedFieldError('b', 'x'), 0, 2),
+        (MissingFieldError('a'), 1, None),
+        (MalformedFieldError('b', 'y'), 2, 4),
+        (MalformedFieldError('b', 'z'), 3, 5),
+        (DomainError('c', 1), 3, 5),
+        (DuplicateError('b', 'x'), None, None),
+    ]
+    for exc, record_num, line_num in errors:
+        exc.record_num = record_num
+        exc.line_num = line_num
+        report.append(exc)
+    return report
+
+
+def test_error_report():
+    report = make_report()
+    assert len(report) == 6
+    assert list(report) == [
+        (0, 2, 'b', 'MalformedFieldError', 'x'),
+        (1, -1, 'a', 'MissingFieldError', None),
+        (2, 4, 'b', 'MalformedFieldError', 'y'),
+        (3, 5, 'b', 'MalformedFieldError', 'z'),
+        (3, 5, 'c', 'DomainError', 1),
+        (-1, -1, 'b', 'DuplicateError', 'x'),
+    ]
+    assert report.fields == ['a', 'b', 'c']
+    assert report.error_types == [
+        MalformedFieldError, MissingFieldError, DomainError, DuplicateError]
+    assert report.counts == {
+        ('b', 'MalformedFieldError'): 3,
+        ('a', 'MissingFieldError'): 1,
+        ('c', 'DomainError'): 1,
+        ('b', 'DuplicateError'): 1,
+    }
+    assert report.field_counts == {'b': 4, 'a': 1, 'c': 1}
+    assert report.samples == {
+        ('b', 'MalformedFieldError'): ['x', 'y'],
+        ('a', 'MissingFieldError'): [None],
+        ('c', 'DomainError'): [1],
+        ('b', 'DuplicateError'): ['x'],
+    }
+    assert repr(report) == '<ErrorReport: 6 errors>'
+    assert str(report) == (
+        "6 validation errors\n"
+        "Field b: MalformedFieldError: 3 (e.g. 'x', 'y')\n"
+        "Field a: MissingFieldError: 1 (e.g. None)\n"
+        "Field c: DomainError: 1 (e.g. 1)\n"
+        "Field b: DuplicateError: 1 (e.g. 'x')")
+
+    report.clear()
+    assert len(report) == 0
+    assert list(report) == []
+    assert report.counts == {}
+    assert str(report) == '0 validation errors'
+
+
+def test_max_samples():
+    report = make_report(max_samples=0)
+    assert report.samples == {}
+    assert str(report).splitlines()[1] == 'Field b: MalformedFieldError: 3'
+    with pytest.raises(ValueError):
+        ErrorReport(max_samples=-1)
+
+
+def test_to_csv(tmp_path):
+    buf = io.StringIO(newline='')
+    make_report().to_csv(buf)
+    expect = (
+        'record_num,line_num,field,error,value\r\n'
+        '0,2,b,MalformedFieldError,x\r\n'
+        '1,,a,MissingFieldError,\r\n'
+        '2,4,b,MalformedFieldError,y\r\n'
+        '3,5,b,MalformedFieldError,z\r\n'
+        '3,5,c,DomainError,1\r\n'
+        ',,b,DuplicateError,x\r\n')
+    assert buf.getvalue() == expect
+
+    make_report().to_csv(tmp_path / 'errors.csv')
+    with open(tmp_path / 'errors.csv', newline='') as fh:
+        assert fh.read() == expect
+
+
+@requires_pandas
+def test_to_dataframe():
+    df = make_report().to_dataframe()
+    assert df.columns.tolist() == [
+        'record_num', 'line_num', 'field', 'error', 'value']
+    assert df.dtypes.astype(str).tolist() == [
+        'int64', 'int64', 'object', 'category', 'object']
+    assert df.values.tolist() == [list(row) for row in make_report()]
+
+    df = ErrorReport(['a']).to_dataframe()
+    assert df.shape == (0, 5)
@@ -1,10 +1,15 @@
 import decimal
+import functools
 import math
+import pickle
 from inspect import getdoc
+import pytest
 from pytest import raises
 from fuzzyfields import (FuzzyField, MissingFieldError, DuplicateError,
-                         MalformedFieldError, FieldTypeError)
-from . import requires_pandas
+                         MalformedFieldError, FieldTypeError, SpillingSet,
+                         Decimal, Float, Integer, ValidationError)
+from fuzzyfields.errors import make_error
+from . import assert_try_parse, requires_numpy, requires_pandas
 
 
 class FooBar(FuzzyField):
@@ -236,6 +241,11 @@ def test_unique():
         d.w = [{1: 2}]
     assert str(e.value) == "Field w: Duplicate value: '[{1: 2}]'"
 
+    # Unhashable values are compared regardless of the order of dict keys
+    d.w = {'a': 1, 'b': [2]}
+    with raises(DuplicateError):
+        d.w = {'b': [2], 'a': 1}
+
 
 def test_instance_override():
     c = C()
@@ -267,3 +277,310 @@ def test_copy_unique():
     assert ff2.unique is True
     assert ff2.seen_values == set()
     assert ff1.seen_values == {1}
+
+
+@pytest.mark.parametrize('unique_store', [
+    'set', 'disk', pytest.param('fingerprint', marks=requires_numpy),
+    functools.partial(SpillingSet, max_size=2),
+])
+def test_unique_store(unique_store):
+    ff = Anything(unique=True, unique_store=unique_store)
+    for value in ('x', 1, 2.5, [1], 'y', 'z'):
+        assert ff.parse(value) == value
+    for value in ('x', 1.0, 2.5, [1], 'z'):
+        with raises(DuplicateError):
+            ff.parse(value)
+    assert len(ff.seen_values) == 6
+    assert ff.try_parse('w') == (True, 'w')
+    assert ff.try_parse('w') == (False, (DuplicateError, 'w'))
+
+    ff2 = ff.copy()
+    assert ff2.unique_store is unique_store
+    assert len(ff2.seen_values) == 0
+    assert type(ff2.seen_values) is type(ff.seen_values)
+    assert ff2.parse('x') == 'x'
+
+    ff3 = pickle.loads(pickle.dumps(ff))
+    with raises(DuplicateError):
+        ff3.parse('x')
+
+
+@requires_pandas
+@pytest.mark.parametrize('unique_store', [
+    'disk', pytest.param('fingerprint', marks=requires_numpy)])
+def test_unique_store_parse_many(unique_store):
+    ff = Anything(unique=True, unique_store=unique_store)
+    out, errors = ff.parse_many([1, 2, 1, 'x', 'x'])
+    assert sorted(errors) == [2, 4]
+    assert all(isinstance(e, DuplicateError) for e in errors.values())
+
+
+def test_unique_store_invalid():
+    with raises(ValueError) as e:
+        Anything(unique=True, unique_store='dict')
+    assert str(e.value) == ("unique_store: expected 'set', 'fingerprint', "
+                            "'disk' or callable; got 'dict'")
+    # Validated even when unique=False
+    with raises(ValueError):
+        Anything(unique_store=None)
+
+
+def test_compiled_parse():
+    """parse() goes through a closure that is rebuilt whenever the settings
+    change
+    """
+    ff = FooBar()
+    with raises(MissingFieldError):
+        ff.parse('N/A')
+    ff.required = False
+    assert ff.parse('N/A') is None
+    ff.default = 'baz'
+    assert ff.parse('N/A') == 'baz'
+    ff.unique = True
+    ff.seen_values = set()
+    assert ff.parse('foo') == 'bar'
+    with raises(DuplicateError):
+        ff.parse('foo')
+    ff.unique = False
+    assert ff.parse('foo') == 'bar'
+
+
+def test_compiled_parse_copy():
+    ff1 = FooBar()
+    ff1.name = 'x'
+    ff1.parse('foo')
+    ff2 = ff1.copy()
+    ff2.name = 'y'
+    with raises(MalformedFieldError) as e:
+        ff1.parse('other')
+    assert e.value.name == 'x'
+    with raises(MalformedFieldError) as e:
+        ff2.parse('other')
+    assert e.value.name == 'y'
+
+
+def test_compiled_parse_pickle():
+    ff1 = FooBar(required=False, default='baz')
+    ff1.parse('foo')
+    ff2 = pickle.loads(pickle.dumps(ff1))
+    assert ff2.parse('foo') == 'bar'
+    assert ff2.parse(None) == 'baz'
+
+
+def test_getattr():
+    with raises(AttributeError) as e:
+        FooBar().seen_values
+    assert str(e.value) == "'FooBar' object has no attribute 'seen_values'"
+
+
+def test_parse_many():
+    """Scalar fallback for fields without a vectorized implementation
+    """
+    ff = FooBar(required=False, default='baz', unique=True)
+    assert ff._vectorized is False
+    out, errors = ff.parse_many([' foo ', 'N/A', 'foo', [], 'other', None])
+    assert out == ['bar', 'baz', 'baz', 'baz', 'baz', 'baz']
+    assert sorted(errors) == [2, 3, 4]
+    assert isinstance(errors[2], DuplicateError)
+    assert isinstance(errors[3], FieldTypeError)
+    assert isinstance(errors[4], MalformedFieldError)
+
+    ff = FooBar()
+    out, errors = ff.parse_many(iter(['foo', 'N/A']))
+    assert out == ['bar', None]
+    assert list(errors) == [1]
+    assert isinstance(errors[1], MissingFieldError)
+
+    assert ff.parse_many([]) == ([], {})
+
+
+class CountingFooBar(FooBar):
+    """FooBar that counts the invocations of validate()
+    """
+    calls = 0
+
+    def validate(self, value):
+        self.calls += 1
+        return super().validate(value)
+
+
+def test_cache():
+    ff = CountingFooBar(cache=2)
+    assert ff.parse('foo') == 'bar'
+    assert ff.parse('foo') == 'bar'
+    assert ff.parse(' foo ') == 'bar'
+    assert (ff.cache_hits, ff.cache_misses, ff.calls) == (1, 2, 2)
+
+    # Least recently used entry is evicted
+    assert ff.parse('foo') == 'bar'
+    with raises(MalformedFieldError):
+        ff.parse('other')
+    assert ff.parse('foo') == 'bar'
+    assert ff.parse(' foo ') == 'bar'
+    assert (ff.cache_hits, ff.cache_misses, ff.calls) == (3, 4, 4)
+
+    # Null values are cached too, but required is still enforced
+    with raises(MissingFieldError):
+        ff.parse('N/A')
+    with raises(MissingFieldError):
+        ff.parse('N/A')
+    assert (ff.cache_hits, ff.cache_misses, ff.calls) == (4, 5, 4)
+
+    ff.cache_clear()
+    assert (ff.cache_hits, ff.cache_misses) == (0, 0)
+    assert ff.parse('foo') == 'bar'
+    assert ff.calls == 5
+
+
+def test_cache_errors():
+    """Cached errors are raised as new, pristine exception instances
+    """
+    ff = FooBar(cache=10)
+    ff.name = 'x'
+    with raises(MalformedFieldError) as e1:
+        ff.parse('other')
+    e1.value.record_num = 1
+    with raises(MalformedFieldError) as e2:
+        ff.parse('other')
+    assert e2.value is not e1.value
+    assert e2.value.record_num is None
+    assert str(e2.value) == "Field x: Malformed field: expected foo, " \
+                            "got 'other'"
+    assert ff.cache_hits == 1
+
+
+def test_cache_types():
+    """Values that compare equal but have different types don't share the
+    same cache entry, and unhashable values bypass the cache
+    """
+    ff = Anything(cache=10)
+    assert type(ff.parse(1)) is int
+    assert type(ff.parse(1.0)) is float
+    assert type(ff.parse(True)) is bool
+    assert ff.parse([1]) == [1]
+    assert (ff.cache_hits, ff.cache_misses) == (0, 3)
+
+
+@pytest.mark.parametrize('ff,values', [
+    (lambda: Decimal(cache=10), [decimal.Decimal('1.0'),
+                                 decimal.Decimal('1.00')]),
+    (lambda: Float(cache=10), [0.0, -0.0]),
+    (lambda: Float(cache=10), [complex(0, 0), complex(-0.0, 0)]),
+    (lambda: Integer(cache=10), [decimal.Decimal('1.5'),
+                                 decimal.Decimal('1.50')]),
+])
+def test_cache_equal_values(ff, values):
+    """Raw values that compare equal but validate differently don't share
+    the same cache entry, and cached errors report the current raw value
+    """
+    ff_cached = ff()
+    ff_plain = ff()
+    ff_plain.cache = 0
+    for value in values * 2:
+        ok, res = ff_plain.try_parse(value)
+        if ok:
+            out = ff_cached.parse(value)
+            assert out == res
+            assert repr(out) == repr(res)
+        else:
+            with raises(ValidationError) as e:
+                ff_cached.parse(value)
+            assert str(e.value) == str(make_error(None, res))
+    assert ff_cached.cache_hits == len(values)
+
+
+def test_cache_unique():
+    ff = CountingFooBar(unique=True, required=False, cache=10)
+    assert ff.parse('foo') == 'bar'
+    with raises(DuplicateError):
+        ff.parse('foo')
+    assert ff.parse(None) is None
+    assert ff.parse(None) is None
+    assert ff.calls == 1
+    assert ff.cache_hits == 2
+
+
+def test_cache_copy():
+    ff1 = Anything(cache=10)
+    ff1.parse(1)
+    ff2 = ff1.copy()
+    assert (ff2.cache, ff2.cache_misses) == (10, 0)
+    assert ff2._cache == {}
+    assert ff1.cache_misses == 1
+
+    with raises(ValueError):
+        Anything(cache=-1)
+
+
+class TryFooBar(FooBar):
+    """FooBar with a non-raising implementation
+    """
+    def _compile_try_validate(self):
+        def try_validate(value):
+            if not isinstance(value, str):
+                return False, (FieldTypeError, value, 'foo')
+            if value == 'foo':
+                return True, 'bar'
+            return False, (MalformedFieldError, value, 'foo')
+
+        return try_validate
+
+
+TRY_PARSE_VALUES = [' foo ', 'N/A', None, 'foo', [], 'other', 'foo']
+
+
+def test_try_parse():
+    assert not FooBar._native_try
+    assert TryFooBar._native_try
+    for cls in (FooBar, TryFooBar):
+        for kwargs in ({}, {'required': False, 'default': 'baz'},
+                       {'unique': True}, {'cache': 10}):
+            assert_try_parse(lambda: cls(**kwargs), TRY_PARSE_VALUES)
+
+
+def test_try_parse_errors():
+    ff = TryFooBar(unique=True)
+    ff.name = 'x'
+    assert ff.try_parse('foo') == (True, 'bar')
+    assert ff.try_parse('foo') == (False, (DuplicateError, 'bar'))
+    assert ff.try_parse('N/A') == (False, (MissingFieldError, ))
+    assert ff.try_parse('other') == (
+        False, (MalformedFieldError, 'other', 'foo'))
+    exc = make_error(ff.name, ff.try_parse('other')[1])
+    assert isinstance(exc, MalformedFieldError)
+    assert str(exc) == "Field x: Malformed field: expected foo, got 'other'"
+
+    # Fallback to parse()
+    ff = FooBar()
+    ff.name = 'x'
+    ok, exc = ff.try_parse('other')
+    assert not ok
+    assert isinstance(exc, MalformedFieldError)
+    assert make_error(ff.name, exc) is exc
+
+
+def test_try_parse_changed():
+    """Settings changed after the first try_parse() are honoured
+    """
+    ff = TryFooBar()
+    assert ff.try_parse('N/A') == (False, (MissingFieldError, ))
+    ff.required = False
+    ff.default = 'baz'
+    assert ff.try_parse('N/A') == (True, 'baz')
+
+    ff2 = ff.copy()
+    ff2.default = 'baz2'
+    assert ff.try_parse('N/A') == (True, 'baz')
+    assert ff2.try_parse('N/A') == (True, 'baz2')
+
+    ff3 = pickle.loads(pickle.dumps(ff))
+    assert ff3.try_parse('N/A') == (True, 'baz')
+
+
+def test_try_parse_cache():
+    ff = CountingFooBar(cache=10)
+    assert ff.try_parse('foo') == (True, 'bar')
+    assert ff.try_parse('foo') == (True, 'bar')
+    assert ff.try_parse('other')[0] is False
+    assert ff.try_parse('other')[0] is False
+    assert (ff.cache_hits, ff.calls) == (2, 2)
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import pytest
+
+
+IMPORT_TIME_BUDGET = 0.25
+"""Maximum time, in seconds, that ``import fuzzyfields`` may take.
+Without numpy and pandas, it typically takes less than 0.1s.
+"""
+
+
+def test_lazy_imports():
+    """import fuzzyfields must not import numpy or pandas
+    """
+    out = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys, fuzzyfields; '
+        'print(sorted({"numpy", "pandas"} & set(sys.modules)))'])
+    assert out.decode().strip() == '[]'
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='requires python -X importtime')
+def test_import_time():
+    """Regression benchmark of the time it takes to import fuzzyfields
+    """
+    # Warm up the bytecode cache
+    subprocess.check_call([sys.executable, '-c', 'import fuzzyfields'])
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import fuzzyfields'],
+        stderr=subprocess.PIPE, check=True)
+    lines = proc.stderr.decode().splitlines()
+    # import time: self [us] | cumulative | imported package
+    line, = [line for line in lines if line.endswith('| fuzzyfields')]
+    cumulative = int(line.split('|')[1]) / 1e6
+    assert cumulative < IMPORT_TIME_BUDGET
@@ -2,8 +2,9 @@ import decimal
 import math
 import pytest
 from fuzzyfields import (Float, Integer, Decimal, Percentage,
-                         MalformedFieldError, FieldTypeError,
-                         MissingFieldError)
+                         DomainError, MalformedFieldError, FieldTypeError,
+                         MissingFieldError, ValidationError)
+from . import assert_try_parse, requires_pandas
 
 
 def test_float():
@@ -30,6 +31,39 @@ def test_float():
     assert str(e.value) == "Malformed field: expected number, got 'Foo'"
 
 
+@pytest.mark.parametrize('kwargs,ok,ko,domain', [
+    ({}, [-math.inf, 0, math.inf], [], '[-inf, inf]'),
+    ({'min_value': 0}, [0, 1], [-1], '[0, inf]'),
+    ({'min_value': 0, 'allow_min': False}, [1], [0, -1], ']0, inf]'),
+    ({'max_value': 1}, [0, 1], [2], '[-inf, 1]'),
+    ({'max_value': 1, 'allow_max': False}, [0], [1, 2], '[-inf, 1['),
+    ({'allow_zero': False}, [-1, 1], [0], '[-inf, inf] non-zero'),
+])
+def test_float_range(kwargs, ok, ko, domain):
+    ff = Float(**kwargs)
+    for value in ok:
+        assert ff.parse(str(value)) == value
+    for value in ko:
+        with pytest.raises(DomainError) as e:
+            ff.parse(value)
+        assert str(e.value) == (f"value '{float(value)}' is not acceptable "
+                                f"(choices: {domain})")
+
+
+def test_float_range_changed():
+    """Settings changed after the first parse() are honoured
+    """
+    ff = Float()
+    assert ff.parse('-1') == -1
+    ff.min_value = 0
+    with pytest.raises(DomainError) as e:
+        ff.parse('-1')
+    assert str(e.value) == "value '-1.0' is not acceptable (choices: [0, inf])"
+    ff.allow_min = False
+    with pytest.raises(DomainError):
+        ff.parse('0')
+
+
 def test_decimal():
     ff = Decimal()
     assert ff.parse("1000.1") == decimal.Decimal('1000.1')
@@ -194,3 +228,171 @@ def test_percentage_missing(value):
 
 
 # TODO: domain
+
+
+PARSE_MANY_VALUES = [
+    '1', ' 2.5 ', '(1,000.5)', '- 3 -', '1e3', 'inf', '1_000', '1.0e1',
+    '9007199254740993', '99999999999999999999', '0.99999999999999999999',
+    '5%', '(5%)', ' N/A % ', 'foo', '', 'N/A', None, math.nan,
+    decimal.Decimal('nan'), decimal.Decimal('2'), 1, 0, -1, 2.0, 0.5, True,
+    [1], object, 3 + 4j, 2 ** 70,
+]
+
+
+@requires_pandas
+@pytest.mark.parametrize('ff', [
+    lambda: Float(),
+    lambda: Float(required=False, unique=True),
+    lambda: Float(min_value=0, allow_min=False, max_value=10,
+                  allow_max=False, allow_zero=False, default=None),
+    lambda: Integer(),
+    lambda: Integer(required=False, default=0, unique=True),
+    lambda: Percentage(required=False),
+])
+@pytest.mark.parametrize('values', [
+    PARSE_MANY_VALUES,
+    PARSE_MANY_VALUES[::-1],
+    [1.0, 2.5, math.nan, 0.0, -1.0, math.inf, 1e20, 1.0],
+])
+def test_parse_many(ff, values):
+    """parse_many() returns the same values and errors as parse()
+    """
+    import numpy
+
+    ff1 = ff()
+    ff2 = ff()
+    assert ff2._vectorized
+
+    expect_out = []
+    expect_errors = {}
+    for i, value in enumerate(values):
+        try:
+            expect_out.append(ff1.parse(value))
+        except ValidationError as e:
+            expect_out.append(ff1.default)
+            expect_errors[i] = repr(e)
+
+    for arg in (values, numpy.array(values, dtype=object)):
+        ff2 = ff()
+        out, errors = ff2.parse_many(arg)
+        assert isinstance(out, numpy.ndarray)
+        assert len(out) == len(expect_out)
+        for a, b in zip(out.tolist(), expect_out):
+            assert type(a) is type(b)
+            assert a == b or (a != a and b != b)
+        assert {k: repr(v) for k, v in errors.items()} == expect_errors
+
+
+@requires_pandas
+def test_parse_many_dtype():
+    import numpy
+    import pandas
+
+    out, errors = Float().parse_many(numpy.array([1.5, 2.5]))
+    assert out.dtype == numpy.float64
+    assert out.tolist() == [1.5, 2.5]
+    assert not errors
+
+    out, errors = Float(required=False).parse_many(
+        pandas.Series(['1', None, '2']))
+    assert out.dtype == numpy.float64
+    numpy.testing.assert_equal(out, [1, numpy.nan, 2])
+    assert not errors
+
+    out, errors = Integer().parse_many(['1', '2'])
+    assert out.dtype == numpy.int64
+    # Missing values are replaced by the default, NaN, which can't be stored
+    # in an int array
+    out, errors = Integer(required=False).parse_many(['1', None])
+    assert out.dtype == object
+    assert out[0] == 1
+    assert math.isnan(out[1])
+
+
+def test_parse_many_decimal():
+    """Decimal is not vectorized
+    """
+    ff = Decimal()
+    assert ff._vectorized is False
+    out, errors = ff.parse_many(['1.1', 'foo'])
+    assert out == [decimal.Decimal('1.1'), ff.default]
+    assert isinstance(errors[1], MalformedFieldError)
+
+
+def test_parse_many_subclass():
+    """Subclasses that override the scalar methods don't inherit the
+    vectorized kernel
+    """
+    class Doubled(Float):
+        def validate(self, value):
+            return super().validate(value) * 2
+
+    assert Float._vectorized
+    assert Integer._vectorized
+    assert not Doubled._vectorized
+    assert Doubled().parse_many(['1', '2'])[0] == [2.0, 4.0]
+
+
+@pytest.mark.parametrize('ff', [
+    lambda: Float(),
+    lambda: Float(required=False, unique=True),
+    lambda: Float(min_value=0, allow_min=False, max_value=10,
+                  allow_max=False, allow_zero=False, default=None),
+    lambda: Integer(),
+    lambda: Integer(required=False, default=0, unique=True),
+    lambda: Decimal(required=False),
+    lambda: Decimal(min_value=0, unique=True),
+    lambda: Percentage(required=False),
+    lambda: Percentage(max_value=1),
+])
+def test_try_parse(ff):
+    """try_parse() returns the same values and errors as parse()
+    """
+    assert ff()._native_try
+    assert_try_parse(ff, PARSE_MANY_VALUES + PARSE_MANY_VALUES[::-1])
+
+
+def test_try_parse_subclass():
+    """Subclasses that override the scalar methods don't inherit the
+    non-raising implementation
+    """
+    class Doubled(Float):
+        def validate(self, value):
+            return super().validate(value) * 2
+
+    class Halved(Float):
+        def _num_converter(self, value):
+            return super()._num_converter(value) / 2
+
+    assert not Doubled._native_try
+    assert not Halved._native_try
+    assert Doubled().try_parse('1') == (True, 2.0)
+    assert Halved().try_parse('1') == (True, 0.5)
+    ok, exc = Halved().try_parse('foo')
+    assert not ok
+    assert isinstance(exc, MalformedFieldError)
+    assert Halved(max_value=1).parse('2') == 1.0
+    with pytest.raises(DomainError):
+        Halved(max_value=1).parse('3')
+
+
+def test_try_num_converter_subclass():
+    """parse() and try_parse() share the same implementation, so a subclass
+    that only overrides the non-raising methods changes both
+    """
+    class Truncated(Float):
+        def _try_num_converter(self, value):
+            ok, res = super()._try_num_converter(value)
+            return ok, (math.trunc(res) if ok else res)
+
+    assert Truncated._native_try
+    ff = Truncated(min_value=1)
+    assert ff.parse('1.5') == 1
+    assert ff.try_parse('1.5') == (True, 1)
+    with pytest.raises(DomainError):
+        ff.parse('0.5')
+    assert ff.try_parse('0.5') == (False, (DomainError, 0, '[1, inf]'))
+    with pytest.raises(MalformedFieldError):
+        ff.parse('foo')
+    assert ff.try_parse('foo') == (
+        False, (MalformedFieldError, 'foo', 'number'))
@@ -0,0 +1,85 @@
+import bz2
+import gzip
+import lzma
+import threading
+import pytest
+from fuzzyfields.readahead import ReadAheadCSV, open_binary
+
+CONTENT = 'a,b\r\n1,2\r\n\r\n"3\r\n4",5\r\n6,7\r\n'
+
+
+@pytest.mark.parametrize('compress', [
+    None, gzip.compress, bz2.compress, lzma.compress])
+def test_open_binary(tmp_path, compress):
+    data = CONTENT.encode('utf-8')
+    path = tmp_path / 'data.csv'
+    path.write_bytes(compress(data) if compress else data)
+    with open_binary(path) as fh:
+        assert fh.read() == data
+
+
+def test_open_binary_empty(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_bytes(b'')
+    with open_binary(str(path)) as fh:
+        assert fh.read() == b''
+
+
+@pytest.mark.parametrize('batch_size,queue_size', [(1, 1), (2, 1), (100, 16)])
+def test_read_ahead(tmp_path, batch_size, queue_size):
+    path = tmp_path / 'data.csv'
+    path.write_text(CONTENT, newline='')
+    reader = ReadAheadCSV(path, dicts=False, batch_size=batch_size,
+                          queue_size=queue_size)
+    out = []
+    for row in reader:
+        out.append((reader.line_num, row))
+    assert out == [
+        (1, ['a', 'b']), (2, ['1', '2']), (5, ['3\r\n4', '5']),
+        (6, ['6', '7'])]
+    # Can iterate again
+    assert len(list(reader)) == 4
+
+
+def test_read_ahead_dicts(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text(CONTENT, newline='')
+    reader = ReadAheadCSV(path, dicts=True, restval='x', fieldnames=['a'])
+    assert list(reader) == [
+        {'a': 'a', None: ['b']}, {'a': '1', None: ['2']},
+        {'a': '3\r\n4', None: ['5']}, {'a': '6', None: ['7']}]
+
+
+def test_read_ahead_error(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_bytes(b'a,b\n1,2\n\xff,3\n')
+    reader = ReadAheadCSV(path, dicts=False, batch_size=1)
+    with pytest.raises(UnicodeDecodeError):
+        list(reader)
+    reader = ReadAheadCSV(path, dicts=False, encoding_errors='replace')
+    assert list(reader)[-1] == ['�', '3']
+
+
+def test_read_ahead_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(ReadAheadCSV(tmp_path / 'notexist.csv', dicts=False))
+
+
+def test_read_ahead_close(tmp_path):
+    """Closing the iterator early stops the background thread
+    """
+    path = tmp_path / 'data.csv'
+    path.write_text('a\n' * 10000)
+    before = threading.active_count()
+    it = iter(ReadAheadCSV(path, dicts=False, batch_size=1, queue_size=1))
+    assert next(it) == ['a']
+    assert threading.active_count() == before + 1
+    it.close()
+    assert threading.active_count() == before
+
+
+def test_read_ahead_invalid():
+    with pytest.raises(ValueError):
+        ReadAheadCSV('x', dicts=False, batch_size=0)
+    with pytest.raises(ValueError):
+        ReadAheadCSV('x', dicts=False, queue_size=0)
@@ -1,6 +1,8 @@
+import pytest
 from pytest import raises
 from fuzzyfields import (String, RegEx, ISOCodeAlpha, FieldTypeError,
                          MalformedFieldError)
+from . import assert_try_parse
 
 
 def test_string():
@@ -41,3 +43,20 @@ def test_isocodealpha():
 
     ff = ISOCodeAlpha(chars=2)
     assert ff.parse('us') == 'US'
+
+
+@pytest.mark.parametrize('ff', [
+    lambda: String(),
+    lambda: String(required=False, unique=True),
+    lambda: RegEx(r'foo\d'),
+    lambda: ISOCodeAlpha(),
+    lambda: ISOCodeAlpha(chars=2, required=False, default='XX'),
+])
+def test_try_parse(ff):
+    """try_parse() returns the same values and errors as parse()
+    """
+    assert ff()._native_try
+    assert_try_parse(ff, [
+        '   x   ', 1, None, 'N/A', '  foo3x ', 'xfoo3', ' uSd ', 'us', 'x',
+        [], 'usd',
+    ])
@@ -0,0 +1,151 @@
+import collections
+import decimal
+import math
+import pickle
+import pytest
+from fuzzyfields import tools
+from fuzzyfields.tools import canonical_key, isnull
+from . import has_pandas, requires_numpy, requires_pandas, speedup
+
+if has_pandas:
+    import numpy
+    import pandas
+
+
+@pytest.mark.parametrize('value,expect', [
+    (None, True),
+    (math.nan, True),
+    (decimal.Decimal('nan'), True),
+    (0, False),
+    (False, False),
+    (1.5, False),
+    (decimal.Decimal('1.5'), False),
+    ('', False),
+    ('nan', False),
+    (b'', False),
+    ([], False),
+    ([None], False),
+    ((), False),
+    (object(), False),
+])
+def test_isnull(value, expect):
+    assert isnull(value) is expect
+
+
+@requires_pandas
+@pytest.mark.parametrize('value', [
+    'numpy.float16("nan")', 'numpy.float32("nan")', 'numpy.float64("nan")',
+    'numpy.longdouble("nan")', 'numpy.complex64("nan")',
+    'numpy.complex128("nan")', 'complex("nan")', 'numpy.float32(1)',
+    'numpy.complex128(1)', 'numpy.int8(0)', 'numpy.int64(1)',
+    'numpy.uint64(1)', 'numpy.bool_(False)', 'numpy.datetime64("NaT")',
+    'numpy.datetime64("2000-01-01")', 'numpy.timedelta64("NaT")',
+    'numpy.timedelta64(1, "s")', 'pandas.NaT', 'pandas.Timestamp("2000")',
+    'pandas.Timedelta(1)', 'pandas.NA',
+])
+def test_isnull_pandas(value):
+    """Same behaviour as pandas.isnull for scalars
+    """
+    value = eval(value)
+    expect = bool(pandas.isnull(value))
+    # Test both first call (dispatch table miss) and following calls
+    assert isnull(value) is expect
+    assert isnull(value) is expect
+
+
+@requires_pandas
+def test_isnull_pandas_arrays():
+    assert isnull(numpy.array([math.nan])) is False
+    assert isnull([math.nan]) is False
+
+
+@requires_pandas
+@pytest.mark.parametrize('value', [
+    '1', '1.5', 'numpy.int64(1)', 'numpy.float64(1.5)'])
+def test_isnull_dispatch(value):
+    """The most common scalar types are resolved by the dispatch table,
+    without falling back to the generic implementation
+    """
+    value = eval(value)
+    assert isnull(value) is False
+    assert tools._ISNULL_DISPATCH[type(value)] is not tools._isnull_generic
+
+
+@pytest.mark.benchmark
+@requires_pandas
+@pytest.mark.parametrize('value', [
+    '1', '1.5', 'numpy.int64(1)', 'numpy.float64(1.5)'])
+def test_isnull_benchmark(value):
+    """Micro-benchmark: isnull must be substantially faster than
+    pandas.isnull on the most common scalar types
+    """
+    value = eval(value)
+    isnull(value)
+    assert speedup(lambda: isnull(value), lambda: pandas.isnull(value),
+                   number=5000) > 2
+
+
+CANONICAL_VALUES = [
+    1, 'x', (1, 2), [1, 2], [[1, 2]], ([1], ), {1: 2}, {1: [2]}, {1: {2: 3}},
+    {1, 2}, bytearray(b'x'), [collections.Counter()],
+]
+
+
+@pytest.mark.parametrize('value', CANONICAL_VALUES)
+def test_canonical_key(value):
+    key = canonical_key(value)
+    hash(key)
+    assert canonical_key(pickle.loads(pickle.dumps(value))) == key
+    assert pickle.loads(pickle.dumps(key)) == key
+    # Different values or types never share the key
+    others = [canonical_key(v) for v in CANONICAL_VALUES if v is not value]
+    assert key not in others
+
+
+def test_canonical_key_hashable():
+    for value in (1, 'x', (1, 2), None, frozenset({1})):
+        assert canonical_key(value) is value
+
+
+def test_canonical_key_equal():
+    """Equal values have the same key, like in a set
+    """
+    assert canonical_key([1, 'x']) == canonical_key([1.0, 'x'])
+    assert canonical_key({1: 2, 3: [4]}) == canonical_key({3: [4], 1: 2})
+    assert canonical_key({1: [2]}) != canonical_key({1: [3]})
+    assert canonical_key([1]) != canonical_key(([1], ))
+    assert canonical_key([1]) != (list, (1, ))[1]
+
+
+@requires_numpy
+def test_canonical_key_numpy():
+    import numpy
+
+    a = numpy.arange(6)
+    assert canonical_key(a) == canonical_key(a.copy())
+    assert canonical_key(a) != canonical_key(a.astype(float))
+    assert canonical_key(a) != canonical_key(a.reshape(2, 3))
+    assert canonical_key(a[::2]) == canonical_key(numpy.array([0, 2, 4]))
+    assert canonical_key(a) != canonical_key(a.tolist())
+    b = numpy.array([[1], 'x'], dtype=object)
+    assert canonical_key(b) == canonical_key(b.copy())
+    assert canonical_key(b) != canonical_key(numpy.array([[2], 'x'],
+                                                         dtype=object))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('value', [
+    [1, 2, 3], list(range(100)),
+    pytest.param('numpy.arange(10)', marks=requires_numpy),
+])
+def test_canonical_key_benchmark(value):
+    """Micro-benchmark: canonical_key must be faster than pickle on flat
+    lists and arrays
+    """
+    if isinstance(value, str):
+        import numpy  # noqa: F401
+        value = eval(value)
+    assert speedup(
+        lambda: canonical_key(value),
+        lambda: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+        number=5000) > 1.2
@@ -0,0 +1,161 @@
+import decimal
+import os
+import pickle
+import pytest
+from pytest import raises
+from fuzzyfields import FingerprintSet, SpillingSet
+from fuzzyfields.uniqueness import check_store, new_store
+from . import has_numpy, requires_numpy
+
+
+VALUES = [
+    0, 1, -1, 2 ** 63 - 1, -2 ** 63, 2 ** 64, 1.5, float('inf'), 'x', '',
+    b'x', (1, 'x'), None, decimal.Decimal('2.5'),
+]
+
+
+def make_stores():
+    stores = [SpillingSet(), SpillingSet(max_size=3)]
+    if has_numpy:
+        stores += [FingerprintSet(), FingerprintSet(capacity=1)]
+    return stores
+
+
+@pytest.mark.parametrize('store', make_stores(), ids=repr)
+def test_store(store):
+    for i, v in enumerate(VALUES):
+        assert v not in store
+        store.add(v)
+        assert v in store
+        assert len(store) == i + 1
+        # Adding the same value again is a no-op
+        store.add(v)
+        assert len(store) == i + 1
+    assert all(v in store for v in VALUES)
+    assert 2 not in store
+    assert 'y' not in store
+    assert 3.5 not in store
+    assert 2.5 in store
+
+    # Same equivalences as set
+    assert 1.0 in store
+    assert True in store
+    assert decimal.Decimal(1) in store
+    assert decimal.Decimal('-1.0') in store
+    assert 0.0 in store
+
+    with raises(TypeError):
+        [] in store
+    with raises(TypeError):
+        store.add({})
+
+    store.clear()
+    assert len(store) == 0
+    assert 1 not in store
+
+
+@requires_numpy
+def test_fingerprint_grow():
+    store = FingerprintSet(capacity=10)
+    nbytes = store.nbytes
+    # Keys that would all collide with a naive modulo
+    for i in range(10000):
+        store.add(i * 1024)
+        store.add(f'x{i}')
+    assert len(store) == 20000
+    assert store.nbytes > nbytes
+    assert store.nbytes <= 20000 * 16
+    assert all(i * 1024 in store for i in range(10000))
+    assert all(f'x{i}' in store for i in range(10000))
+    assert 1 not in store
+    assert 'x10000' not in store
+    assert repr(store) == '<FingerprintSet: 20000 values>'
+
+
+@requires_numpy
+def test_fingerprint_pickle():
+    store = FingerprintSet()
+    store.add(1)
+    store.add('x')
+    store2 = pickle.loads(pickle.dumps(store))
+    assert len(store2) == 2
+    assert 1 in store2
+    assert 'x' in store2
+    store2.add(2)
+    assert 2 not in store
+
+    # The hash of 'x' depends on the hash seed of the process
+    state = store.__getstate__()
+    state['_hash_check'] += 1
+    with raises(pickle.UnpicklingError):
+        FingerprintSet.__new__(FingerprintSet).__setstate__(state)
+
+    # Empty stores can be unpickled anywhere
+    state = FingerprintSet().__getstate__()
+    assert state['_hash_check'] is None
+
+
+def test_spilling():
+    store = SpillingSet(max_size=3)
+    assert not store.spilled
+    for v in ('a', 'b'):
+        store.add(v)
+    assert not store.spilled
+    store.add('c')
+    assert store.spilled
+    for v in (1, 2.5, (1, 2)):
+        store.add(v)
+    # 'a' is found on disk
+    store.add('a')
+    assert len(store) == 6
+    assert sorted(map(str, store)) == ['(1, 2)', '1', '2.5', 'a', 'b', 'c']
+    assert repr(store) == '<SpillingSet: 6 values>'
+
+    store2 = pickle.loads(pickle.dumps(store))
+    assert store2.max_size == 3
+    assert len(store2) == 6
+    assert all(v in store2 for v in ('a', 'b', 'c', 1, 2.5, (1, 2)))
+
+    store.close()
+    assert not store.spilled
+    assert len(store) == 0
+    assert 'a' not in store
+    assert 'a' in store2
+
+
+def test_spilling_directory(tmpdir):
+    store = SpillingSet(max_size=1, directory=str(tmpdir))
+    store.add('a')
+    assert len(os.listdir(str(tmpdir))) == 1
+    assert 'a' in store
+    store.clear()
+    assert os.listdir(str(tmpdir)) == []
+
+    # The database is deleted when the store is garbage collected
+    store = SpillingSet(max_size=1, directory=str(tmpdir))
+    store.add('a')
+    assert len(os.listdir(str(tmpdir))) == 1
+    del store
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_spilling_max_size():
+    with raises(ValueError) as e:
+        SpillingSet(max_size=0)
+    assert str(e.value) == "max_size must be >= 1; got 0"
+
+
+def test_new_store():
+    assert new_store('set') == set()
+    assert isinstance(new_store('disk'), SpillingSet)
+    if has_numpy:
+        assert isinstance(new_store('fingerprint'), FingerprintSet)
+    store = new_store(lambda: SpillingSet(max_size=10))
+    assert store.max_size == 10
+
+    for spec in ('list', None, 1):
+        with raises(ValueError) as e:
+            check_store(spec)
+        assert str(e.value) == (
+            "unique_store: expected 'set', 'fingerprint', 'disk' or "
+            f"callable; got {spec!r}")
@@ -1,5 +1,9 @@
+import cmath
 import decimal
 import math
+import pickle
+import sys
+from typing import Any, Hashable
 
 NA_VALUES = {
     '',
@@ -26,26 +30,247 @@ NA_VALUES = {
 :func:`pandas.read_csv`, with some additions.
 """
 
-try:
+
+def isnull(x) -> bool:
+    """Reimplementation of :func:`pandas.isnull`, with the following
+    differences:
+
+    - doesn't require numpy/pandas, and doesn't import them unless numpy has
+      already been imported elsewhere (otherwise x can't be a numpy or pandas
+      object)
+    - scalar only
+    - guaranteed to return a single bool
+    - supports decimal.Decimal
+
+    The most common types, including numpy scalars and pandas.NaT, are
+    resolved in constant time through a dispatch table on ``type(x)``;
+    :func:`pandas.isnull` is only invoked for other types.
+    """
+    try:
+        func = _ISNULL_DISPATCH[type(x)]
+    except KeyError:
+        func = _isnull_dispatch_miss(type(x))
+    return func(x)
+
+
+def _isnull_generic(x) -> bool:
+    """Implementation of :func:`isnull` for types that are not in the
+    dispatch table
+    """
+    if x is None:
+        return True
+    if isinstance(x, (float, decimal.Decimal)):
+        return math.isnan(x)
+    if 'numpy' not in sys.modules:
+        return False
+
+    try:
+        import numpy
+        import pandas
+    except ImportError:
+        return False
+    if isinstance(x, (list, numpy.ndarray)):
+        return False
+    return pandas.isnull(x)
+
+
+def _always_true(x) -> bool:
+    return True
+
+
+def _always_false(x) -> bool:
+    return False
+
+
+_ISNULL_DISPATCH = {
+    type(None): _always_true,
+    bool: _always_false,
+    int: _always_false,
+    str: _always_false,
+    bytes: _always_false,
+    float: math.isnan,
+    decimal.Decimal: math.isnan,
+}
+"""Map of ``{type: callable(x) -> bool}`` for :func:`isnull`.
+numpy and pandas types are added the first time :func:`isnull` meets an
+unknown type after numpy has been imported.
+"""
+
+_isnull_numpy_registered = False
+
+
+def _isnull_dispatch_miss(cls: type):
+    """Find the :func:`isnull` implementation for a type that is not in the
+    dispatch table and add it to the table
+    """
+    global _isnull_numpy_registered
+
+    if not _isnull_numpy_registered and 'numpy' in sys.modules:
+        try:
+            _isnull_register_numpy()
+        except ImportError:
+            # numpy without pandas; leave everything to _isnull_generic
+            pass
+        _isnull_numpy_registered = True
+        if cls in _ISNULL_DISPATCH:
+            return _ISNULL_DISPATCH[cls]
+
+    _ISNULL_DISPATCH[cls] = _isnull_generic
+    return _isnull_generic
+
+
+def _isnull_register_numpy() -> None:
+    """Add the numpy and pandas scalar types to the :func:`isnull` dispatch
+    table
+    """
+    import numpy
+    import pandas
+
+    def isnat(x) -> bool:
+        return bool(numpy.isnat(x))
+
+    # math.isnan and cmath.isnan are much faster than numpy.isnan on scalars
+    for name in ('bool_', 'int8', 'int16', 'int32', 'int64', 'uint8',
+                 'uint16', 'uint32', 'uint64', 'longlong', 'ulonglong'):
+        _ISNULL_DISPATCH[getattr(numpy, name)] = _always_false
+    for name in ('float16', 'float32', 'float64', 'longdouble'):
+        _ISNULL_DISPATCH[getattr(numpy, name)] = math.isnan
+    for name in ('complex64', 'complex128', 'clongdouble'):
+        _ISNULL_DISPATCH[getattr(numpy, name)] = cmath.isnan
+    _ISNULL_DISPATCH[numpy.datetime64] = isnat
+    _ISNULL_DISPATCH[numpy.timedelta64] = isnat
+    _ISNULL_DISPATCH[type(pandas.NaT)] = _always_true
+    _ISNULL_DISPATCH[pandas.Timestamp] = _always_false
+    _ISNULL_DISPATCH[pandas.Timedelta] = _always_false
+    try:
+        _ISNULL_DISPATCH[type(pandas.NA)] = _always_true
+    except AttributeError:
+        # pandas < 1.0
+        pass
+
+
+def map_str(func, values):
+    """Apply a function to all the str elements of a numpy object array.
+    Non-string elements are returned unaltered.
+
+    :param func:
+        function that accepts a str as its only argument,
+        e.g. :meth:`str.strip`
+    :param values:
+        1-dimensional :class:`numpy.ndarray` of objects
+    :returns:
+        new 1-dimensional :class:`numpy.ndarray` of objects
+    """
     import numpy
     import pandas
 
-    def isnull(x) -> bool:
-        """Reimplementation of :func:`pandas.isnull`, with the following
-        differences:
-
-        - doesn't require numpy/pandas
-        - scalar only
-        - guaranteed to return a single bool
-        - supports decimal.Decimal
-        """
-        if isinstance(x, (list, numpy.ndarray)):
-            return False
-        if isinstance(x, (float, decimal.Decimal)):
-            return math.isnan(x)
-        return pandas.isnull(x)
-
-except ImportError:
-    def isnull(x) -> bool:
-        return x is None or (
-            isinstance(x, (float, decimal.Decimal)) and math.isnan(x))
+    if pandas.api.types.infer_dtype(values, skipna=False) != 'string':
+        orig_func = func
+
+        def func(x):
+            return orig_func(x) if isinstance(x, str) else x
+
+    return numpy.frompyfunc(func, 1, 1)(values)
+
+
+def canonical_key(value: Any) -> Hashable:
+    """Return a hashable key for any value, for the uniqueness check of
+    :meth:`FuzzyField.postprocess` and the lookups of :class:`Domain`.
+
+    Hashable values are returned unaltered. Unhashable values are converted
+    to a tuple that starts with their type, so that two keys are equal if
+    and only if the values are equal and of the same kind, regardless of
+    e.g. the insertion order of a dict:
+
+    - list, tuple -> ``(list, (key, key, ...))``
+    - dict -> ``(dict, frozenset({(k, key), ...}))``
+    - set -> ``(set, frozenset(...))``
+    - bytearray -> ``(bytearray, bytes)``
+    - :class:`numpy.ndarray` -> ``(numpy.ndarray, dtype, shape, bytes)``,
+      or ``(numpy.ndarray, dtype, shape, (key, key, ...))`` for object arrays
+
+    Hashable elements are referenced as they are, not copied. Anything else
+    falls back to its :mod:`pickle` serialization.
+    """
+    # Dispatch on the exact type first; raising and catching TypeError for
+    # the unhashable built-in types would cost more than all the rest
+    try:
+        func = _CANONICAL_DISPATCH[type(value)]
+    except KeyError:
+        pass
+    else:
+        return func(value)
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+
+    # Subclasses, e.g. collections.OrderedDict
+    for cls in (list, tuple, dict, set, bytearray):
+        if isinstance(value, cls):
+            return _CANONICAL_DISPATCH[cls](value)
+    if 'numpy' in sys.modules:
+        import numpy
+
+        if isinstance(value, numpy.ndarray):
+            if value.dtype.hasobject:
+                items = tuple(map(canonical_key, value.ravel().tolist()))
+            else:
+                items = value.tobytes()
+            return numpy.ndarray, value.dtype.str, value.shape, items
+
+    return object, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _canonical_items(items: tuple) -> tuple:
+    """Implementation of :func:`canonical_key` for the elements of a list or
+    tuple
+    """
+    # Lists are typically homogeneous; skip the hash() attempt, which would
+    # raise, if the first element is a list, dict, etc.
+    if not items or type(items[0]) not in _CANONICAL_DISPATCH:
+        try:
+            hash(items)
+            return items
+        except TypeError:
+            pass
+    return tuple(map(canonical_key, items))
+
+
+def _canonical_list(value: list) -> Hashable:
+    return list, _canonical_items(tuple(value))
+
+
+def _canonical_tuple(value: tuple) -> Hashable:
+    items = _canonical_items(value)
+    return value if items is value else (tuple, items)
+
+
+def _canonical_dict(value: dict) -> Hashable:
+    try:
+        return dict, frozenset(value.items())
+    except TypeError:
+        # Nested lists, dicts, etc.
+        return dict, frozenset(
+            (k, canonical_key(v)) for k, v in value.items())
+
+
+def _canonical_set(value: set) -> Hashable:
+    return set, frozenset(value)
+
+
+def _canonical_bytearray(value: bytearray) -> Hashable:
+    return bytearray, bytes(value)
+
+
+_CANONICAL_DISPATCH = {
+    list: _canonical_list,
+    tuple: _canonical_tuple,
+    dict: _canonical_dict,
+    set: _canonical_set,
+    bytearray: _canonical_bytearray,
+}
+"""Map of ``{type: callable(x) -> Hashable}`` for :func:`canonical_key`
+"""
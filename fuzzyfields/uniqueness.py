@@ -0,0 +1,473 @@
+"""Memory-bounded stores of already seen values, for the uniqueness check of
+the fields with unique=True. See the ``unique_store`` parameter of
+:class:`FuzzyField`.
+
+All stores offer a subset of the interface of :class:`set`: ``add``,
+``in``, ``len`` and ``clear``, and like :class:`set` they raise TypeError
+for unhashable values. Integers, and floats and other numbers with an
+integer value, that fit in an int64 are stored exactly, so that e.g. 1,
+1.0 and True are the same value, as in a :class:`set`.
+"""
+import numbers
+import os
+import pickle
+import sqlite3
+import tempfile
+import weakref
+from typing import Any, Callable, Iterator, Optional, Union
+
+
+_MASK64 = 2 ** 64 - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+"""Odd multiplier of the integer values. Multiplying by an odd number is a
+bijection on 64-bit integers, so integers are still stored exactly, and the
+top bits of the product, which pick the slot in the table, scatter
+sequential integers (Fibonacci hashing).
+"""
+_SCRAMBLE = 0xBF58476D1CE4E5B9
+"""Odd multiplier of the hashes of the values that are not integers. It
+differs from _GOLDEN, so that e.g. hash(1.5) == 2 ** 60 doesn't collide with
+the key of the integer 2 ** 60.
+"""
+_STR_SALT = 0x94D049BB133111EB
+_OTHER_SALT = 0x2545F4914F6CDD1D
+"""Salts of the hashes of strings and of all other values that are not
+integers, so that neither hash('') == 0 nor hash(b'') == 0 collide with the
+integer 0, and ASCII strings don't collide with the bytes with the same
+characters, which have the same hash.
+"""
+_HASH_CHECK = 'fuzzyfields.uniqueness'
+"""String whose hash identifies the hash seed of the process
+"""
+
+
+def _exact_int(value: Any) -> Optional[int]:
+    """Return value as an int if it is a number with an integer value that
+    fits in an int64; None otherwise
+    """
+    if isinstance(value, int):
+        res = int(value)
+    elif isinstance(value, float):
+        if not value.is_integer():
+            return None
+        res = int(value)
+    elif isinstance(value, numbers.Number):
+        # numpy scalars, Decimal, Fraction...
+        try:
+            res = int(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if res != value:
+            return None
+    else:
+        return None
+    return res if -2 ** 63 <= res < 2 ** 63 else None
+
+
+class UniqueStore:
+    """Abstract base class of the stores of this module
+    """
+    def add(self, value: Any) -> None:
+        """Add a value to the store
+        """
+        raise NotImplementedError()  # pragma: nocover
+
+    def __contains__(self, value: Any) -> bool:
+        raise NotImplementedError()  # pragma: nocover
+
+    def __len__(self) -> int:
+        raise NotImplementedError()  # pragma: nocover
+
+    def clear(self) -> None:
+        """Remove all values
+        """
+        raise NotImplementedError()  # pragma: nocover
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {len(self)} values>"
+
+
+class FingerprintSet(UniqueStore):
+    """Compact store of 64-bit keys in a :class:`numpy.ndarray` hash table
+    with open addressing. It takes 8 to 16 bytes per value, against roughly
+    100 bytes for a :class:`set` of short strings, but it can't return the
+    values it holds.
+
+    Integer values that fit in an int64 are stored exactly. All other values
+    are reduced to a 64-bit fingerprint of their :func:`hash`, so there is a
+    small chance that a new value is mistaken for a duplicate: about
+    n ** 2 / 2 ** 65 after n values, or 0.1% for 200 million values.
+
+    The hash of strings and bytes changes between Python processes, unless
+    the ``PYTHONHASHSEED`` environment variable is set. Unpickling the store
+    in a process with a different hash seed raises
+    :class:`pickle.UnpicklingError`, unless the store is empty.
+
+    Requires numpy.
+
+    :param int capacity:
+        Number of values to pre-allocate space for. The table grows
+        automatically when it is 75% full.
+    """
+    def __init__(self, capacity: int = 1024):
+        self._capacity = capacity
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all values and release the memory
+        """
+        bits = max(4, (self._capacity * 4 // 3).bit_length())
+        self._alloc(bits)
+        self._len = 0
+        self._has_zero = False
+
+    def _alloc(self, bits: int) -> None:
+        """Replace the table with an empty one with 2 ** bits slots
+        """
+        import numpy
+
+        self._bits = bits
+        self._shift = 64 - bits
+        self._mask = 2 ** bits - 1
+        self._table = numpy.zeros(2 ** bits, dtype=numpy.uint64)
+        self._view = memoryview(self._table).cast('B').cast('Q')
+
+    @staticmethod
+    def _key(value: Any) -> int:
+        """Return the key of a value in the table. 0 marks empty slots, so
+        the key 0 is tracked separately.
+        """
+        if type(value) is not str:
+            res = _exact_int(value)
+            if res is not None:
+                return (res * _GOLDEN) & _MASK64
+        if isinstance(value, str):
+            return ((hash(value) ^ _STR_SALT) * _SCRAMBLE) & _MASK64
+        return ((hash(value) ^ _OTHER_SALT) * _SCRAMBLE) & _MASK64
+
+    # The lookup of the key in the table, with linear probing, is inlined
+    # in __contains__ and add for speed
+
+    def __contains__(self, value: Any) -> bool:
+        if type(value) is str:
+            key = ((hash(value) ^ _STR_SALT) * _SCRAMBLE) & _MASK64
+        else:
+            key = self._key(value)
+        if key == 0:
+            return self._has_zero
+
+        view = self._view
+        mask = self._mask
+        i = key >> self._shift
+        k = view[i]
+        while k:
+            if k == key:
+                return True
+            i = (i + 1) & mask
+            k = view[i]
+        return False
+
+    def add(self, value: Any) -> None:
+        """Add a value to the store
+
+        :raises TypeError:
+            if the value is unhashable
+        """
+        if type(value) is str:
+            key = ((hash(value) ^ _STR_SALT) * _SCRAMBLE) & _MASK64
+        else:
+            key = self._key(value)
+        if key == 0:
+            if not self._has_zero:
+                self._has_zero = True
+                self._len += 1
+            return
+
+        view = self._view
+        mask = self._mask
+        i = key >> self._shift
+        k = view[i]
+        while k:
+            if k == key:
+                return
+            i = (i + 1) & mask
+            k = view[i]
+        view[i] = key
+        self._len += 1
+        if self._len * 4 > mask * 3:
+            self._grow()
+
+    def _grow(self) -> None:
+        """Double the size of the table and rehash all keys with numpy
+        """
+        import numpy
+
+        keys = self._table[self._table != 0]
+        self._alloc(self._bits + 1)
+        table = self._table
+        mask = numpy.uint64(len(table) - 1)
+        pos = keys >> numpy.uint64(self._shift)
+
+        # Insert all keys in their first free slot, in rounds. In every
+        # round, only one of the keys that want the same free slot wins it;
+        # all others move on to the next slot.
+        while keys.size:
+            cand = numpy.flatnonzero(table[pos] == 0)
+            _, first = numpy.unique(pos[cand], return_index=True)
+            win = cand[first]
+            table[pos[win]] = keys[win]
+            lose = numpy.ones(keys.size, dtype=bool)
+            lose[win] = False
+            keys = keys[lose]
+            pos = (pos[lose] + numpy.uint64(1)) & mask
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the table
+        """
+        return self._table.nbytes
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_view']
+        # An empty store, e.g. a copy of a field sent to the workers of
+        # DictReader, can be unpickled anywhere
+        state['_hash_check'] = hash(_HASH_CHECK) if self._len else None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        check = state.pop('_hash_check')
+        if check is not None and check != hash(_HASH_CHECK):
+            raise pickle.UnpicklingError(
+                "FingerprintSet can't be unpickled by a process with a "
+                "different hash seed; set the PYTHONHASHSEED environment "
+                "variable")
+        self.__dict__.update(state)
+        self._view = memoryview(self._table).cast('B').cast('Q')
+
+
+class SpillingSet(UniqueStore):
+    """Exact store that holds up to max_size values in a :class:`set` and
+    then moves them to a temporary SQLite database on disk.
+
+    Values are compared by equality, exactly like in a :class:`set`. On disk,
+    they are indexed by their :func:`hash`; strings and numbers are stored
+    as str, int or float, and all other values as their :mod:`pickle`
+    serialization, which is only used to rebuild them for the comparison.
+
+    Once the values start spilling to disk, if numpy is installed, a
+    :class:`FingerprintSet` of the spilled values is used to skip the
+    database lookup for values that are certainly new, so the database is
+    only queried for actual duplicates and for the rare fingerprint
+    collisions.
+
+    Unlike :class:`FingerprintSet`, the store can be iterated upon. The
+    values that were moved to disk are returned as str, int, float, or as a
+    copy that went through :mod:`pickle`.
+
+    :param int max_size:
+        Maximum number of values to hold in memory
+    :param str directory:
+        Directory of the temporary database. Default: the directory chosen
+        by SQLite (see the ``SQLITE_TMPDIR`` environment variable).
+    """
+    max_size: int
+    directory: Optional[str]
+
+    def __init__(self, max_size: int = 1000000,
+                 directory: Union[str, os.PathLike] = None):
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1; got {max_size}")
+        self.max_size = max_size
+        self.directory = directory
+        self._memory = set()
+        self._len = 0
+        self._db = None
+        self._fingerprints = None
+
+    @staticmethod
+    def _encode(value: Any) -> Union[int, float, str, bytes]:
+        """Return the representation of a value in the database
+        """
+        if type(value) is str:
+            return value
+        res = _exact_int(value)
+        if res is not None:
+            return res
+        if isinstance(value, str):
+            return str(value)
+        if type(value) is float:
+            return value
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def __contains__(self, value: Any) -> bool:
+        # Raise TypeError for unhashable values, like set
+        if value in self._memory:
+            return True
+        if self._db is None:
+            return False
+        if self._fingerprints is not None and value not in self._fingerprints:
+            return False
+        for k, in self._db.execute(
+                'SELECT k FROM seen WHERE h = ?', (hash(value), )):
+            if _decode_key(k) == value:
+                return True
+        return False
+
+    def add(self, value: Any) -> None:
+        """Add a value to the store
+
+        :raises TypeError:
+            if the value is unhashable
+        """
+        if value in self:
+            return
+        self._memory.add(value)
+        self._len += 1
+        if len(self._memory) >= self.max_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Move the values in memory to the database
+        """
+        if self._db is None:
+            self._connect()
+        with self._db:
+            self._db.executemany(
+                'INSERT INTO seen VALUES (?, ?)',
+                ((hash(value), self._encode(value))
+                 for value in self._memory))
+        if self._fingerprints is not None:
+            for value in self._memory:
+                self._fingerprints.add(value)
+        self._memory.clear()
+
+    def _connect(self) -> None:
+        """Create the temporary database
+        """
+        if self.directory is None:
+            # Private temporary database, deleted when closed
+            path = ''
+        else:
+            fd, path = tempfile.mkstemp(
+                suffix='.sqlite', prefix='fuzzyfields-',
+                dir=self.directory)
+            os.close(fd)
+
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute('PRAGMA journal_mode = OFF')
+        db.execute('PRAGMA synchronous = OFF')
+        # A single b-tree clustered by hash. k has no type affinity: keys
+        # are stored as they are.
+        db.execute('CREATE TABLE seen (h INTEGER NOT NULL, k, '
+                   'PRIMARY KEY (h, k)) WITHOUT ROWID')
+        self._db = db
+        self._finalizer = weakref.finalize(self, _close_db, db, path)
+
+        try:
+            self._fingerprints = FingerprintSet()
+        except ImportError:
+            pass
+
+    def close(self) -> None:
+        """Discard all values and delete the temporary database
+        """
+        if self._db is not None:
+            self._finalizer()
+        self._memory.clear()
+        self._len = 0
+        self._db = None
+        self._fingerprints = None
+
+    def clear(self) -> None:
+        """Remove all values and delete the temporary database
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate on the values, first those in memory, and then those that
+        were spilled to disk
+        """
+        yield from list(self._memory)
+        if self._db is not None:
+            for key, in self._db.execute('SELECT k FROM seen'):
+                yield _decode_key(key)
+
+    @property
+    def spilled(self) -> bool:
+        """True if values have been moved to disk
+        """
+        return self._db is not None
+
+    def __getstate__(self) -> dict:
+        """Pickle all the values, wherever they are stored
+        """
+        return {'max_size': self.max_size, 'directory': self.directory,
+                'values': list(self)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['max_size'], state['directory'])
+        for value in state['values']:
+            self.add(value)
+
+
+def _decode_key(key: Any) -> Any:
+    """Convert the representation of a value in the database of
+    :class:`SpillingSet` back to the value
+    """
+    if isinstance(key, bytes):
+        return pickle.loads(key)
+    return key
+
+
+def _close_db(db: sqlite3.Connection, path: str) -> None:
+    """Close and delete the temporary database of a :class:`SpillingSet`
+    """
+    db.close()
+    if path:
+        try:
+            os.remove(path)
+        except OSError:  # pragma: nocover
+            pass
+
+
+STORES = {
+    'set': set,
+    'fingerprint': FingerprintSet,
+    'disk': SpillingSet,
+}
+"""Named stores for the ``unique_store`` parameter of :class:`FuzzyField`
+"""
+
+
+def check_store(spec: Union[str, Callable[[], Any]]) -> None:
+    """Validate the ``unique_store`` parameter of :class:`FuzzyField`
+
+    :raises ValueError:
+        if spec is neither the name of a store nor a callable
+    """
+    if isinstance(spec, str) and spec in STORES:
+        return
+    if not isinstance(spec, str) and callable(spec):
+        return
+    raise ValueError("unique_store: expected 'set', 'fingerprint', 'disk' "
+                     f"or callable; got {spec!r}")
+
+
+def new_store(spec: Union[str, Callable[[], Any]]) -> Any:
+    """Create an empty store of seen values
+
+    :param spec:
+        'set', 'fingerprint', 'disk', or callable without arguments that
+        returns a new set-like object. See :class:`FuzzyField`.
+    """
+    check_store(spec)
+    if isinstance(spec, str):
+        return STORES[spec]()
+    return spec()
@@ -0,0 +1,2 @@
+version = '2.0.0+dev.3306e25'
+short_version = '2.0.0'
@@ -35,7 +35,10 @@ EXTRAS_REQUIRE = {
     'Timestamp': [
         'pandas >= 0.23',
         'numpy >= 1.11',
-    ]
+    ],
+    'Arrow': [
+        'pyarrow',
+    ],
 }
 TESTS_REQUIRE = ['pytest >= 3.6']
 